@@ -1,16 +1,27 @@
-from typing import Any, Protocol
+from dataclasses import dataclass
+from typing import Any, Optional, Protocol
 
+import torch
 from torch import Tensor
 from torch.nn import Conv1d as _Conv1d
-from torch.nn.functional import conv1d
 
-from elasticai.creator.base_modules.math_operations import Quantize
+from elasticai.creator.base_modules.math_operations import Convolution1d, Quantize
+from elasticai.creator.base_modules.quantized_parameter_cache import (
+    QuantizedParameterCache,
+)
 
 
-class MathOperations(Quantize, Protocol): ...
+class MathOperations(Quantize, Convolution1d, Protocol): ...
 
 
 class Conv1d(_Conv1d):
+    """1d convolution with all arithmetic done by `operations`.
+
+    Besides `forward`, that convolves complete signals, `stream` processes a
+    signal that arrives piece by piece. Only the trailing input columns, that
+    later outputs still depend on, are kept between calls.
+    """
+
     def __init__(
         self,
         operations: MathOperations,
@@ -39,14 +50,21 @@ class Conv1d(_Conv1d):
             dtype=dtype,
         )
         self._operations = operations
+        self._quantized_parameters = QuantizedParameterCache()
+        self._stream: Optional[_Stream] = None
+
+    def _quantized(self, name: str, parameter: Tensor) -> Tensor:
+        return self._quantized_parameters.get(
+            name, parameter, self._operations.quantize_parameter
+        )
 
     def forward(self, x: Tensor) -> Tensor:
-        quantized_weights = self._operations.quantize(self.weight)
+        quantized_weights = self._quantized("weight", self.weight)
         quantized_bias = (
-            self._operations.quantize(self.bias) if self.bias is not None else None
+            self._quantized("bias", self.bias) if self.bias is not None else None
         )
-        convolved = conv1d(
-            input=x,
+        return self._operations.conv1d(
+            x=x,
             weight=quantized_weights,
             bias=quantized_bias,
             stride=self.stride,
@@ -54,4 +72,70 @@ class Conv1d(_Conv1d):
             dilation=self.dilation,
             groups=self.groups,
         )
-        return self._operations.quantize(convolved)
+
+    def stream(self, x: Tensor) -> Tensor:
+        """Convolve the columns of `x` (shaped `([batch,] channels, length)`)
+        as continuation of the signal passed in the previous calls and return
+        only the new output columns.
+
+        Concatenating the outputs of all calls since `reset_stream` yields
+        `forward` of the concatenated inputs. An output column is emitted as
+        soon as its last input column arrives, so a call may return fewer
+        columns than it got, or none at all. The input columns still needed
+        are copied into a buffer, that is allocated once per stream.
+        """
+        if self.padding not in ((0,), "valid"):
+            raise ValueError("stream only supports unpadded convolutions.")
+        batched = x.dim() == 3
+        if not batched:
+            x = x[None]
+        stream = self._started_stream(x)
+        (stride,) = self.stride
+        span = self.dilation[0] * (self.kernel_size[0] - 1) + 1
+
+        if stream.columns_to_skip > 0:
+            skipped = min(stream.columns_to_skip, x.shape[-1])
+            stream.columns_to_skip -= skipped
+            x = x[..., skipped:]
+        if stream.buffered_columns > 0:
+            x = torch.cat((stream.buffer[..., : stream.buffered_columns], x), dim=-1)
+
+        num_outputs = max(0, (x.shape[-1] - span) // stride + 1)
+        if num_outputs > 0:
+            outputs = self(x)
+        else:
+            outputs = x.new_zeros(x.shape[0], self.out_channels, 0)
+
+        consumed = num_outputs * stride
+        stream.columns_to_skip += max(0, consumed - x.shape[-1])
+        stream.buffered_columns = max(0, x.shape[-1] - consumed)
+        if stream.buffered_columns > 0:
+            stream.buffer[..., : stream.buffered_columns].copy_(
+                x[..., consumed:].detach()
+            )
+        return outputs if batched else outputs[0]
+
+    def reset_stream(self) -> None:
+        self._stream = None
+
+    def _started_stream(self, x: Tensor) -> "_Stream":
+        span = self.dilation[0] * (self.kernel_size[0] - 1) + 1
+        shape = (x.shape[0], self.in_channels, span - 1)
+        if self._stream is None:
+            self._stream = _Stream(buffer=x.detach().new_empty(shape))
+        elif self._stream.buffer.shape != shape:
+            raise ValueError(
+                f"stream expects inputs with {shape[0]} samples like the previous"
+                " calls, call reset_stream to start a new stream."
+            )
+        return self._stream
+
+
+@dataclass
+class _Stream:
+    """State of `Conv1d.stream`, kept outside of the module's attributes, as
+    these are slow to update."""
+
+    buffer: Tensor
+    buffered_columns: int = 0
+    columns_to_skip: int = 0
@@ -0,0 +1,75 @@
+import torch
+
+from tests.tensor_test_case import TensorTestCase
+
+from .conv1d import Conv1d
+from .torch_math_operations import TorchMathOperations
+
+
+def create_conv1d(**kwargs) -> Conv1d:
+    arguments = dict(in_channels=2, out_channels=3, kernel_size=3) | kwargs
+    return Conv1d(operations=TorchMathOperations(), **arguments)
+
+
+class StreamingConv1dTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(42)
+        self.inputs = torch.randn(4, 2, 17)
+
+    def assertStreamEqualsForward(
+        self, conv: Conv1d, inputs: torch.Tensor, chunk_sizes: list[int]
+    ) -> None:
+        expected = conv(inputs)
+        conv.reset_stream()
+        chunks = [conv.stream(chunk) for chunk in inputs.split(chunk_sizes, dim=-1)]
+        actual = torch.cat(chunks, dim=-1)
+        self.assertEqual(expected.shape, actual.shape)
+        self.assertTrue(torch.allclose(expected, actual, atol=1e-6))
+
+    def test_single_samples(self) -> None:
+        self.assertStreamEqualsForward(create_conv1d(), self.inputs, [1] * 17)
+
+    def test_chunks(self) -> None:
+        self.assertStreamEqualsForward(create_conv1d(), self.inputs, [2, 6, 1, 8])
+
+    def test_stride_and_dilation(self) -> None:
+        conv = create_conv1d(stride=2, dilation=3)
+        self.assertStreamEqualsForward(conv, self.inputs, [1, 4, 5, 7])
+
+    def test_stride_larger_than_kernel(self) -> None:
+        conv = create_conv1d(stride=5, kernel_size=2)
+        self.assertStreamEqualsForward(conv, self.inputs, [1] * 17)
+
+    def test_unbatched_inputs(self) -> None:
+        self.assertStreamEqualsForward(create_conv1d(), self.inputs[0], [3, 14])
+
+    def test_emits_nothing_until_the_kernel_is_filled(self) -> None:
+        conv = create_conv1d()
+        self.assertEqual((4, 3, 0), tuple(conv.stream(self.inputs[..., :2]).shape))
+        self.assertEqual((4, 3, 1), tuple(conv.stream(self.inputs[..., 2:3]).shape))
+
+    def test_reset_starts_a_new_stream(self) -> None:
+        conv = create_conv1d()
+        conv.stream(self.inputs[..., :5])
+        conv.reset_stream()
+        self.assertTensorEqual(
+            conv(self.inputs[..., 5:8]), conv.stream(self.inputs[..., 5:8])
+        )
+
+    def test_batch_size_must_not_change_within_a_stream(self) -> None:
+        conv = create_conv1d()
+        conv.stream(self.inputs)
+        with self.assertRaises(ValueError):
+            conv.stream(self.inputs[:2])
+
+    def test_padded_convolutions_cannot_stream(self) -> None:
+        conv = create_conv1d(padding=1)
+        with self.assertRaises(ValueError):
+            conv.stream(self.inputs)
+
+    def test_buffered_columns_are_detached_from_previous_calls(self) -> None:
+        conv = create_conv1d()
+        inputs = self.inputs.clone().requires_grad_()
+        conv.stream(inputs[..., :8]).sum().backward()
+        conv.stream(inputs[..., 8:]).sum().backward()
+        self.assertIsNotNone(inputs.grad)
@@ -0,0 +1,76 @@
+from collections.abc import Callable
+from typing import Optional, Protocol, cast
+
+import torch
+
+from .gru_cell import GRUCell
+
+
+class LayerFactory(Protocol):
+    def gru(self, input_size: int, hidden_size: int, bias: bool) -> GRUCell: ...
+
+
+class GRU(torch.nn.Module):
+    """Runs the cell created by `layers` over all time steps.
+
+    Inputs and states are shaped like for `torch.nn.GRU` with a single
+    layer, the state is the hidden state only.
+    """
+
+    def __init__(
+        self,
+        input_size: int,
+        hidden_size: int,
+        bias: bool,
+        batch_first: bool,
+        layers: LayerFactory,
+    ) -> None:
+        super().__init__()
+        self.cell = layers.gru(
+            input_size=input_size, hidden_size=hidden_size, bias=bias
+        )
+        self.batch_first = batch_first
+
+    @property
+    def hidden_size(self) -> int:
+        return self.cell.hidden_size
+
+    @property
+    def input_size(self) -> int:
+        return self.cell.input_size
+
+    def forward(
+        self, x: torch.Tensor, state: Optional[torch.Tensor] = None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        batched = x.dim() == 3
+        time_dim = 1 if batched and self.batch_first else 0
+
+        if state is not None:
+            state = state.squeeze(0)
+
+        step, x = self._step_and_inputs(x)
+        outputs = []
+        for x_t in torch.unbind(x, dim=time_dim):
+            state = step(x_t, state)
+            outputs.append(state)
+
+        if state is None:
+            raise RuntimeError("Number of samples must be larger than 0.")
+        return torch.stack(outputs, dim=time_dim), state.unsqueeze(0)
+
+    def _step_and_inputs(
+        self, x: torch.Tensor
+    ) -> tuple[Callable[..., torch.Tensor], torch.Tensor]:
+        if self._can_hoist_input_projection():
+            cell = cast(GRUCell, self.cell)
+            return cell.recurrent_step, cell.project_input(x)
+        return self.cell, x
+
+    def _can_hoist_input_projection(self) -> bool:
+        """The input projection of all time steps can be computed up front as long
+        as the cell uses the unmodified `GRUCell.forward`.
+        """
+        return (
+            isinstance(self.cell, GRUCell)
+            and type(self.cell).forward is GRUCell.forward
+        )
@@ -0,0 +1,88 @@
+from collections.abc import Callable
+from typing import Any, Optional, Protocol
+
+import torch
+
+from .linear import Linear
+from .math_operations import Add, MatMul, Mul, Quantize
+
+
+class MathOperations(Quantize, Add, MatMul, Mul, Protocol): ...
+
+
+class GRUCell(torch.nn.Module):
+    """GRU cell computing all gates with `operations`.
+
+    The gates are ordered like for `torch.nn.GRUCell`, i.e., reset, update
+    and new gate. Compared to the `LSTMCell` there is one gate less and no
+    cell state, so a step needs three quarters of the weights and
+    multiplications. The new hidden state is computed as `n + z * (h - n)`,
+    which equals `(1 - z) * n + z * h`, but takes a single multiplication.
+    """
+
+    def __init__(
+        self,
+        input_size: int,
+        hidden_size: int,
+        bias: bool,
+        operations: MathOperations,
+        sigmoid_factory: Callable[[], torch.nn.Module],
+        tanh_factory: Callable[[], torch.nn.Module],
+        device: Any = None,
+    ) -> None:
+        super().__init__()
+        self.input_size = input_size
+        self.hidden_size = hidden_size
+        self.bias = bias
+        self._operations = operations
+
+        self.linear_ih = Linear(
+            in_features=input_size,
+            out_features=hidden_size * 3,
+            bias=bias,
+            operations=operations,
+            device=device,
+        )
+        self.linear_hh = Linear(
+            in_features=hidden_size,
+            out_features=hidden_size * 3,
+            bias=bias,
+            operations=operations,
+            device=device,
+        )
+        self.sigmoid = sigmoid_factory()
+        self.tanh = tanh_factory()
+
+    def _initialize_previous_state(
+        self, x: torch.Tensor, state: Optional[torch.Tensor]
+    ) -> torch.Tensor:
+        if state is None:
+            return torch.zeros(*(*x.shape[:-1], self.hidden_size), dtype=x.dtype)
+        return state
+
+    def forward(
+        self, x: torch.Tensor, state: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
+        return self.recurrent_step(self.project_input(x), state)
+
+    def project_input(self, x: torch.Tensor) -> torch.Tensor:
+        """Input-to-hidden part of the gates; `x` may hold any number of steps."""
+        return self.linear_ih(x)
+
+    def recurrent_step(
+        self, projected_x: torch.Tensor, state: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
+        """Remainder of `forward` for an input already passed through `project_input`."""
+        h_prev = self._initialize_previous_state(projected_x, state)
+        pred_ir, pred_iz, pred_in = torch.split(projected_x, self.hidden_size, dim=-1)
+        pred_hr, pred_hz, pred_hn = torch.split(
+            self.linear_hh(h_prev), self.hidden_size, dim=-1
+        )
+
+        r = self.sigmoid(self._operations.add(pred_ir, pred_hr))
+        z = self.sigmoid(self._operations.add(pred_iz, pred_hz))
+        n = self.tanh(self._operations.add(pred_in, self._operations.mul(r, pred_hn)))
+
+        return self._operations.add(
+            n, self._operations.mul(z, self._operations.add(h_prev, -n))
+        )
@@ -0,0 +1,79 @@
+import torch
+
+from tests.tensor_test_case import TensorTestCase
+
+from .gru_cell import GRUCell
+from .torch_math_operations import TorchMathOperations
+
+
+def create_gru_cell_and_reference(
+    input_size: int, hidden_size: int, bias: bool
+) -> tuple[GRUCell, torch.nn.GRUCell]:
+    cell = GRUCell(
+        input_size=input_size,
+        hidden_size=hidden_size,
+        bias=bias,
+        sigmoid_factory=torch.nn.Sigmoid,
+        tanh_factory=torch.nn.Tanh,
+        operations=TorchMathOperations(),
+    )
+    reference_cell = torch.nn.GRUCell(
+        input_size=input_size, hidden_size=hidden_size, bias=bias
+    )
+    cell.linear_ih.weight = reference_cell.weight_ih
+    cell.linear_hh.weight = reference_cell.weight_hh
+    if bias:
+        cell.linear_ih.bias = reference_cell.bias_ih
+        cell.linear_hh.bias = reference_cell.bias_hh
+    return cell, reference_cell
+
+
+class ZeroActivation(torch.nn.Module):
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return torch.zeros_like(x)
+
+
+class GRUCellTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(42)
+
+    def assertCellEqualsReference(
+        self,
+        bias: bool,
+        inputs: torch.Tensor,
+        state: torch.Tensor | None = None,
+    ) -> None:
+        cell, reference_cell = create_gru_cell_and_reference(
+            input_size=inputs.shape[-1], hidden_size=2, bias=bias
+        )
+        actual = cell(inputs, state)
+        expected = reference_cell(inputs, state)
+        self.assertEqual(expected.shape, actual.shape)
+        self.assertTrue(torch.allclose(expected, actual, atol=1e-6))
+
+    def test_gru_cell_equals_torch_gru_cell(self) -> None:
+        self.assertCellEqualsReference(bias=True, inputs=torch.randn(4, 3))
+
+    def test_gru_cell_without_bias_equals_torch_gru_cell(self) -> None:
+        self.assertCellEqualsReference(bias=False, inputs=torch.randn(4, 3))
+
+    def test_gru_cell_with_state_equals_torch_gru_cell(self) -> None:
+        self.assertCellEqualsReference(
+            bias=True, inputs=torch.randn(4, 3), state=torch.randn(4, 2)
+        )
+
+    def test_gru_cell_without_batched_inputs_equals_torch_gru_cell(self) -> None:
+        self.assertCellEqualsReference(bias=True, inputs=torch.randn(3))
+
+    def test_zero_update_gate_yields_new_gate(self) -> None:
+        cell = GRUCell(
+            input_size=1,
+            hidden_size=2,
+            bias=False,
+            operations=TorchMathOperations(),
+            sigmoid_factory=ZeroActivation,
+            tanh_factory=torch.nn.Tanh,
+        )
+        inputs = torch.randn(3, 1)
+        expected = torch.tanh(cell.project_input(inputs)[:, 4:])
+        self.assertTensorEqual(expected, cell(inputs, torch.ones(3, 2)))
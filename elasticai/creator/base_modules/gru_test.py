@@ -0,0 +1,108 @@
+from typing import Optional
+
+import torch
+
+from tests.tensor_test_case import TensorTestCase
+
+from .gru import GRU
+from .gru_cell import GRUCell
+from .torch_math_operations import TorchMathOperations
+
+
+class Layers:
+    def gru(self, input_size: int, hidden_size: int, bias: bool) -> GRUCell:
+        return GRUCell(
+            input_size=input_size,
+            hidden_size=hidden_size,
+            bias=bias,
+            operations=TorchMathOperations(),
+            sigmoid_factory=torch.nn.Sigmoid,
+            tanh_factory=torch.nn.Tanh,
+        )
+
+
+class UnhoistedGRUCell(GRUCell):
+    def forward(
+        self, x: torch.Tensor, state: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
+        return super().forward(x, state)
+
+
+def create_gru(batch_first: bool, bias: bool = True) -> tuple[GRU, torch.nn.GRU]:
+    gru = GRU(
+        input_size=3, hidden_size=2, bias=bias, batch_first=batch_first, layers=Layers()
+    )
+    reference_gru = torch.nn.GRU(
+        input_size=3, hidden_size=2, bias=bias, batch_first=batch_first
+    )
+    gru.cell.linear_ih.weight = reference_gru.weight_ih_l0
+    gru.cell.linear_hh.weight = reference_gru.weight_hh_l0
+    if bias:
+        gru.cell.linear_ih.bias = reference_gru.bias_ih_l0
+        gru.cell.linear_hh.bias = reference_gru.bias_hh_l0
+    return gru, reference_gru
+
+
+class GRUTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(42)
+
+    def assertGRUOutputsEqual(
+        self,
+        gru: torch.nn.Module,
+        reference_gru: torch.nn.Module,
+        inputs: torch.Tensor,
+        state: Optional[torch.Tensor] = None,
+    ) -> None:
+        actual_outputs, actual_h = gru(inputs, state)
+        expected_outputs, expected_h = reference_gru(inputs, state)
+        self.assertEqual(expected_outputs.shape, actual_outputs.shape)
+        self.assertEqual(expected_h.shape, actual_h.shape)
+        self.assertTrue(torch.allclose(expected_outputs, actual_outputs, atol=1e-6))
+        self.assertTrue(torch.allclose(expected_h, actual_h, atol=1e-6))
+
+    def test_batch_first_equals_torch_gru(self) -> None:
+        gru, reference_gru = create_gru(batch_first=True)
+        self.assertGRUOutputsEqual(gru, reference_gru, torch.randn(4, 5, 3))
+
+    def test_time_first_equals_torch_gru(self) -> None:
+        gru, reference_gru = create_gru(batch_first=False)
+        self.assertGRUOutputsEqual(gru, reference_gru, torch.randn(5, 4, 3))
+
+    def test_without_bias_equals_torch_gru(self) -> None:
+        gru, reference_gru = create_gru(batch_first=True, bias=False)
+        self.assertGRUOutputsEqual(gru, reference_gru, torch.randn(4, 5, 3))
+
+    def test_initial_state_equals_torch_gru(self) -> None:
+        gru, reference_gru = create_gru(batch_first=True)
+        self.assertGRUOutputsEqual(
+            gru, reference_gru, torch.randn(4, 5, 3), torch.randn(1, 4, 2)
+        )
+
+    def test_unbatched_inputs_equal_torch_gru(self) -> None:
+        gru, reference_gru = create_gru(batch_first=True)
+        self.assertGRUOutputsEqual(gru, reference_gru, torch.randn(5, 3))
+
+    def test_cells_with_own_forward_are_called_per_step(self) -> None:
+        class UnhoistedLayers(Layers):
+            def gru(self, input_size: int, hidden_size: int, bias: bool) -> GRUCell:
+                return UnhoistedGRUCell(
+                    input_size=input_size,
+                    hidden_size=hidden_size,
+                    bias=bias,
+                    operations=TorchMathOperations(),
+                    sigmoid_factory=torch.nn.Sigmoid,
+                    tanh_factory=torch.nn.Tanh,
+                )
+
+        gru, _ = create_gru(batch_first=True)
+        unhoisted = GRU(
+            input_size=3,
+            hidden_size=2,
+            bias=True,
+            batch_first=True,
+            layers=UnhoistedLayers(),
+        )
+        unhoisted.load_state_dict(gru.state_dict())
+        inputs = torch.randn(4, 5, 3)
+        self.assertTrue(torch.allclose(gru(inputs)[0], unhoisted(inputs)[0]))
@@ -2,7 +2,15 @@ from typing import Any, Protocol
 
 import torch
 
-from elasticai.creator.base_modules.math_operations import Add, MatMul, Quantize
+from elasticai.creator.base_modules.math_operations import (
+    Add,
+    LinearTransform,
+    MatMul,
+    Quantize,
+)
+from elasticai.creator.base_modules.quantized_parameter_cache import (
+    QuantizedParameterCache,
+)
 
 
 class MathOperations(Quantize, Add, MatMul, Protocol): ...
@@ -20,12 +28,22 @@ class Linear(torch.nn.Linear):
     ) -> None:
         super().__init__(in_features, out_features, bias, device, dtype)
         self._operations = operations
+        self._quantized_parameters = QuantizedParameterCache()
+
+    def _quantized(self, name: str, parameter: torch.Tensor) -> torch.Tensor:
+        return self._quantized_parameters.get(
+            name, parameter, self._operations.quantize_parameter
+        )
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        weight = self._operations.quantize(self.weight)
+        weight = self._quantized("weight", self.weight)
+
+        if isinstance(self._operations, LinearTransform):
+            bias = None if self.bias is None else self._quantized("bias", self.bias)
+            return self._operations.linear(x, weight, bias)
 
         if self.bias is not None:
-            bias = self._operations.quantize(self.bias)
+            bias = self._quantized("bias", self.bias)
             return self._operations.add(self._operations.matmul(x, weight.T), bias)
 
         return self._operations.matmul(x, weight.T)
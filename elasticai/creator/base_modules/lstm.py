@@ -1,8 +1,16 @@
-from typing import Optional, Protocol
+from collections.abc import Callable, Sequence
+from typing import Optional, Protocol, Union, cast
 
 import torch
+from torch.nn.utils.rnn import (
+    PackedSequence,
+    pack_padded_sequence,
+    pad_packed_sequence,
+)
+from torch.utils.checkpoint import checkpoint
 
 from .lstm_cell import LSTMCell
+from .math_operations import LSTMCellStep
 
 
 class LayerFactory(Protocol):
@@ -10,6 +18,20 @@ class LayerFactory(Protocol):
 
 
 class LSTM(torch.nn.Module):
+    """Runs the cell created by `layers` over all time steps.
+
+    With `checkpoint_every` set to `k`, training keeps the intermediate
+    results of only `k` consecutive steps at a time. The sequence is split
+    into segments of `k` steps, of which only the state at the start is kept
+    during the forward pass. The backward pass evaluates each segment again.
+    As for `LSTMCell` with `fused` set, the cell must not draw random numbers.
+
+    Sequences of different lengths are passed either as a `PackedSequence`,
+    or padded together with their `lengths`. Each step then only computes
+    the rows of the sequences that have not ended yet, and the final state
+    of each sequence is the one after its last step.
+    """
+
     def __init__(
         self,
         input_size: int,
@@ -17,12 +39,18 @@ class LSTM(torch.nn.Module):
         bias: bool,
         batch_first: bool,
         layers: LayerFactory,
+        checkpoint_every: Optional[int] = None,
     ) -> None:
         super().__init__()
+        if checkpoint_every is not None and checkpoint_every < 1:
+            raise ValueError(
+                f"checkpoint_every must be positive, but is {checkpoint_every}"
+            )
         self.cell = layers.lstm(
             input_size=input_size, hidden_size=hidden_size, bias=bias
         )
         self.batch_first = batch_first
+        self.checkpoint_every = checkpoint_every
 
     @property
     def hidden_size(self) -> int:
@@ -34,29 +62,201 @@ class LSTM(torch.nn.Module):
 
     def forward(
         self,
-        x: torch.Tensor,
+        x: Union[torch.Tensor, PackedSequence],
         state: Optional[tuple[torch.Tensor, torch.Tensor]] = None,
-    ) -> tuple[torch.Tensor, tuple[torch.Tensor, torch.Tensor]]:
+        lengths: Optional[torch.Tensor] = None,
+    ) -> tuple[Union[torch.Tensor, PackedSequence], tuple[torch.Tensor, torch.Tensor]]:
+        if isinstance(x, PackedSequence):
+            return self._forward_packed(x, state)
+        if lengths is not None:
+            return self._forward_padded(x, state, lengths)
+
         batched = x.dim() == 3
+        time_dim = 1 if batched and self.batch_first else 0
+
+        if state is not None:
+            state = state[0].squeeze(0), state[1].squeeze(0)
+
+        step, x = self._step_and_inputs(x)
+        inputs = torch.unbind(x, dim=time_dim)
+
+        if self._checkpoints():
+            result, state = self._run_checkpointed(step, inputs, state, time_dim)
+        else:
+            result, state = self._run(step, inputs, state, time_dim)
+
+        # TODO: check whether unsqueeze dimension is actually consistent with self.batch_first being true or false
+        hidden_state, cell_state = state[0].unsqueeze(0), state[1].unsqueeze(0)
+        return result, (hidden_state, cell_state)
 
-        if batched and self.batch_first:
-            x = torch.stack(torch.unbind(x), dim=1)
+    def _forward_padded(
+        self,
+        x: torch.Tensor,
+        state: Optional[tuple[torch.Tensor, torch.Tensor]],
+        lengths: torch.Tensor,
+    ) -> tuple[torch.Tensor, tuple[torch.Tensor, torch.Tensor]]:
+        """Outputs past the end of a sequence are zero."""
+        if x.dim() != 3:
+            raise ValueError("lengths are only supported for batched inputs.")
+        packed = pack_padded_sequence(
+            x, lengths.cpu(), batch_first=self.batch_first, enforce_sorted=False
+        )
+        outputs, state = self._forward_packed(packed, state)
+        result, _ = pad_packed_sequence(
+            outputs,
+            batch_first=self.batch_first,
+            total_length=x.shape[1 if self.batch_first else 0],
+        )
+        return result, state
 
+    def _forward_packed(
+        self, x: PackedSequence, state: Optional[tuple[torch.Tensor, torch.Tensor]]
+    ) -> tuple[PackedSequence, tuple[torch.Tensor, torch.Tensor]]:
+        """The rows of the packed data belonging to one step are ordered by
+        decreasing sequence length, so the sequences still running are always
+        the first rows of the state. Rows are dropped from the state as their
+        sequences end and put back together afterwards."""
+        data, batch_sizes, sorted_indices, unsorted_indices = x
         if state is not None:
             state = state[0].squeeze(0), state[1].squeeze(0)
+            if sorted_indices is not None:
+                state = (
+                    state[0].index_select(0, sorted_indices),
+                    state[1].index_select(0, sorted_indices),
+                )
 
-        inputs = torch.unbind(x, dim=0)
+        step, data = self._step_and_inputs(data)
+        inputs = torch.split(data, batch_sizes.tolist())
 
-        outputs = []
+        if self._checkpoints():
+            result, state, ended = self._run_packed_checkpointed(step, inputs, state)
+        else:
+            result, state, ended = self._run_packed(step, inputs, state)
+
+        hidden_state = torch.cat([state[0], *(h for h, _ in reversed(ended))])
+        cell_state = torch.cat([state[1], *(c for _, c in reversed(ended))])
+        if unsorted_indices is not None:
+            hidden_state = hidden_state.index_select(0, unsorted_indices)
+            cell_state = cell_state.index_select(0, unsorted_indices)
+        outputs = PackedSequence(result, batch_sizes, sorted_indices, unsorted_indices)
+        return outputs, (hidden_state.unsqueeze(0), cell_state.unsqueeze(0))
+
+    def _step_and_inputs(
+        self, x: torch.Tensor
+    ) -> tuple[Callable[..., tuple[torch.Tensor, torch.Tensor]], torch.Tensor]:
+        if self._can_hoist_input_projection():
+            cell = cast(LSTMCell, self.cell)
+            return cell.recurrent_step, cell.project_input(x)
+        return self.cell, x
+
+    def _checkpoints(self) -> bool:
+        return self.checkpoint_every is not None and torch.is_grad_enabled()
+
+    def _run(
+        self,
+        step: Callable[..., tuple[torch.Tensor, torch.Tensor]],
+        inputs: Sequence[torch.Tensor],
+        state: Optional[tuple[torch.Tensor, torch.Tensor]],
+        time_dim: int,
+    ) -> tuple[torch.Tensor, tuple[torch.Tensor, torch.Tensor]]:
+        result: Optional[torch.Tensor] = None
         for i in range(len(inputs)):
-            hidden_state, cell_state = self.cell(inputs[i], state)
+            hidden_state, cell_state = step(inputs[i], state)
             state = (hidden_state, cell_state)
-            outputs.append(hidden_state)
+            if result is None:
+                result = self._allocate_outputs(hidden_state, len(inputs), time_dim)
+            result.select(time_dim, i).copy_(hidden_state)
 
+        if state is None or result is None:
+            raise RuntimeError("Number of samples must be larger than 0.")
+        return result, state
+
+    def _run_checkpointed(
+        self,
+        step: Callable[..., tuple[torch.Tensor, torch.Tensor]],
+        inputs: Sequence[torch.Tensor],
+        state: Optional[tuple[torch.Tensor, torch.Tensor]],
+        time_dim: int,
+    ) -> tuple[torch.Tensor, tuple[torch.Tensor, torch.Tensor]]:
+        segments = []
+        for segment in self._segments(inputs):
+            outputs, state = checkpoint(
+                self._run, step, segment, state, time_dim, use_reentrant=False
+            )
+            segments.append(outputs)
         if state is None:
             raise RuntimeError("Number of samples must be larger than 0.")
+        return torch.cat(segments, dim=time_dim), state
 
-        result = torch.stack(outputs, dim=1 if batched and self.batch_first else 0)
-        # TODO: check whether unsqueeze dimension is actually consistent with self.batch_first being true or false
-        hidden_state, cell_state = state[0].unsqueeze(0), state[1].unsqueeze(0)
-        return result, (hidden_state, cell_state)
+    def _run_packed(
+        self,
+        step: Callable[..., tuple[torch.Tensor, torch.Tensor]],
+        inputs: Sequence[torch.Tensor],
+        state: Optional[tuple[torch.Tensor, torch.Tensor]],
+    ) -> tuple[
+        torch.Tensor,
+        tuple[torch.Tensor, torch.Tensor],
+        list[tuple[torch.Tensor, torch.Tensor]],
+    ]:
+        """Also returns the states of the sequences that ended, in the order
+        they ended."""
+        outputs = []
+        ended = []
+        for x in inputs:
+            running = x.shape[0]
+            if state is not None and state[0].shape[0] > running:
+                ended.append((state[0][running:], state[1][running:]))
+                state = (state[0][:running], state[1][:running])
+            state = step(x, state)
+            outputs.append(state[0])
+
+        if state is None:
+            raise RuntimeError("Number of samples must be larger than 0.")
+        return torch.cat(outputs), state, ended
+
+    def _run_packed_checkpointed(
+        self,
+        step: Callable[..., tuple[torch.Tensor, torch.Tensor]],
+        inputs: Sequence[torch.Tensor],
+        state: Optional[tuple[torch.Tensor, torch.Tensor]],
+    ) -> tuple[
+        torch.Tensor,
+        tuple[torch.Tensor, torch.Tensor],
+        list[tuple[torch.Tensor, torch.Tensor]],
+    ]:
+        segments = []
+        ended = []
+        for segment in self._segments(inputs):
+            outputs, state, ended_in_segment = checkpoint(
+                self._run_packed, step, segment, state, use_reentrant=False
+            )
+            segments.append(outputs)
+            ended.extend(ended_in_segment)
+        if state is None:
+            raise RuntimeError("Number of samples must be larger than 0.")
+        return torch.cat(segments), state, ended
+
+    def _segments(self, inputs: Sequence[torch.Tensor]) -> list[Sequence[torch.Tensor]]:
+        length = cast(int, self.checkpoint_every)
+        return [
+            inputs[start : start + length] for start in range(0, len(inputs), length)
+        ]
+
+    def _can_hoist_input_projection(self) -> bool:
+        """The input projection of all time steps can be computed up front as long
+        as the cell uses the unmodified `LSTMCell.forward` and its operations
+        do not compute the step at once.
+        """
+        return (
+            isinstance(self.cell, LSTMCell)
+            and type(self.cell).forward is LSTMCell.forward
+            and not isinstance(self.cell._operations, LSTMCellStep)
+        )
+
+    @staticmethod
+    def _allocate_outputs(
+        hidden_state: torch.Tensor, sequence_length: int, time_dim: int
+    ) -> torch.Tensor:
+        shape = list(hidden_state.shape)
+        shape.insert(time_dim, sequence_length)
+        return hidden_state.new_empty(shape)
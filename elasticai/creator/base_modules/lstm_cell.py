@@ -3,14 +3,32 @@ from typing import Any, Optional, Protocol
 
 import torch
 
+try:
+    from torch.func import functional_call
+except ImportError:  # torch < 2.0
+    from torch.nn.utils.stateless import functional_call
+
 from .linear import Linear
-from .math_operations import Add, MatMul, Mul, Quantize
+from .math_operations import Add, LSTMCellStep, MatMul, Mul, Quantize
 
 
 class MathOperations(Quantize, Add, MatMul, Mul, Protocol): ...
 
 
 class LSTMCell(torch.nn.Module):
+    """LSTM cell computing all gates with `operations`.
+
+    With `fused` set, each recurrent step during training is a single
+    autograd node, that keeps only the inputs of the step and evaluates the
+    step once more in the backward pass. This trades about one additional
+    forward pass for the intermediate results of all operations, that would
+    be kept otherwise. The recomputation has to yield the same results, i.e.,
+    `operations` and the activations must not draw random numbers.
+
+    Operations that provide `lstm_cell` compute the whole step, the
+    activations created by the factories are not used then.
+    """
+
     def __init__(
         self,
         input_size: int,
@@ -20,11 +38,13 @@ class LSTMCell(torch.nn.Module):
         sigmoid_factory: Callable[[], torch.nn.Module],
         tanh_factory: Callable[[], torch.nn.Module],
         device: Any = None,
+        fused: bool = False,
     ) -> None:
         super().__init__()
         self.input_size = input_size
         self.hidden_size = hidden_size
         self.bias = bias
+        self.fused = fused
         self._operations = operations
 
         self.linear_ih = Linear(
@@ -55,10 +75,43 @@ class LSTMCell(torch.nn.Module):
     def forward(
         self, x: torch.Tensor, state: Optional[tuple[torch.Tensor, torch.Tensor]] = None
     ) -> tuple[torch.Tensor, torch.Tensor]:
-        h_prev, c_prev = self._initialize_previous_state(x, state)
+        if isinstance(self._operations, LSTMCellStep):
+            return self._operations.lstm_cell(
+                x,
+                state,
+                self.linear_ih._quantized("weight", self.linear_ih.weight),
+                self.linear_hh._quantized("weight", self.linear_hh.weight),
+                self._quantized_bias(self.linear_ih),
+                self._quantized_bias(self.linear_hh),
+            )
+        return self.recurrent_step(self.project_input(x), state)
+
+    @staticmethod
+    def _quantized_bias(linear: Linear) -> Optional[torch.Tensor]:
+        return None if linear.bias is None else linear._quantized("bias", linear.bias)
+
+    def project_input(self, x: torch.Tensor) -> torch.Tensor:
+        """Input-to-hidden part of the gates; `x` may hold any number of steps."""
+        return self.linear_ih(x)
+
+    def recurrent_step(
+        self,
+        projected_x: torch.Tensor,
+        state: Optional[tuple[torch.Tensor, torch.Tensor]] = None,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Remainder of `forward` for an input already passed through `project_input`."""
+        h_prev, c_prev = self._initialize_previous_state(projected_x, state)
+        if self.fused and torch.is_grad_enabled():
+            return _FusedRecurrentStep.apply(
+                self, projected_x, h_prev, c_prev, *self.parameters()
+            )
+        return self._step(projected_x, h_prev, c_prev)
 
+    def _step(
+        self, projected_x: torch.Tensor, h_prev: torch.Tensor, c_prev: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor]:
         pred_ii, pred_if, pred_ig, pred_io = torch.split(
-            self.linear_ih(x), self.hidden_size, dim=-1
+            projected_x, self.hidden_size, dim=-1
         )
         pred_hi, pred_hf, pred_hg, pred_ho = torch.split(
             self.linear_hh(h_prev), self.hidden_size, dim=-1
@@ -75,3 +128,58 @@ class LSTMCell(torch.nn.Module):
         h = self._operations.mul(o, self.tanh(c))
 
         return h, c
+
+
+class _Step(torch.nn.Module):
+    """Makes `LSTMCell._step` the `forward` of a module, so that it can be
+    evaluated by `functional_call`."""
+
+    def __init__(self, cell: LSTMCell) -> None:
+        super().__init__()
+        self.cell = cell
+
+    def forward(
+        self, projected_x: torch.Tensor, h_prev: torch.Tensor, c_prev: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        return self.cell._step(projected_x, h_prev, c_prev)
+
+
+class _FusedRecurrentStep(torch.autograd.Function):
+    """`LSTMCell._step` as a single autograd node.
+
+    Call as `apply(cell, projected_x, h_prev, c_prev, *cell.parameters())`.
+    The backward pass evaluates the step again with autograd enabled. It
+    differentiates with respect to detached copies of the parameters, so that
+    hooks registered on the parameters only see the gradient summed over all
+    steps, like they do without fusing.
+    """
+
+    @staticmethod
+    def forward(ctx: Any, *args: Any, **kwargs: Any) -> tuple[torch.Tensor, ...]:
+        cell: LSTMCell = args[0]
+        tensors: tuple[torch.Tensor, ...] = args[1:]
+        ctx.cell = cell
+        ctx.save_for_backward(*tensors)
+        with torch.no_grad():
+            return cell._step(*tensors[:3])
+
+    @staticmethod
+    def backward(ctx: Any, *grad_outputs: Any) -> Any:
+        tensors = [
+            tensor.detach().requires_grad_(needs_grad)
+            for tensor, needs_grad in zip(ctx.saved_tensors, ctx.needs_input_grad[1:])
+        ]
+        names = [f"cell.{name}" for name, _ in ctx.cell.named_parameters()]
+        with torch.enable_grad():
+            outputs = functional_call(
+                _Step(ctx.cell), dict(zip(names, tensors[3:])), tuple(tensors[:3])
+            )
+        differentiable = [tensor for tensor in tensors if tensor.requires_grad]
+        grads = iter(
+            torch.autograd.grad(
+                outputs, differentiable, grad_outputs, allow_unused=True
+            )
+        )
+        return None, *(
+            next(grads) if tensor.requires_grad else None for tensor in tensors
+        )
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import torch
@@ -164,3 +165,81 @@ class LSTMCellTest(TensorTestCase):
 
         self.assertTensorEqual(h, [[0.0, 0.0]])
         self.assertTensorEqual(c, [[0.0, 0.0]])
+
+
+def number_of_saved_tensors(function: Callable[[], object]) -> int:
+    saved = []
+
+    def pack(x: torch.Tensor) -> torch.Tensor:
+        saved.append(x)
+        return x
+
+    with torch.autograd.graph.saved_tensors_hooks(pack, lambda x: x):
+        function()
+    return len(saved)
+
+
+class FusedLSTMCellTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(42)
+
+    def create_cells(self) -> tuple[LSTMCell, LSTMCell]:
+        def create(fused: bool) -> LSTMCell:
+            return LSTMCell(
+                input_size=3,
+                hidden_size=2,
+                bias=True,
+                operations=TorchMathOperations(),
+                sigmoid_factory=torch.nn.Sigmoid,
+                tanh_factory=torch.nn.Tanh,
+                fused=fused,
+            )
+
+        cell = create(fused=False)
+        fused_cell = create(fused=True)
+        fused_cell.load_state_dict(cell.state_dict())
+        return cell, fused_cell
+
+    def run_steps(
+        self, cell: LSTMCell, inputs: torch.Tensor
+    ) -> tuple[torch.Tensor, list[torch.Tensor]]:
+        state = None
+        outputs = []
+        for x in inputs:
+            state = cell(x, state)
+            outputs.append(state[0])
+        assert state is not None
+        loss = torch.stack(outputs).sum() + 2 * state[1].sum()
+        loss.backward()
+        return loss.detach(), [p.grad for p in cell.parameters()]
+
+    def test_fused_cell_yields_same_results_and_gradients(self) -> None:
+        cell, fused_cell = self.create_cells()
+        inputs = torch.randn(5, 4, 3)
+        fused_inputs = inputs.clone().requires_grad_()
+        inputs.requires_grad_()
+
+        loss, grads = self.run_steps(cell, inputs)
+        fused_loss, fused_grads = self.run_steps(fused_cell, fused_inputs)
+
+        self.assertTensorEqual(loss, fused_loss)
+        self.assertTensorEqual(inputs.grad, fused_inputs.grad)
+        for expected, actual in zip(grads, fused_grads):
+            self.assertTensorEqual(expected, actual)
+
+    def test_parameter_hooks_see_gradient_summed_over_steps(self) -> None:
+        _, fused_cell = self.create_cells()
+        calls = []
+        fused_cell.linear_hh.weight.register_hook(calls.append)
+
+        self.run_steps(fused_cell, torch.randn(5, 4, 3))
+
+        self.assertEqual(1, len(calls))
+
+    def test_fused_cell_saves_fewer_tensors(self) -> None:
+        cell, fused_cell = self.create_cells()
+        inputs = torch.randn(4, 3)
+        saved = number_of_saved_tensors(lambda: cell(inputs))
+        saved_fused = number_of_saved_tensors(lambda: fused_cell(inputs))
+
+        self.assertLess(saved_fused, saved)
@@ -2,6 +2,7 @@ from functools import partial
 from typing import Any, Optional, cast
 
 import torch
+from torch.nn.utils.rnn import PackedSequence, pack_padded_sequence
 
 from tests.tensor_test_case import TensorTestCase
 
@@ -136,3 +137,275 @@ class LSTMTest(TensorTestCase):
         self.assertTensorEqual(expected_output, actual_output)
         self.assertTensorEqual(expected_h, actual_h)
         self.assertTensorEqual(expected_c, actual_c)
+
+
+class GridOperations(TorchMathOperations):
+    """Rounds every result to multiples of 1/16, like fixed point arithmetic."""
+
+    def quantize(self, a: torch.Tensor) -> torch.Tensor:
+        return torch.clamp(torch.trunc(a * 16), -128, 127) / 16
+
+    def add(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+        return self.quantize(a + b)
+
+    def mul(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+        return self.quantize(a * b)
+
+    def matmul(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+        return self.quantize(torch.matmul(a, b))
+
+
+class HoistedInputProjectionTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(42)
+        operations = GridOperations()
+
+        class Layers:
+            def lstm(self, input_size: int, hidden_size: int, bias: bool):
+                return LSTMCell(
+                    input_size=input_size,
+                    hidden_size=hidden_size,
+                    bias=bias,
+                    operations=operations,
+                    sigmoid_factory=torch.nn.Hardsigmoid,
+                    tanh_factory=torch.nn.Hardtanh,
+                )
+
+        self.layers = Layers()
+
+    def create_lstm(self, batch_first: bool) -> LSTM:
+        return LSTM(
+            input_size=2,
+            hidden_size=3,
+            bias=True,
+            batch_first=batch_first,
+            layers=self.layers,
+        )
+
+    def cell_by_cell(
+        self, lstm: LSTM, inputs: torch.Tensor, time_dim: int
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        state = None
+        outputs = []
+        for x in torch.unbind(inputs, dim=time_dim):
+            state = lstm.cell(x, state)
+            outputs.append(state[0])
+        assert state is not None
+        return torch.stack(outputs, dim=time_dim), state[0], state[1]
+
+    def assertMatchesCellByCell(
+        self, lstm: LSTM, inputs: torch.Tensor, time_dim: int
+    ) -> None:
+        expected_outputs, expected_h, expected_c = self.cell_by_cell(
+            lstm, inputs, time_dim
+        )
+        actual_outputs, (actual_h, actual_c) = lstm(inputs)
+        self.assertTensorEqual(expected_outputs, actual_outputs)
+        self.assertTensorEqual(expected_h, actual_h.squeeze(0))
+        self.assertTensorEqual(expected_c, actual_c.squeeze(0))
+
+    def test_is_bit_identical_to_cell_by_cell_evaluation(self) -> None:
+        lstm = self.create_lstm(batch_first=False)
+        self.assertMatchesCellByCell(lstm, input_data((10, 4, 2)), time_dim=0)
+
+    def test_is_bit_identical_for_batch_first_inputs(self) -> None:
+        lstm = self.create_lstm(batch_first=True)
+        self.assertMatchesCellByCell(lstm, input_data((4, 10, 2)), time_dim=1)
+
+    def test_is_bit_identical_without_batches(self) -> None:
+        lstm = self.create_lstm(batch_first=True)
+        self.assertMatchesCellByCell(lstm, input_data((10, 2)), time_dim=0)
+
+    def test_gradients_flow_through_hoisted_projection(self) -> None:
+        lstm = self.create_lstm(batch_first=True)
+        outputs, _ = lstm(input_data((4, 10, 2)))
+        outputs.sum().backward()
+        weight_grad = lstm.cell.linear_ih.weight.grad
+        self.assertIsNotNone(weight_grad)
+
+
+class CheckpointedLSTMTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(42)
+        operations = GridOperations()
+
+        class Layers:
+            def lstm(self, input_size: int, hidden_size: int, bias: bool):
+                return LSTMCell(
+                    input_size=input_size,
+                    hidden_size=hidden_size,
+                    bias=bias,
+                    operations=operations,
+                    sigmoid_factory=torch.nn.Hardsigmoid,
+                    tanh_factory=torch.nn.Hardtanh,
+                )
+
+        self.layers = Layers()
+
+    def create_lstm(self, checkpoint_every: Optional[int]) -> LSTM:
+        return LSTM(
+            input_size=2,
+            hidden_size=3,
+            bias=True,
+            batch_first=True,
+            layers=self.layers,
+            checkpoint_every=checkpoint_every,
+        )
+
+    def outputs_and_gradients(
+        self, lstm: LSTM, inputs: torch.Tensor
+    ) -> list[torch.Tensor]:
+        inputs = inputs.clone().requires_grad_()
+        outputs, (h, c) = lstm(inputs)
+        weights = torch.linspace(-1, 1, outputs.numel()).reshape(outputs.shape)
+        ((outputs * weights).sum() + c.sum()).backward()
+        gradients = [inputs.grad] + [p.grad for p in lstm.parameters()]
+        return [outputs.detach(), h.detach(), c.detach()] + gradients
+
+    def assertCheckpointingChangesNothing(self, checkpoint_every: int) -> None:
+        lstm = self.create_lstm(checkpoint_every=None)
+        checkpointed = self.create_lstm(checkpoint_every=checkpoint_every)
+        checkpointed.load_state_dict(lstm.state_dict())
+        inputs = input_data((4, 10, 2))
+
+        expected = self.outputs_and_gradients(lstm, inputs)
+        actual = self.outputs_and_gradients(checkpointed, inputs)
+        for expected_tensor, actual_tensor in zip(expected, actual):
+            self.assertTensorEqual(expected_tensor, actual_tensor)
+
+    def test_segments_dividing_the_sequence(self) -> None:
+        self.assertCheckpointingChangesNothing(checkpoint_every=5)
+
+    def test_shorter_last_segment(self) -> None:
+        self.assertCheckpointingChangesNothing(checkpoint_every=3)
+
+    def test_single_segment(self) -> None:
+        self.assertCheckpointingChangesNothing(checkpoint_every=20)
+
+    def test_checkpoint_every_has_to_be_positive(self) -> None:
+        with self.assertRaises(ValueError):
+            self.create_lstm(checkpoint_every=0)
+
+
+class VariableLengthLSTMTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(42)
+        self.lengths = torch.tensor([3, 7, 1, 7, 5])
+
+    def padded_inputs(self, batch_first: bool) -> torch.Tensor:
+        inputs = input_data((5, 7, 2))
+        mask = torch.arange(7) < self.lengths[:, None]
+        inputs = inputs * mask[..., None]
+        return inputs if batch_first else inputs.transpose(0, 1)
+
+    def packed_inputs(self, batch_first: bool) -> PackedSequence:
+        return pack_padded_sequence(
+            self.padded_inputs(batch_first),
+            self.lengths,
+            batch_first=batch_first,
+            enforce_sorted=False,
+        )
+
+    def assertPackedEqual(self, expected: PackedSequence, actual: Any) -> None:
+        self.assertIsInstance(actual, PackedSequence)
+        self.assertTensorEqual(
+            torch.round(expected.data, decimals=4), torch.round(actual.data, decimals=4)
+        )
+        self.assertTensorEqual(expected.batch_sizes, actual.batch_sizes)
+        self.assertTensorEqual(expected.unsorted_indices, actual.unsorted_indices)
+
+    def assertLSTMOutputsEqual(
+        self,
+        lstm: Any,
+        reference_lstm: torch.nn.LSTM,
+        inputs: torch.Tensor,
+        batch_first: bool,
+    ) -> None:
+        packed = pack_padded_sequence(
+            inputs, self.lengths, batch_first=batch_first, enforce_sorted=False
+        )
+        expected_outputs, (expected_h, expected_c) = reference_lstm(packed)
+        expected_outputs, _ = torch.nn.utils.rnn.pad_packed_sequence(
+            expected_outputs, batch_first=batch_first, total_length=7
+        )
+        actual_outputs, (actual_h, actual_c) = lstm(inputs)
+
+        tensor_round = partial(torch.round, decimals=4)
+        self.assertTensorEqual(
+            tensor_round(expected_outputs), tensor_round(actual_outputs)
+        )
+        self.assertTensorEqual(tensor_round(expected_h), tensor_round(actual_h))
+        self.assertTensorEqual(tensor_round(expected_c), tensor_round(actual_c))
+
+    def test_packed_sequence_equals_pytorch_lstm(self) -> None:
+        lstm, reference_lstm = create_lstm(
+            input_size=2, hidden_size=3, bias=True, batch_first=True
+        )
+        inputs = self.packed_inputs(batch_first=True)
+        state = (input_data((1, 5, 3)), input_data((1, 5, 3)).flip(1))
+        actual_outputs, (actual_h, actual_c) = lstm(inputs, state)
+        expected_outputs, (expected_h, expected_c) = reference_lstm(inputs, state)
+
+        self.assertPackedEqual(expected_outputs, actual_outputs)
+        self.assertTensorEqual(
+            torch.round(expected_h, decimals=4), torch.round(actual_h, decimals=4)
+        )
+        self.assertTensorEqual(
+            torch.round(expected_c, decimals=4), torch.round(actual_c, decimals=4)
+        )
+
+    def test_lengths_equal_packed_sequence(self) -> None:
+        for batch_first in (True, False):
+            with self.subTest(batch_first=batch_first):
+                lstm, reference_lstm = create_lstm(
+                    input_size=2, hidden_size=3, bias=True, batch_first=batch_first
+                )
+                inputs = self.padded_inputs(batch_first)
+                self.assertLSTMOutputsEqual(
+                    lambda x: lstm(x, lengths=self.lengths),
+                    reference_lstm,
+                    inputs,
+                    batch_first,
+                )
+
+    def test_hoisted_and_checkpointed_packed_sequences_agree(self) -> None:
+        class Layers:
+            def __init__(self) -> None:
+                self.operations = GridOperations()
+
+            def lstm(self, input_size: int, hidden_size: int, bias: bool):
+                return LSTMCell(
+                    input_size=input_size,
+                    hidden_size=hidden_size,
+                    bias=bias,
+                    operations=self.operations,
+                    sigmoid_factory=torch.nn.Hardsigmoid,
+                    tanh_factory=torch.nn.Hardtanh,
+                )
+
+        def create(checkpoint_every: Optional[int]) -> LSTM:
+            return LSTM(
+                input_size=2,
+                hidden_size=3,
+                bias=True,
+                batch_first=True,
+                layers=Layers(),
+                checkpoint_every=checkpoint_every,
+            )
+
+        def run(lstm: LSTM) -> list[torch.Tensor]:
+            outputs, (h, c) = lstm(self.packed_inputs(batch_first=True))
+            (outputs.data.sum() + h.sum() + 2 * c.sum()).backward()
+            return [outputs.data, h, c] + [p.grad for p in lstm.parameters()]
+
+        lstm = create(checkpoint_every=None)
+        checkpointed = create(checkpoint_every=3)
+        checkpointed.load_state_dict(lstm.state_dict())
+
+        for expected, actual in zip(run(lstm), run(checkpointed)):
+            self.assertTensorEqual(expected, actual)
+
+    def test_lengths_require_batched_inputs(self) -> None:
+        lstm, _ = create_lstm(input_size=2, hidden_size=3, bias=True, batch_first=True)
+        with self.assertRaises(ValueError):
+            lstm(input_data((7, 2)), lengths=torch.tensor([7]))
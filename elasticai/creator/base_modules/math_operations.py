@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Protocol
+from typing import Optional, Protocol, runtime_checkable
 
 from torch import Tensor
 
@@ -8,6 +8,10 @@ class Quantize(Protocol):
     @abstractmethod
     def quantize(self, a: Tensor) -> Tensor: ...
 
+    def quantize_parameter(self, a: Tensor) -> Tensor:
+        """Quantization applied to trainable parameters such as weights and biases."""
+        return self.quantize(a)
+
 
 class MatMul(Protocol):
     @abstractmethod
@@ -22,3 +26,43 @@ class Add(Protocol):
 class Mul(Protocol):
     @abstractmethod
     def mul(self, a: Tensor, b: Tensor) -> Tensor: ...
+
+
+class Convolution1d(Protocol):
+    @abstractmethod
+    def conv1d(
+        self,
+        x: Tensor,
+        weight: Tensor,
+        bias: Tensor | None,
+        stride: tuple[int, ...],
+        padding: tuple[int, ...] | str,
+        dilation: tuple[int, ...],
+        groups: int,
+    ) -> Tensor: ...
+
+
+@runtime_checkable
+class LinearTransform(Protocol):
+    """Optional for operations that compute `x @ weight.T + bias` differently
+    from `matmul` followed by `add`, e.g., with a single quantization."""
+
+    @abstractmethod
+    def linear(self, x: Tensor, weight: Tensor, bias: Optional[Tensor]) -> Tensor: ...
+
+
+@runtime_checkable
+class LSTMCellStep(Protocol):
+    """Optional for operations that compute a whole LSTM step at once,
+    including its activations."""
+
+    @abstractmethod
+    def lstm_cell(
+        self,
+        x: Tensor,
+        state: Optional[tuple[Tensor, Tensor]],
+        weight_ih: Tensor,
+        weight_hh: Tensor,
+        bias_ih: Optional[Tensor],
+        bias_hh: Optional[Tensor],
+    ) -> tuple[Tensor, Tensor]: ...
@@ -0,0 +1,73 @@
+from collections.abc import Callable
+from typing import NamedTuple
+
+import torch
+
+try:
+    from torch.compiler import is_compiling
+except ImportError:  # torch < 2.1
+    try:
+        from torch._dynamo import is_compiling
+    except ImportError:  # torch < 2.0
+
+        def is_compiling() -> bool:
+            return False
+
+
+class _Key(NamedTuple):
+    parameter: torch.Tensor
+    data_ptr: int
+    version: int
+    quantize: Callable[[torch.Tensor], torch.Tensor]
+
+    def matches(self, other: "_Key") -> bool:
+        return (
+            self.parameter is other.parameter
+            and self.data_ptr == other.data_ptr
+            and self.version == other.version
+            and self.quantize == other.quantize
+        )
+
+
+class QuantizedParameterCache:
+    """Remembers quantized copies of module parameters between forward calls.
+
+    An entry is reused as long as the parameter object, its storage and its
+    `_version` counter are unchanged and the same quantization function is
+    used. In-place updates (optimizer steps, `load_state_dict`) bump the
+    version, `module.to(...)` and assignments to `.data` replace the storage.
+    Changes made through `parameter.data` in place are not tracked.
+    While a parameter still needs gradients the cache is bypassed, so the
+    quantization stays part of the autograd graph during training. It is also
+    bypassed while tracing or compiling, so the quantization ends up in the
+    graph instead of a stale constant.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[_Key, torch.Tensor]] = {}
+
+    def get(
+        self,
+        name: str,
+        parameter: torch.Tensor,
+        quantize: Callable[[torch.Tensor], torch.Tensor],
+    ) -> torch.Tensor:
+        if (
+            (torch.is_grad_enabled() and parameter.requires_grad)
+            or torch.jit.is_tracing()
+            or is_compiling()
+        ):
+            self._entries.pop(name, None)
+            return quantize(parameter)
+
+        key = _Key(parameter, parameter.data_ptr(), parameter._version, quantize)
+        entry = self._entries.get(name)
+        if entry is not None and entry[0].matches(key):
+            return entry[1]
+
+        quantized = quantize(parameter)
+        self._entries[name] = (key, quantized)
+        return quantized
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,83 @@
+import torch
+
+from tests.tensor_test_case import TensorTestCase
+
+from .conv1d import Conv1d
+from .linear import Linear
+from .torch_math_operations import TorchMathOperations
+
+
+class CountingOperations(TorchMathOperations):
+    def __init__(self) -> None:
+        self.quantize_calls = 0
+
+    def quantize(self, a: torch.Tensor) -> torch.Tensor:
+        self.quantize_calls += 1
+        return torch.round(a)
+
+
+class QuantizedParameterCacheTest(TensorTestCase):
+    def setUp(self) -> None:
+        self.operations = CountingOperations()
+        self.linear = Linear(
+            in_features=3, out_features=2, operations=self.operations, bias=True
+        )
+        self.x = torch.ones(3)
+
+    def test_reuses_quantized_parameters_without_autograd(self) -> None:
+        with torch.no_grad():
+            first = self.linear(self.x)
+            second = self.linear(self.x)
+        self.assertEqual(2, self.operations.quantize_calls)
+        self.assertTensorEqual(first, second)
+
+    def test_requantizes_while_parameters_need_gradients(self) -> None:
+        self.linear(self.x)
+        self.linear(self.x)
+        self.assertEqual(4, self.operations.quantize_calls)
+
+    def test_requantizes_after_in_place_update(self) -> None:
+        with torch.no_grad():
+            self.linear(self.x)
+            self.linear.weight.add_(10)
+            actual = self.linear(self.x)
+            expected = self.linear.weight.round() @ self.x + self.linear.bias.round()
+        self.assertEqual(3, self.operations.quantize_calls)
+        self.assertTensorEqual(expected, actual)
+
+    def test_requantizes_after_optimizer_step(self) -> None:
+        optimizer = torch.optim.SGD(self.linear.parameters(), lr=10)
+        with torch.no_grad():
+            self.linear(self.x)
+        self.linear(self.x).sum().backward()
+        optimizer.step()
+        with torch.no_grad():
+            actual = self.linear(self.x)
+            expected = self.linear.weight.round() @ self.x + self.linear.bias.round()
+        self.assertTensorEqual(expected, actual)
+
+    def test_requantizes_after_load_state_dict(self) -> None:
+        other = Linear(
+            in_features=3, out_features=2, operations=self.operations, bias=True
+        )
+        with torch.no_grad():
+            self.linear(self.x)
+            self.linear.load_state_dict(other.state_dict())
+            actual = self.linear(self.x)
+            expected = other(self.x)
+        self.assertTensorEqual(expected, actual)
+
+    def test_requantizes_after_parameter_data_is_replaced(self) -> None:
+        with torch.no_grad():
+            self.linear(self.x)
+            self.linear.weight.data = torch.full((2, 3), 2.0)
+            actual = self.linear(self.x)
+            expected = 6 + self.linear.bias.round()
+        self.assertTensorEqual(expected, actual)
+
+    def test_conv1d_reuses_quantized_parameters_without_autograd(self) -> None:
+        conv = Conv1d(self.operations, in_channels=1, out_channels=2, kernel_size=2)
+        with torch.no_grad():
+            conv(torch.ones(1, 1, 4))
+            conv(torch.ones(1, 1, 4))
+        self.assertEqual(2, self.operations.quantize_calls)
@@ -0,0 +1,12 @@
+import torch
+
+
+def straight_through(value: torch.Tensor, surrogate: torch.Tensor) -> torch.Tensor:
+    """Forward `value` and backpropagate as if `surrogate` had been returned.
+
+    Unlike a custom `torch.autograd.Function` this only consists of plain tensor
+    operations, so modules using it can be traced (`torch.jit.trace`) and
+    compiled (`torch.compile`) into a single graph. The result equals `value`
+    bit for bit, because `surrogate - surrogate.detach()` is exactly zero.
+    """
+    return value.detach() + (surrogate - surrogate.detach())
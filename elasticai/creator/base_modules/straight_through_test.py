@@ -0,0 +1,18 @@
+import torch
+
+from tests.tensor_test_case import TensorTestCase
+
+from .straight_through import straight_through
+
+
+class StraightThroughTest(TensorTestCase):
+    def test_forwards_value_unchanged(self) -> None:
+        surrogate = torch.tensor([-0.3, 0.0, 0.7])
+        value = torch.tensor([-0.25, -0.0, 0.5])
+        self.assertTensorEqual(value, straight_through(value, surrogate))
+
+    def test_passes_gradient_to_surrogate(self) -> None:
+        x = torch.tensor([-0.3, 0.7, 2.0], requires_grad=True)
+        surrogate = torch.clamp(x, min=-1, max=1)
+        straight_through(torch.round(x), surrogate).sum().backward()
+        self.assertTensorEqual([1.0, 1.0, 0.0], x.grad)
@@ -1,4 +1,5 @@
 import torch
+from torch.nn.functional import conv1d
 
 from .conv1d import MathOperations as Conv1dOps
 from .linear import MathOperations as LinearOps
@@ -17,3 +18,23 @@ class TorchMathOperations(LinearOps, Conv1dOps, LSTMOps):
 
     def matmul(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
         return torch.matmul(a, b)
+
+    def conv1d(
+        self,
+        x: torch.Tensor,
+        weight: torch.Tensor,
+        bias: torch.Tensor | None,
+        stride: tuple[int, ...],
+        padding: tuple[int, ...] | str,
+        dilation: tuple[int, ...],
+        groups: int,
+    ) -> torch.Tensor:
+        return conv1d(
+            input=x,
+            weight=weight,
+            bias=bias,
+            stride=stride,
+            padding=padding,
+            dilation=dilation,
+            groups=groups,
+        )
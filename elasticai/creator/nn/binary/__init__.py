@@ -1 +1,4 @@
+from .conv1d import Conv1d
+from .linear import Linear
+from .packing import Pack, PackedTensor, Unpack
 from .quantization import quantize
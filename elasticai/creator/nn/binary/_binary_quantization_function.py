@@ -3,6 +3,10 @@ from typing import Any
 import torch
 
 
+def binarize(x: torch.Tensor) -> torch.Tensor:
+    return torch.where(x >= 0, 1.0, -1.0)
+
+
 class Binarize(torch.autograd.Function):
     @staticmethod
     def forward(ctx: Any, *args: Any, **kwargs: Any) -> Any:
@@ -11,8 +15,7 @@ class Binarize(torch.autograd.Function):
         x = args[0]
         out_of_range = torch.logical_or(torch.gt(x, 1.0), torch.lt(x, -1.0))
         ctx.save_for_backward(out_of_range)
-        y = torch.where(x >= 0, 1.0, -1.0)
-        return y
+        return binarize(x)
 
     @staticmethod
     def backward(ctx: Any, *grad_outputs: Any) -> Any:
@@ -0,0 +1,56 @@
+import torch
+from torch import Tensor
+
+WORD_BITS = 64
+
+_M1 = 0x5555555555555555
+_M2 = 0x3333333333333333
+_M4 = 0x0F0F0F0F0F0F0F0F
+_H01 = 0x0101010101010101
+
+
+def num_words(num_values: int) -> int:
+    return -(-num_values // WORD_BITS)
+
+
+def pack(x: Tensor, dim: int = -1) -> Tensor:
+    """Binarize `x` and pack it along `dim` into int64 words.
+
+    Value `k` along `dim` becomes bit `k % 64` of word `k // 64`, set for
+    `+1` (`x >= 0`) and cleared for `-1`. Padding bits of the last word are
+    cleared. The words are int64, since torch has no bitwise operations on
+    uint64, but they are used as plain 64 bit patterns.
+    """
+    bits = torch.movedim(x >= 0, dim, -1)
+    num_values = bits.shape[-1]
+    padding = num_words(num_values) * WORD_BITS - num_values
+    bits = torch.nn.functional.pad(bits, (0, padding))
+    bits = bits.reshape(*bits.shape[:-1], -1, WORD_BITS).to(torch.int64)
+    weights = torch.bitwise_left_shift(
+        torch.ones((), dtype=torch.int64, device=x.device),
+        torch.arange(WORD_BITS, device=x.device),
+    )
+    # the bits of a word do not overlap, so their sum is their bitwise or
+    words = (bits * weights).sum(dim=-1)
+    return torch.movedim(words, -1, dim)
+
+
+def unpack(words: Tensor, num_values: int, dim: int = -1) -> Tensor:
+    """Inverse of `pack`, yields a float tensor of `-1` and `+1`."""
+    words = torch.movedim(words, dim, -1)
+    shifts = torch.arange(WORD_BITS, device=words.device)
+    bits = torch.bitwise_and(torch.bitwise_right_shift(words[..., None], shifts), 1)
+    bits = bits.reshape(*words.shape[:-1], -1)[..., :num_values]
+    return torch.movedim(bits.to(torch.float32) * 2 - 1, -1, dim)
+
+
+def popcount(words: Tensor) -> Tensor:
+    """Number of set bits of each int64 word, counted in parallel within the
+    word (SWAR). The masks clear the bits that the arithmetic right shifts
+    of negative words fill in."""
+    words = words - torch.bitwise_and(torch.bitwise_right_shift(words, 1), _M1)
+    words = torch.bitwise_and(words, _M2) + torch.bitwise_and(
+        torch.bitwise_right_shift(words, 2), _M2
+    )
+    words = torch.bitwise_and(words + torch.bitwise_right_shift(words, 4), _M4)
+    return torch.bitwise_right_shift(words * _H01, 56)
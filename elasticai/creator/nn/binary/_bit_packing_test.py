@@ -0,0 +1,33 @@
+import pytest
+import torch
+
+from ._bit_packing import pack, popcount, unpack
+
+
+def test_packs_plus_one_as_set_bit() -> None:
+    x = torch.tensor([1.0, -1.0, -1.0, 1.0, 0.0])
+    assert pack(x).tolist() == [0b11001]
+
+
+def test_last_value_of_a_full_word_sets_the_sign_bit() -> None:
+    x = -torch.ones(64)
+    x[63] = 1
+    assert pack(x).tolist() == [-(2**63)]
+
+
+@pytest.mark.parametrize("num_values", [1, 63, 64, 65, 200])
+def test_unpack_inverts_pack(num_values: int) -> None:
+    x = torch.where(torch.randn(3, num_values) >= 0, 1.0, -1.0)
+    assert torch.equal(unpack(pack(x), num_values), x)
+
+
+def test_packs_along_dim() -> None:
+    x = torch.where(torch.randn(2, 70, 5) >= 0, 1.0, -1.0)
+    packed = pack(x, dim=1)
+    assert packed.shape == (2, 2, 5)
+    assert torch.equal(unpack(packed, 70, dim=1), x)
+
+
+def test_popcount() -> None:
+    words = torch.tensor([0, 1, 0b1011, -1, -(2**63), 2**63 - 1])
+    assert popcount(words).tolist() == [0, 1, 3, 64, 1, 63]
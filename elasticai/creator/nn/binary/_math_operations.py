@@ -1,17 +1,20 @@
-from typing import cast
-
 import torch
+from torch.nn.functional import conv1d
 
 from elasticai.creator.base_modules.conv1d import MathOperations as Conv1dOps
 from elasticai.creator.base_modules.linear import MathOperations as LinearOps
 from elasticai.creator.base_modules.lstm_cell import MathOperations as LSTMOps
+from elasticai.creator.base_modules.straight_through import straight_through
 
-from ._binary_quantization_function import Binarize
+from ._binary_quantization_function import binarize
 
 
 class MathOperations(LinearOps, Conv1dOps, LSTMOps):
     def quantize(self, a: torch.Tensor) -> torch.Tensor:
-        return cast(torch.Tensor, Binarize.apply(a))
+        binarized = binarize(a.detach())
+        if torch.is_grad_enabled() and a.requires_grad:
+            return straight_through(binarized, torch.clamp(a, min=-1.0, max=1.0))
+        return binarized
 
     def add(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
         return self.quantize(a + b)
@@ -21,3 +24,25 @@ class MathOperations(LinearOps, Conv1dOps, LSTMOps):
 
     def matmul(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
         return self.quantize(torch.matmul(a, b))
+
+    def conv1d(
+        self,
+        x: torch.Tensor,
+        weight: torch.Tensor,
+        bias: torch.Tensor | None,
+        stride: tuple[int, ...],
+        padding: tuple[int, ...] | str,
+        dilation: tuple[int, ...],
+        groups: int,
+    ) -> torch.Tensor:
+        return self.quantize(
+            conv1d(
+                input=x,
+                weight=weight,
+                bias=bias,
+                stride=stride,
+                padding=padding,
+                dilation=dilation,
+                groups=groups,
+            )
+        )
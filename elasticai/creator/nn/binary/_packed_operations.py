@@ -0,0 +1,90 @@
+from typing import Optional
+
+import torch
+from torch import Tensor
+
+from ._bit_packing import pack, popcount
+
+_MAX_WORDS_PER_CHUNK = 1 << 16
+
+
+def packed_linear(
+    x: Tensor, weight: Tensor, bias: Optional[Tensor], in_features: int
+) -> Tensor:
+    """Binary linear layer on packed operands.
+
+    `x` holds `in_features` values per row packed along its last dimension,
+    `weight` is the packed `(out_features, in_features)` weight matrix and
+    `bias` the binarized (not packed) bias. Padding bits are cleared in both
+    operands, so they never count as a mismatch and the dot product of two
+    rows is `in_features - 2 * popcount(x ^ w)`. As for `MathOperations`,
+    the dot product is binarized before the bias is added, so the bias only
+    matters for negative dot products. The result is packed again.
+    """
+    mismatches = _mismatches(x.reshape(-1, x.shape[-1]), weight)
+    dot = in_features - 2 * mismatches.reshape(*x.shape[:-1], -1)
+    if bias is not None:
+        dot = torch.maximum(dot, bias.to(torch.int64))
+    return pack(dot)
+
+
+def packed_conv1d(
+    x: Tensor,
+    weight: Tensor,
+    bias: Optional[Tensor],
+    in_channels: int,
+    stride: int,
+    padding: tuple[int, int],
+    dilation: int,
+) -> Tensor:
+    """Binary 1d convolution on operands packed along the channels.
+
+    `x` has the shape `([batch,] channel_words, length)`, `weight`
+    `(out_channels, channel_words, kernel_size)`, `bias` is binarized but not
+    packed. The windows of `x` are matched against the weights like the rows
+    of `packed_linear`. Zero padding contributes nothing to the dot product in
+    `torch.nn.functional.conv1d`, so it must not count as a mismatch either.
+    Padding words are zero, so each padded tap adds exactly the popcount of
+    its weights, which is subtracted again. As for `MathOperations`, the bias
+    is added before binarizing. The result is packed along the output
+    channels.
+    """
+    batched = x.dim() == 3
+    if not batched:
+        x = x[None]
+    batch_size, channel_words, _ = x.shape
+    out_channels, _, kernel_size = weight.shape
+    span = dilation * (kernel_size - 1) + 1
+
+    windows = torch.nn.functional.pad(x, padding).unfold(-1, span, stride)
+    windows = windows[..., ::dilation].permute(0, 2, 1, 3)
+    num_positions = windows.shape[1]
+    mismatches = _mismatches(
+        windows.reshape(-1, channel_words * kernel_size),
+        weight.reshape(out_channels, -1),
+    ).reshape(batch_size, num_positions, out_channels)
+
+    valid = torch.nn.functional.pad(
+        torch.ones(x.shape[-1], dtype=torch.int64, device=x.device), padding
+    )
+    valid = valid.unfold(0, span, stride)[:, ::dilation]
+    popcount_per_tap = popcount(weight).sum(dim=1)
+    mismatches = mismatches - torch.matmul(1 - valid, popcount_per_tap.T)
+
+    dot = in_channels * valid.sum(dim=-1)[:, None] - 2 * mismatches
+    if bias is not None:
+        dot = dot + bias.to(torch.int64)
+    result = pack(dot.permute(0, 2, 1), dim=1)
+    return result if batched else result[0]
+
+
+def _mismatches(rows: Tensor, weight: Tensor) -> Tensor:
+    """`popcount(rows[r] ^ weight[o])` summed over the words, for all `r` and
+    `o`. Works on chunks of rows so the intermediate words stay in cache."""
+    rows_per_chunk = max(1, _MAX_WORDS_PER_CHUNK // weight.numel())
+    return torch.cat(
+        [
+            popcount(torch.bitwise_xor(chunk[:, None, :], weight)).sum(dim=-1)
+            for chunk in rows.split(rows_per_chunk)
+        ]
+    )
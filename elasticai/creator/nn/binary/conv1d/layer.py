@@ -0,0 +1,81 @@
+from typing import Any
+
+import torch
+
+from elasticai.creator.base_modules.conv1d import Conv1d as Conv1dBase
+
+from .._bit_packing import pack
+from .._math_operations import MathOperations
+from .._packed_operations import packed_conv1d
+from ..packing import PackedTensor
+
+
+class Conv1d(Conv1dBase):
+    """Binary 1d convolution.
+
+    Float inputs are evaluated with `MathOperations`. A `PackedTensor` packed
+    along the channels with `Pack(dim=-2)` is evaluated with XNOR and
+    popcount on the packed weights and yields a `PackedTensor` packed along
+    the channels. Grouped convolutions only support float inputs.
+    """
+
+    def __init__(
+        self,
+        in_channels: int,
+        out_channels: int,
+        kernel_size: int | tuple[int],
+        stride: int | tuple[int] = 1,
+        padding: int | tuple[int] | str = 0,
+        dilation: int | tuple[int] = 1,
+        groups: int = 1,
+        bias: bool = True,
+        device: Any = None,
+    ) -> None:
+        super().__init__(
+            operations=MathOperations(),
+            in_channels=in_channels,
+            out_channels=out_channels,
+            kernel_size=kernel_size,
+            stride=stride,
+            padding=padding,
+            dilation=dilation,
+            groups=groups,
+            bias=bias,
+            device=device,
+        )
+
+    def forward(self, x: torch.Tensor | PackedTensor) -> torch.Tensor | PackedTensor:
+        if not isinstance(x, PackedTensor):
+            return super().forward(x)
+        if self.groups != 1:
+            raise ValueError("Packed inputs are not supported for groups != 1.")
+        if x.dim % x.words.dim() != x.words.dim() - 2:
+            raise ValueError("Packed inputs have to be packed along the channels.")
+        if x.num_values != self.in_channels:
+            raise ValueError(
+                f"Expected {self.in_channels} packed channels, got {x.num_values}."
+            )
+        words = packed_conv1d(
+            x.words,
+            weight=self._quantized_parameters.get(
+                "packed_weight", self.weight, _pack_channels
+            ),
+            bias=None if self.bias is None else self._quantized("bias", self.bias),
+            in_channels=self.in_channels,
+            stride=self.stride[0],
+            padding=self._padding_per_side(),
+            dilation=self.dilation[0],
+        )
+        return PackedTensor(words=words, num_values=self.out_channels, dim=-2)
+
+    def _padding_per_side(self) -> tuple[int, int]:
+        if self.padding == "valid":
+            return 0, 0
+        if self.padding == "same":
+            total = self.dilation[0] * (self.kernel_size[0] - 1)
+            return total // 2, total - total // 2
+        return self.padding[0], self.padding[0]
+
+
+def _pack_channels(weight: torch.Tensor) -> torch.Tensor:
+    return pack(weight, dim=1)
@@ -0,0 +1,53 @@
+import pytest
+import torch
+
+from ..packing import Pack, Unpack
+from .layer import Conv1d
+
+
+def random_signs(*shape: int) -> torch.Tensor:
+    return torch.where(torch.randn(*shape) >= 0, 1.0, -1.0)
+
+
+@pytest.mark.parametrize(
+    "stride, padding, dilation",
+    [(1, 0, 1), (2, 0, 1), (1, 2, 1), (1, 0, 2), (3, 1, 2), (1, "same", 2)],
+)
+def test_packed_inputs_yield_the_same_results_as_float_inputs(
+    stride: int, padding: int | str, dilation: int
+) -> None:
+    torch.manual_seed(0)
+    conv = Conv1d(
+        in_channels=70,
+        out_channels=5,
+        kernel_size=3,
+        stride=stride,
+        padding=padding,
+        dilation=dilation,
+    )
+    x = random_signs(4, 70, 12)
+    with torch.no_grad():
+        expected = conv(x)
+        actual = Unpack(num_values=5, dim=-2)(conv(Pack(dim=-2)(x)))
+    assert torch.equal(expected, actual)
+
+
+def test_unbatched_packed_inputs() -> None:
+    conv = Conv1d(in_channels=3, out_channels=2, kernel_size=2, bias=False)
+    x = random_signs(3, 6)
+    with torch.no_grad():
+        expected = conv(x)
+        actual = Unpack(num_values=2, dim=-2)(conv(Pack(dim=-2)(x)))
+    assert torch.equal(expected, actual)
+
+
+def test_packed_inputs_are_rejected_for_grouped_convolutions() -> None:
+    conv = Conv1d(in_channels=4, out_channels=2, kernel_size=1, groups=2)
+    with pytest.raises(ValueError):
+        conv(Pack(dim=-2)(random_signs(1, 4, 3)))
+
+
+def test_packed_inputs_have_to_be_packed_along_the_channels() -> None:
+    conv = Conv1d(in_channels=4, out_channels=2, kernel_size=1)
+    with pytest.raises(ValueError):
+        conv(Pack()(random_signs(1, 4, 4)))
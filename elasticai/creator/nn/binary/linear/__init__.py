@@ -0,0 +1 @@
+from .layer import Linear
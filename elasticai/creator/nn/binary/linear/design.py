@@ -0,0 +1,100 @@
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.shared_designs.rom import Rom
+
+
+class Linear(Design):
+    """XNOR-popcount datapath for a binary linear layer.
+
+    `weights` and `bias` hold `-1` and `+1`. The weights of each output are
+    packed into ROM words of `word_width` bits, so each cycle computes
+    `word_width` products without a multiplier. After reading its inputs,
+    the layer needs `out_feature_num * words` cycles.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        in_feature_num: int,
+        out_feature_num: int,
+        weights: list[list[int]],
+        bias: list[int],
+        word_width: int = 8,
+        work_library_name: str = "work",
+    ) -> None:
+        super().__init__(name=name)
+        self.in_feature_num = in_feature_num
+        self.out_feature_num = out_feature_num
+        self.weights = weights
+        self.bias = bias
+        self.word_width = word_width
+        self.work_library_name = work_library_name
+        self.words = -(-in_feature_num // word_width)
+
+    @property
+    def port(self) -> Port:
+        return create_port(
+            x_width=1,
+            y_width=1,
+            x_count=self.in_feature_num,
+            y_count=self.out_feature_num,
+        )
+
+    @property
+    def threshold(self) -> int:
+        """Minimum number of matches for a non negative dot product, the
+        padding bits of the last word always match."""
+        padding = self.words * self.word_width - self.in_feature_num
+        return -(-self.in_feature_num // 2) + padding
+
+    def rom_words(self) -> list[int]:
+        """Weight `k` of an output is bit `k % word_width` of its word
+        `k // word_width`, set for `+1`."""
+        words = []
+        for row in self.weights:
+            for start in range(0, self.in_feature_num, self.word_width):
+                chunk = row[start : start + self.word_width]
+                words.append(
+                    sum(1 << bit for bit, weight in enumerate(chunk) if weight > 0)
+                )
+        return words
+
+    def save_to(self, destination: Path) -> None:
+        rom_name = f"{self.name}_w_rom"
+        bias_bits = "".join("1" if b > 0 else "0" for b in reversed(self.bias))
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="linear.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                weights_rom_name=rom_name,
+                work_library_name=self.work_library_name,
+                x_addr_width=str(self.port["x_address"].width),
+                y_addr_width=str(self.port["y_address"].width),
+                w_addr_width=str(
+                    calculate_address_width(self.out_feature_num * self.words)
+                ),
+                in_feature_num=str(self.in_feature_num),
+                out_feature_num=str(self.out_feature_num),
+                word_width=str(self.word_width),
+                words=str(self.words),
+                threshold=str(self.threshold),
+                bias=f'"{bias_bits}"',
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+        rom = Rom(
+            name=rom_name,
+            data_width=self.word_width,
+            values_as_integers=self.rom_words(),
+        )
+        rom.save_to(destination.create_subpath(rom_name))
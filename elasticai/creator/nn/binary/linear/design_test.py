@@ -0,0 +1,104 @@
+from typing import cast
+
+import pytest
+import torch
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.nn.sequential import Sequential
+
+from .design import Linear as LinearDesign
+from .layer import Linear
+
+
+def create_design(
+    weights: list[list[int]], bias: list[int], word_width: int
+) -> LinearDesign:
+    return LinearDesign(
+        name="linear",
+        in_feature_num=len(weights[0]),
+        out_feature_num=len(weights),
+        weights=weights,
+        bias=bias,
+        word_width=word_width,
+    )
+
+
+def save_design(design: LinearDesign) -> dict[str, list[str]]:
+    destination = InMemoryPath("build", parent=None)
+    design.save_to(destination)
+    files = cast(list[InMemoryFile], list(destination.children.values()))
+    return {file.name: file.text for file in files}
+
+
+def emulate(design: LinearDesign, x: list[int]) -> list[int]:
+    """Computes the outputs like the datapath does, from the generated ROM
+    words and constants."""
+    inputs = sum(1 << k for k, value in enumerate(x) if value > 0)
+    mask = (1 << design.word_width) - 1
+    words = design.rom_words()
+    outputs = []
+    for neuron, bias in enumerate(design.bias):
+        matches = 0
+        for k in range(design.words):
+            w = words[neuron * design.words + k]
+            xnor = ~(w ^ (inputs >> (k * design.word_width))) & mask
+            matches += bin(xnor).count("1")
+        outputs.append(1 if matches >= design.threshold or bias > 0 else -1)
+    return outputs
+
+
+def test_saves_layer_and_weight_rom() -> None:
+    design = create_design([[1, -1, 1]], bias=[1], word_width=2)
+    assert set(save_design(design)) == {"linear.vhd", "linear_w_rom.vhd"}
+
+
+def test_packs_weights_of_each_output_into_rom_words() -> None:
+    design = create_design(
+        [[1, -1, 1, 1, -1], [-1, -1, -1, -1, 1]], bias=[1, 1], word_width=4
+    )
+    assert design.rom_words() == [0b1101, 0b0000, 0b0000, 0b0001]
+
+
+def test_rom_stores_one_word_per_address() -> None:
+    design = create_design([[1, -1, 1], [-1, 1, 1]], bias=[1, 1], word_width=4)
+    rom = save_design(design)["linear_w_rom.vhd"]
+    assert any('("0101","0110")' in line for line in rom)
+
+
+def test_threshold_includes_padding_bits() -> None:
+    design = create_design([[1] * 5], bias=[1], word_width=4)
+    assert design.threshold == 3 + 3
+
+
+def test_bias_constant_has_one_bit_per_output() -> None:
+    design = create_design([[1], [1], [1]], bias=[1, -1, -1], word_width=4)
+    code = save_design(design)["linear.vhd"]
+    assert any(':= "001";' in line for line in code)
+
+
+def test_uses_one_bit_buffered_port() -> None:
+    design = create_design([[1] * 5] * 3, bias=[1, 1, 1], word_width=4)
+    assert (design.port["x"].width, design.port["y"].width) == (1, 1)
+    assert (design.port["x_address"].width, design.port["y_address"].width) == (3, 2)
+
+
+@pytest.mark.parametrize("in_features, word_width", [(5, 4), (13, 8), (16, 8)])
+@pytest.mark.parametrize("bias", [True, False])
+def test_datapath_matches_layer(in_features: int, word_width: int, bias: bool) -> None:
+    torch.manual_seed(0)
+    layer = Linear(
+        in_features=in_features, out_features=6, bias=bias, rom_word_width=word_width
+    )
+    design = layer.create_design("linear")
+    for _ in range(10):
+        x = torch.where(torch.randn(in_features) >= 0, 1.0, -1.0)
+        with torch.no_grad():
+            expected = layer(x).int().tolist()
+        assert emulate(design, x.int().tolist()) == expected
+
+
+def test_plugs_into_sequential() -> None:
+    model = Sequential(Linear(in_features=6, out_features=4), Linear(4, 2))
+    destination = InMemoryPath("build", parent=None)
+    model.create_design("network").save_to(destination)
+    assert {"linear_0", "linear_1", "network"} <= set(destination.children)
@@ -0,0 +1,76 @@
+from typing import Any
+
+import torch
+
+from elasticai.creator.base_modules.linear import Linear as LinearBase
+from elasticai.creator.vhdl.design_creator import DesignCreator
+
+from .._bit_packing import pack
+from .._math_operations import MathOperations
+from .._packed_operations import packed_linear
+from ..packing import PackedTensor
+from .design import Linear as LinearDesign
+
+
+class Linear(DesignCreator, LinearBase):
+    """Binary linear layer.
+
+    Float inputs are evaluated with `MathOperations`. A `PackedTensor` from
+    `Pack()` is evaluated with XNOR and popcount on the packed weights and
+    yields a `PackedTensor`, so consecutive layers run on packed data until
+    an `Unpack`.
+
+    The design packs `rom_word_width` weights into each ROM word and
+    evaluates that many products per cycle.
+    """
+
+    def __init__(
+        self,
+        in_features: int,
+        out_features: int,
+        bias: bool = True,
+        device: Any = None,
+        rom_word_width: int = 8,
+    ) -> None:
+        super().__init__(
+            in_features=in_features,
+            out_features=out_features,
+            operations=MathOperations(),
+            bias=bias,
+            device=device,
+        )
+        self.rom_word_width = rom_word_width
+
+    def forward(self, x: torch.Tensor | PackedTensor) -> torch.Tensor | PackedTensor:
+        if not isinstance(x, PackedTensor):
+            return super().forward(x)
+        if x.dim % x.words.dim() != x.words.dim() - 1:
+            raise ValueError("Packed inputs have to be packed along the last dim.")
+        if x.num_values != self.in_features:
+            raise ValueError(
+                f"Expected {self.in_features} packed values, got {x.num_values}."
+            )
+        words = packed_linear(
+            x.words,
+            weight=self._quantized_parameters.get("packed_weight", self.weight, pack),
+            bias=None if self.bias is None else self._quantized("bias", self.bias),
+            in_features=self.in_features,
+        )
+        return PackedTensor(words=words, num_values=self.out_features, dim=-1)
+
+    def create_design(self, name: str) -> LinearDesign:
+        with torch.no_grad():
+            weights = self._operations.quantize(self.weight)
+            bias = (
+                -torch.ones(self.out_features)
+                if self.bias is None
+                else self._operations.quantize(self.bias)
+            )
+        return LinearDesign(
+            name=name,
+            in_feature_num=self.in_features,
+            out_feature_num=self.out_features,
+            weights=weights.int().tolist(),
+            bias=bias.int().tolist(),
+            word_width=self.rom_word_width,
+        )
@@ -0,0 +1,47 @@
+import pytest
+import torch
+
+from ..packing import Pack, Unpack
+from .layer import Linear
+
+
+def random_signs(*shape: int) -> torch.Tensor:
+    return torch.where(torch.randn(*shape) >= 0, 1.0, -1.0)
+
+
+def test_packed_inputs_yield_the_same_results_as_float_inputs() -> None:
+    torch.manual_seed(0)
+    first = Linear(in_features=100, out_features=70)
+    second = Linear(in_features=70, out_features=3, bias=False)
+    x = random_signs(8, 100)
+    packed = torch.nn.Sequential(Pack(), first, second, Unpack(num_values=3))
+    with torch.no_grad():
+        expected = second(first(x))
+        actual = packed(x)
+    assert torch.equal(expected, actual)
+
+
+def test_bias_only_matters_for_negative_dot_products() -> None:
+    linear = Linear(in_features=2, out_features=2)
+    with torch.no_grad():
+        linear.weight.copy_(torch.tensor([[1.0, 1.0], [-1.0, -1.0]]))
+        linear.bias.copy_(torch.tensor([-1.0, 1.0]))
+        actual = Unpack(num_values=2)(linear(Pack()(torch.tensor([1.0, 1.0]))))
+    assert actual.tolist() == [1.0, 1.0]
+
+
+def test_packed_weights_are_updated_after_a_parameter_change() -> None:
+    linear = Linear(in_features=2, out_features=1, bias=False)
+    x = Pack()(torch.tensor([1.0, 1.0]))
+    with torch.no_grad():
+        linear.weight.fill_(-1.0)
+        before = Unpack(num_values=1)(linear(x))
+        linear.weight.fill_(1.0)
+        after = Unpack(num_values=1)(linear(x))
+    assert (before.tolist(), after.tolist()) == ([-1.0], [1.0])
+
+
+def test_rejects_packed_inputs_of_another_size() -> None:
+    linear = Linear(in_features=3, out_features=1)
+    with pytest.raises(ValueError):
+        linear(Pack()(torch.ones(4)))
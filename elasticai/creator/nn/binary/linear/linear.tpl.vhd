@@ -0,0 +1,149 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+library ${work_library_name};
+use ${work_library_name}.all;
+
+-- Binary linear layer, values are encoded as '1' for +1 and '0' for -1.
+-- The inputs are read into a buffer of WORDS words first. Each output then
+-- takes WORDS cycles, every cycle matches one ROM word of WORD_WIDTH weights
+-- against one input word with xnor and counts the matches, so no multiplier
+-- is needed.
+entity ${name} is
+    generic (
+        X_ADDR_WIDTH : integer := ${x_addr_width};
+        Y_ADDR_WIDTH : integer := ${y_addr_width};
+        IN_FEATURE_NUM : integer := ${in_feature_num};
+        OUT_FEATURE_NUM : integer := ${out_feature_num};
+        WORD_WIDTH : integer := ${word_width};
+        WORDS : integer := ${words};
+        -- padding bits of the last input word match their weights, the
+        -- threshold includes them
+        THRESHOLD : integer := ${threshold}
+    );
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+        x_address : out std_logic_vector(X_ADDR_WIDTH-1 downto 0);
+        y_address : in std_logic_vector(Y_ADDR_WIDTH-1 downto 0);
+
+        x   : in std_logic_vector(0 downto 0);
+        y  : out std_logic_vector(0 downto 0);
+
+        done   : out std_logic
+    );
+end ${name};
+
+architecture rtl of ${name} is
+    function popcount(v : std_logic_vector(WORD_WIDTH-1 downto 0)) return natural is
+        variable count : natural range 0 to WORD_WIDTH := 0;
+    begin
+        for i in v'range loop
+            if v(i) = '1' then
+                count := count + 1;
+            end if;
+        end loop;
+        return count;
+    end function;
+
+    -- a set bit forces the output to +1, the dot product is binarized
+    -- before the bias is added
+    constant BIAS : std_logic_vector(OUT_FEATURE_NUM-1 downto 0) := ${bias};
+
+    type t_state is (s_load, s_forward, s_idle);
+    signal state : t_state;
+
+    type t_words is array (0 to WORDS-1) of std_logic_vector(WORD_WIDTH-1 downto 0);
+    signal x_words : t_words := (others => (others => '0'));
+
+    signal n_clock : std_logic;
+    signal reset : std_logic;
+    signal w_in : std_logic_vector(WORD_WIDTH-1 downto 0);
+    signal addr_w : std_logic_vector(${w_addr_width}-1 downto 0) := (others => '0');
+
+    signal y_ram : std_logic_vector(OUT_FEATURE_NUM-1 downto 0) := (others => '0');
+begin
+    n_clock <= not clock;
+    reset <= not enable;
+
+    main : process (clock, reset)
+        variable input_idx : integer range 0 to IN_FEATURE_NUM-1 := 0;
+        variable load_word : integer range 0 to WORDS-1 := 0;
+        variable load_bit : integer range 0 to WORD_WIDTH-1 := 0;
+        variable word_idx : integer range 0 to WORDS-1 := 0;
+        variable neuron_idx : integer range 0 to OUT_FEATURE_NUM-1 := 0;
+        variable var_addr_w : integer range 0 to OUT_FEATURE_NUM*WORDS-1 := 0;
+        variable matches : natural range 0 to WORDS*WORD_WIDTH := 0;
+    begin
+        if reset = '1' then
+            state <= s_load;
+            done <= '0';
+            input_idx := 0;
+            load_word := 0;
+            load_bit := 0;
+            word_idx := 0;
+            neuron_idx := 0;
+            var_addr_w := 0;
+            matches := 0;
+        elsif rising_edge(clock) then
+            if state = s_load then
+                x_words(load_word)(load_bit) <= x(0);
+                if input_idx < IN_FEATURE_NUM-1 then
+                    input_idx := input_idx + 1;
+                    if load_bit < WORD_WIDTH-1 then
+                        load_bit := load_bit + 1;
+                    else
+                        load_bit := 0;
+                        load_word := load_word + 1;
+                    end if;
+                else
+                    state <= s_forward;
+                end if;
+            elsif state = s_forward then
+                matches := matches + popcount(w_in xnor x_words(word_idx));
+                if word_idx < WORDS-1 then
+                    word_idx := word_idx + 1;
+                else
+                    word_idx := 0;
+                    if matches >= THRESHOLD then
+                        y_ram(neuron_idx) <= '1';
+                    else
+                        y_ram(neuron_idx) <= BIAS(neuron_idx);
+                    end if;
+                    matches := 0;
+                    if neuron_idx < OUT_FEATURE_NUM-1 then
+                        neuron_idx := neuron_idx + 1;
+                    else
+                        state <= s_idle;
+                    end if;
+                end if;
+                if var_addr_w < OUT_FEATURE_NUM*WORDS-1 then
+                    var_addr_w := var_addr_w + 1;
+                end if;
+            else
+                done <= '1';
+            end if;
+        end if;
+
+        x_address <= std_logic_vector(to_unsigned(input_idx, x_address'length));
+        addr_w <= std_logic_vector(to_unsigned(var_addr_w, addr_w'length));
+    end process main;
+
+    y_reading : process (clock, state)
+    begin
+        if state = s_idle then
+            if falling_edge(clock) then
+                y(0) <= y_ram(to_integer(unsigned(y_address)));
+            end if;
+        end if;
+    end process y_reading;
+
+    rom_w : entity ${work_library_name}.${weights_rom_name}(rtl)
+    port map (
+        clk  => n_clock,
+        en   => '1',
+        addr => addr_w,
+        data => w_in
+    );
+end architecture rtl;
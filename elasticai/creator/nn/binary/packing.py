@@ -0,0 +1,43 @@
+from typing import NamedTuple
+
+import torch
+
+from ._bit_packing import pack, unpack
+
+
+class PackedTensor(NamedTuple):
+    """Output of `Pack`, `words` holds `num_values` binary values packed
+    along `dim` into int64 words. Binary layers evaluate inputs of this type
+    with XNOR and popcount and return them packed again."""
+
+    words: torch.Tensor
+    num_values: int
+    dim: int
+
+
+class Pack(torch.nn.Module):
+    """Binarizes its input and packs it along `dim` into int64 words, the
+    format in which binary layers evaluate their inputs with XNOR and
+    popcount."""
+
+    def __init__(self, dim: int = -1) -> None:
+        super().__init__()
+        self.dim = dim
+
+    def forward(self, x: torch.Tensor) -> PackedTensor:
+        return PackedTensor(
+            words=pack(x, dim=self.dim), num_values=x.shape[self.dim], dim=self.dim
+        )
+
+
+class Unpack(torch.nn.Module):
+    """Converts `num_values` packed values along `dim` back to a float tensor
+    of `-1` and `+1`."""
+
+    def __init__(self, num_values: int, dim: int = -1) -> None:
+        super().__init__()
+        self.num_values = num_values
+        self.dim = dim
+
+    def forward(self, x: PackedTensor) -> torch.Tensor:
+        return unpack(x.words, num_values=self.num_values, dim=self.dim)
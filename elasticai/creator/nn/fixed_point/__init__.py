@@ -1,7 +1,14 @@
+from ._hardware_math_operations import HardwareMathOperations
+from ._integer_math_operations import IntegerMathOperations
+from ._two_complement_fixed_point_config import FixedPointConfig
 from .conv1d import BatchNormedConv1d, Conv1d
 from .hard_sigmoid import HardSigmoid
 from .hard_tanh import HardTanh
 from .linear import BatchNormedLinear, Linear
+from .piecewise_linear import PiecewiseLinear
+from .power_of_two import PowerOfTwoLinear
 from .precomputed import AdaptableSiLU, Sigmoid, Tanh
 from .quantization import quantize
 from .relu import ReLU
+from .sgd import SGD
+from .ternary import TernaryConv1d, TernaryLinear
@@ -0,0 +1,90 @@
+from typing import Optional, cast
+
+import torch
+
+from elasticai.creator.base_modules.quantized_parameter_cache import is_compiling
+from elasticai.creator.base_modules.straight_through import straight_through
+
+from ._two_complement_fixed_point_config import FixedPointConfig
+
+
+def fold_batch_norm(
+    weight: torch.Tensor,
+    bias: Optional[torch.Tensor],
+    batch_norm: torch.nn.modules.batchnorm._BatchNorm,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Weight and bias of a single linear layer or convolution that computes
+    the same as the given one followed by `batch_norm` in eval mode.
+    `weight` has the output features or channels in its first dimension."""
+    mean = cast(torch.Tensor, batch_norm.running_mean)
+    variance = cast(torch.Tensor, batch_norm.running_var)
+    scale = 1 / torch.sqrt(variance + batch_norm.eps)
+    shift = -mean * scale
+    if batch_norm.affine:
+        scale = batch_norm.weight * scale
+        shift = batch_norm.weight * shift + batch_norm.bias
+    if bias is not None:
+        shift = shift + bias * scale
+    return weight * scale.view(-1, *([1] * (weight.dim() - 1))), shift
+
+
+def round_to_grid(a: torch.Tensor, config: FixedPointConfig) -> torch.Tensor:
+    """Round to the nearest fixed point value like `config.as_integer` does
+    for a single float, and saturate."""
+    scale = 1 << config.frac_bits
+    integers = torch.clamp(
+        torch.round(a * scale),
+        min=config.minimum_as_integer,
+        max=config.maximum_as_integer,
+    )
+    return integers / scale
+
+
+class FoldedParameterCache:
+    """Folded weight and bias of a batch normed layer, rounded onto the fixed
+    point grid of `config`. They are recomputed whenever a parameter or a
+    running statistic of the module has changed.
+
+    If autograd needs them, they are computed anew and backpropagate straight
+    through the rounding into the parameters of the layer and the batch
+    normalization. The values are the same either way, so the output of the
+    layer does not depend on the grad mode. Tracing and compiling bypass the
+    cache as well.
+    """
+
+    def __init__(self, config: FixedPointConfig) -> None:
+        self._config = config
+        self._entry: Optional[tuple[tuple, tuple[torch.Tensor, torch.Tensor]]] = None
+
+    def get(
+        self,
+        module: torch.nn.Module,
+        weight: torch.Tensor,
+        bias: Optional[torch.Tensor],
+        batch_norm: torch.nn.modules.batchnorm._BatchNorm,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        needs_grad = torch.is_grad_enabled() and any(
+            p.requires_grad for p in module.parameters()
+        )
+        if needs_grad or torch.jit.is_tracing() or is_compiling():
+            folded = fold_batch_norm(weight, bias, batch_norm)
+            return cast(
+                tuple[torch.Tensor, torch.Tensor],
+                tuple(
+                    straight_through(round_to_grid(t.detach(), self._config), t)
+                    for t in folded
+                ),
+            )
+        tensors = list(module.parameters()) + list(module.buffers())
+        key = tuple((t.data_ptr(), t._version) for t in tensors)
+        if self._entry is None or self._entry[0] != key:
+            with torch.no_grad():
+                folded_weight, folded_bias = fold_batch_norm(weight, bias, batch_norm)
+                self._entry = (
+                    key,
+                    (
+                        round_to_grid(folded_weight, self._config),
+                        round_to_grid(folded_bias, self._config),
+                    ),
+                )
+        return self._entry[1]
@@ -0,0 +1,71 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+import torch
+
+from ._two_complement_fixed_point_config import FixedPointConfig
+
+
+@dataclass
+class GradientCounters:
+    """Number of gradient values that were saturated (`overflows`) or that
+    were not zero but got rounded to zero (`underflows`)."""
+
+    overflows: int = 0
+    underflows: int = 0
+
+    def reset(self) -> None:
+        self.overflows = 0
+        self.underflows = 0
+
+
+def quantize_gradient(
+    grad: torch.Tensor, config: FixedPointConfig, counters: GradientCounters
+) -> torch.Tensor:
+    """Round towards zero onto the grid of `config` and saturate, while
+    recording the rounding in `counters`."""
+    integers = torch.trunc(grad.to(torch.float64) * (1 << config.frac_bits)).to(
+        torch.int64
+    )
+    counters.overflows += int(config.integer_out_of_bounds(integers).sum())
+    counters.underflows += int(((integers == 0) & (grad != 0)).sum())
+    integers = torch.clamp(
+        integers, min=config.minimum_as_integer, max=config.maximum_as_integer
+    )
+    return integers.to(grad.dtype) / (1 << config.frac_bits)
+
+
+def quantize_parameter_gradients(
+    parameters: Iterable[torch.nn.Parameter],
+    config: FixedPointConfig,
+    counters: GradientCounters,
+) -> None:
+    """Parameters used several times in one forward pass, like the weights of a
+    recurrent layer, get the sum of all partial gradients. Saturate that sum
+    as well, like an accumulator of the gradient format would."""
+    for parameter in parameters:
+        parameter.register_hook(
+            partial(quantize_gradient, config=config, counters=counters)
+        )
+
+
+class QuantizeGradient(torch.autograd.Function):
+    """Identity in the forward pass, rounds the gradient towards zero onto the
+    grid of `config` and saturates it in the backward pass.
+
+    Call as `apply(x, config, counters)`, the rounding is recorded in
+    `counters`.
+    """
+
+    @staticmethod
+    def forward(ctx: Any, *args: Any, **kwargs: Any) -> torch.Tensor:
+        x: torch.Tensor = args[0]
+        ctx.config = args[1]
+        ctx.counters = args[2]
+        return x.view_as(x)
+
+    @staticmethod
+    def backward(ctx: Any, *grad_outputs: Any) -> Any:
+        return quantize_gradient(grad_outputs[0], ctx.config, ctx.counters), None, None
@@ -0,0 +1,129 @@
+import torch
+
+from tests.tensor_test_case import TensorTestCase
+
+from ._gradient_quantization import GradientCounters, QuantizeGradient
+from ._two_complement_fixed_point_config import FixedPointConfig
+from .conv1d import Conv1d
+from .linear import Linear
+from .lstm.layer import FixedPointLSTMWithHardActivations
+
+GRADIENT_CONFIG = FixedPointConfig(total_bits=8, frac_bits=6)
+
+
+def is_on_grid(values: torch.Tensor, config: FixedPointConfig) -> bool:
+    scaled = values * (1 << config.frac_bits)
+    return bool(torch.all(scaled == torch.trunc(scaled))) and bool(
+        torch.all(
+            (values >= config.minimum_as_rational)
+            & (values <= config.maximum_as_rational)
+        )
+    )
+
+
+class QuantizeGradientTest(TensorTestCase):
+    def test_forward_is_identity(self) -> None:
+        x = torch.tensor([0.3, -7.1])
+        actual = QuantizeGradient.apply(x, GRADIENT_CONFIG, GradientCounters())
+        self.assertTensorEqual(x, actual)
+
+    def test_rounds_gradient_towards_zero_and_saturates(self) -> None:
+        x = torch.zeros(4, requires_grad=True)
+        counters = GradientCounters()
+        y = QuantizeGradient.apply(x, GRADIENT_CONFIG, counters)
+        y.backward(torch.tensor([0.01, -0.05, 3.0, -0.5]))
+        self.assertTensorEqual([0.0, -0.046875, 1.984375, -0.5], x.grad)
+        self.assertEqual(GradientCounters(overflows=1, underflows=1), counters)
+
+    def test_counters_can_be_reset(self) -> None:
+        counters = GradientCounters(overflows=2, underflows=3)
+        counters.reset()
+        self.assertEqual(GradientCounters(), counters)
+
+
+class QuantizedBackwardTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(0)
+
+    def test_linear_gradients_are_on_gradient_grid(self) -> None:
+        linear = Linear(
+            in_features=4,
+            out_features=3,
+            total_bits=8,
+            frac_bits=4,
+            gradient_config=GRADIENT_CONFIG,
+        )
+        x = torch.randn(5, 4, requires_grad=True)
+        linear(x).sum().backward()
+        for grad in (x.grad, linear.weight.grad, linear.bias.grad):
+            self.assertTrue(is_on_grid(cast_grad(grad), GRADIENT_CONFIG))
+        self.assertGreater(linear.gradient_counters.overflows, 0)
+
+    def test_linear_keeps_float_gradients_by_default(self) -> None:
+        linear = Linear(in_features=4, out_features=3, total_bits=8, frac_bits=4)
+        x = torch.randn(5, 4)
+        linear(x).sum().backward()
+        self.assertTensorEqual(x.sum(dim=0).expand(3, 4), linear.weight.grad)
+        self.assertEqual(GradientCounters(), linear.gradient_counters)
+
+    def test_linear_counts_underflows(self) -> None:
+        linear = Linear(
+            in_features=4,
+            out_features=3,
+            total_bits=8,
+            frac_bits=4,
+            gradient_config=GRADIENT_CONFIG,
+        )
+        (linear(torch.randn(5, 4)).sum() * 1e-3).backward()
+        self.assertEqual(0, linear.gradient_counters.overflows)
+        self.assertGreater(linear.gradient_counters.underflows, 0)
+
+    def test_conv1d_gradients_are_on_gradient_grid(self) -> None:
+        conv = Conv1d(
+            total_bits=8,
+            frac_bits=4,
+            in_channels=2,
+            out_channels=3,
+            signal_length=6,
+            kernel_size=2,
+            gradient_config=GRADIENT_CONFIG,
+        )
+        (conv(torch.randn(2, 2, 6)).sum() * 0.1).backward()
+        for grad in (conv.weight.grad, conv.bias.grad):
+            self.assertTrue(is_on_grid(cast_grad(grad), GRADIENT_CONFIG))
+
+    def test_conv1d_quantizes_parameter_gradients(self) -> None:
+        conv = Conv1d(
+            total_bits=8,
+            frac_bits=4,
+            in_channels=2,
+            out_channels=3,
+            signal_length=6,
+            kernel_size=2,
+            gradient_config=GRADIENT_CONFIG,
+        )
+        (conv.weight.sum() * 1e-3 + conv.bias.sum() * 100).backward()
+        self.assertTensorEqual(torch.zeros_like(conv.weight), conv.weight.grad)
+        self.assertTensorEqual([1.984375] * 3, conv.bias.grad)
+        self.assertEqual(
+            GradientCounters(overflows=3, underflows=12), conv.gradient_counters
+        )
+
+    def test_lstm_gradients_are_on_gradient_grid(self) -> None:
+        lstm = FixedPointLSTMWithHardActivations(
+            total_bits=8,
+            frac_bits=4,
+            input_size=2,
+            hidden_size=3,
+            bias=True,
+            gradient_config=GRADIENT_CONFIG,
+        )
+        outputs, _ = lstm(torch.randn(2, 5, 2))
+        outputs.sum().backward()
+        for parameter in lstm.parameters():
+            self.assertTrue(is_on_grid(cast_grad(parameter.grad), GRADIENT_CONFIG))
+
+
+def cast_grad(grad: torch.Tensor | None) -> torch.Tensor:
+    assert grad is not None
+    return grad
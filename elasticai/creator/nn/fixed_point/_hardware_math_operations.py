@@ -0,0 +1,223 @@
+from typing import Optional
+
+import torch
+from torch import Tensor
+from torch.nn.functional import conv1d
+
+from elasticai.creator.base_modules.conv1d import MathOperations as Conv1dOps
+from elasticai.creator.base_modules.linear import MathOperations as LinearOps
+from elasticai.creator.base_modules.lstm_cell import MathOperations as LSTMOps
+
+from ._integer_math_operations import _accumulator_dtype
+from ._two_complement_fixed_point_config import FixedPointConfig
+
+
+class HardwareMathOperations(LinearOps, Conv1dOps, LSTMOps):
+    """Emulates the arithmetic of the generated VHDL bit by bit.
+
+    Inputs and outputs are rational tensors like for `MathOperations`, but
+    every result is computed on the integers the hardware sees:
+
+    - `matmul` and `conv1d` follow `fxp_mac.vhd`: products are summed up in a
+      wrapping `2*total_bits` accumulator (for `conv1d` including
+      `bias * FXP_ONE`) and cut down once.
+    - `linear` follows `linear.tpl.vhd`, which seeds the accumulator with
+      `bias * FXP_ONE` and uses a slightly different cut down.
+    - `mul` and `add` are `multiply` and the plain (wrapping) `+` of
+      `lstm_cell.tpl.vhd`, `lstm_cell` emulates the complete cell including
+      its hard sigmoid and hard tanh units.
+
+    `linear` and `lstm_cell` are used by the `Linear` and `LSTMCell` of
+    `base_modules` in place of their generic computations, so layers built on
+    these operations emulate the templates, too.
+
+    Both cut downs round towards zero and saturate based on the sign of the
+    accumulator, so overflows of the accumulator itself go unnoticed.
+    In `fxp_mac.vhd` accumulators in the open interval `(-1, 0)` (measured in
+    units of the output's least significant bit) saturate to the minimum.
+    """
+
+    def __init__(self, config: FixedPointConfig) -> None:
+        self.config = config
+        self._total_bits = config.total_bits
+        self._frac_bits = config.frac_bits
+        self._scale = float(1 << config.frac_bits)
+        self._fxp_one = self._wrap(torch.tensor(1 << config.frac_bits)).item()
+
+    def as_integer(self, a: Tensor) -> Tensor:
+        clamped = torch.clamp(
+            a, min=self.config.minimum_as_rational, max=self.config.maximum_as_rational
+        )
+        return torch.trunc(clamped * self._scale).to(torch.int64)
+
+    def as_rational(self, a: Tensor) -> Tensor:
+        return a.to(torch.float32) / self._scale
+
+    def quantize(self, a: Tensor) -> Tensor:
+        return self.as_rational(self.as_integer(a))
+
+    def add(self, a: Tensor, b: Tensor) -> Tensor:
+        return self.as_rational(self._add(self.as_integer(a), self.as_integer(b)))
+
+    def mul(self, a: Tensor, b: Tensor) -> Tensor:
+        return self.as_rational(self._multiply(self.as_integer(a), self.as_integer(b)))
+
+    def matmul(self, a: Tensor, b: Tensor) -> Tensor:
+        accumulator = self._integer_matmul(self.as_integer(a), self.as_integer(b))
+        return self.as_rational(self._mac_cut_down(accumulator))
+
+    def linear(self, x: Tensor, weight: Tensor, bias: Optional[Tensor]) -> Tensor:
+        accumulator = self._integer_matmul(
+            self.as_integer(x), self.as_integer(weight).T
+        )
+        if bias is not None:
+            accumulator = self._wrap_accumulator(
+                accumulator + self.as_integer(bias) * self._fxp_one
+            )
+        return self.as_rational(self._cut_down(accumulator))
+
+    def conv1d(
+        self,
+        x: Tensor,
+        weight: Tensor,
+        bias: Tensor | None,
+        stride: tuple[int, ...],
+        padding: tuple[int, ...] | str,
+        dilation: tuple[int, ...],
+        groups: int,
+    ) -> Tensor:
+        accumulator_type = _accumulator_dtype(
+            self._total_bits, num_summands=weight.shape[1] * weight.shape[2] + 1
+        )
+        accumulator = conv1d(
+            input=self.as_integer(x).to(accumulator_type),
+            weight=self.as_integer(weight).to(accumulator_type),
+            bias=(
+                None
+                if bias is None
+                else (self.as_integer(bias) * self._fxp_one).to(accumulator_type)
+            ),
+            stride=stride,
+            padding=padding,
+            dilation=dilation,
+            groups=groups,
+        )
+        accumulator = self._wrap_accumulator(accumulator.to(torch.int64))
+        return self.as_rational(self._mac_cut_down(accumulator))
+
+    def hard_sigmoid(self, x: Tensor) -> Tensor:
+        return self.as_rational(self._hard_sigmoid(self.as_integer(x)))
+
+    def hard_tanh(self, x: Tensor, min_val: float = -1, max_val: float = 1) -> Tensor:
+        return self.as_rational(
+            self._hard_tanh(self.as_integer(x), min_val=min_val, max_val=max_val)
+        )
+
+    def lstm_cell(
+        self,
+        x: Tensor,
+        state: Optional[tuple[Tensor, Tensor]],
+        weight_ih: Tensor,
+        weight_hh: Tensor,
+        bias_ih: Optional[Tensor],
+        bias_hh: Optional[Tensor],
+    ) -> tuple[Tensor, Tensor]:
+        """One step of `lstm_cell.tpl.vhd`, `state=None` corresponds to `zero_state`.
+
+        Each gate is a single dot product over the concatenation of `x` and `h`
+        that is cut down once before the combined bias `b_ih + b_hh` is added.
+        """
+        hidden_size = weight_hh.shape[1]
+        x = self.as_integer(x)
+        if state is None:
+            h_prev = torch.zeros(*x.shape[:-1], hidden_size, dtype=torch.int64)
+            c_prev = torch.zeros_like(h_prev)
+        else:
+            h_prev, c_prev = self.as_integer(state[0]), self.as_integer(state[1])
+
+        weights = torch.cat(
+            (self.as_integer(weight_ih), self.as_integer(weight_hh)), dim=1
+        )
+        dot_products = self._integer_matmul(torch.cat((x, h_prev), dim=-1), weights.T)
+        gates = self._cut_down(dot_products)
+        if bias_ih is not None and bias_hh is not None:
+            bias = self._wrap(self.as_integer(bias_ih) + self.as_integer(bias_hh))
+            gates = self._add(gates, bias)
+
+        i, f, g, o = torch.split(gates, hidden_size, dim=-1)
+        i, f, o = self._hard_sigmoid(i), self._hard_sigmoid(f), self._hard_sigmoid(o)
+        g = self._hard_tanh(g)
+
+        c = self._add(self._multiply(f, c_prev), self._multiply(i, g))
+        h = self._multiply(o, self._hard_tanh(c))
+        return self.as_rational(h), self.as_rational(c)
+
+    def _wrap(self, a: Tensor, bits: Optional[int] = None) -> Tensor:
+        bits = self._total_bits if bits is None else bits
+        if bits >= 64:
+            return a
+        offset = 1 << (bits - 1)
+        return torch.remainder(a + offset, 1 << bits) - offset
+
+    def _wrap_accumulator(self, a: Tensor) -> Tensor:
+        return self._wrap(a, 2 * self._total_bits)
+
+    def _integer_matmul(self, a: Tensor, b: Tensor) -> Tensor:
+        accumulator_type = _accumulator_dtype(self._total_bits, a.shape[-1])
+        accumulator = torch.matmul(a.to(accumulator_type), b.to(accumulator_type))
+        return self._wrap_accumulator(accumulator.to(torch.int64))
+
+    def _slice_result_bits(self, accumulator: Tensor) -> Tensor:
+        """Bits `total_bits+frac_bits-1 downto frac_bits`, plus one if negative
+        and any of the dropped fractional bits is set."""
+        result = self._wrap(torch.bitwise_right_shift(accumulator, self._frac_bits))
+        if self._frac_bits == 0:
+            return result
+        dropped_fractional_part = torch.bitwise_and(
+            accumulator, (1 << self._frac_bits) - 1
+        )
+        return result + ((result < 0) & (dropped_fractional_part != 0)).to(torch.int64)
+
+    def _cut_down(self, accumulator: Tensor) -> Tensor:
+        """`cut_down` of `linear.tpl.vhd`, also `cut` of `lstm_cell.tpl.vhd`."""
+        result = self._slice_result_bits(accumulator)
+        result = torch.where(
+            (accumulator > 0) & (result < 0), self.config.maximum_as_integer, result
+        )
+        return torch.where(
+            (accumulator < 0) & (result > 0), self.config.minimum_as_integer, result
+        )
+
+    def _mac_cut_down(self, accumulator: Tensor) -> Tensor:
+        """`cut_down` of `fxp_mac.vhd`."""
+        result = self._slice_result_bits(accumulator)
+        result = torch.where(
+            (accumulator < 0) & (result >= 0), self.config.minimum_as_integer, result
+        )
+        return torch.where(
+            (accumulator >= 0) & (result < 0), self.config.maximum_as_integer, result
+        )
+
+    def _add(self, a: Tensor, b: Tensor) -> Tensor:
+        return self._wrap(a + b)
+
+    def _multiply(self, a: Tensor, b: Tensor) -> Tensor:
+        return self._cut_down(self._wrap_accumulator(a * b))
+
+    def _hard_tanh(self, x: Tensor, min_val: float = -1, max_val: float = 1) -> Tensor:
+        minimum = self._constant(min_val)
+        maximum = self._constant(max_val)
+        x = torch.where(x <= minimum, minimum, x)
+        return torch.where(x >= maximum, maximum, x)
+
+    def _hard_sigmoid(self, x: Tensor) -> Tensor:
+        slope = self._constant(1 / 6)
+        y_intercept = self._constant(0.5)
+        linear = self._add(self._multiply(x, slope), y_intercept)
+        y = torch.where(x >= self._constant(3), self._constant(1), linear)
+        return torch.where(x <= self._constant(-3), 0, y)
+
+    def _constant(self, value: float) -> int:
+        """Generic of a design, converted like `create_design` does and
+        truncated to `total_bits` like `to_signed` in the VHDL code."""
+        return int(self._wrap(torch.tensor(self.config.as_integer(value))).item())
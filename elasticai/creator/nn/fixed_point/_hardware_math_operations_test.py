@@ -0,0 +1,306 @@
+import pytest
+import torch
+
+from elasticai.creator.base_modules.linear import Linear
+from elasticai.creator.base_modules.lstm import LSTM
+from elasticai.creator.base_modules.lstm_cell import LSTMCell
+from tests.tensor_test_case import TensorTestCase
+
+from ._hardware_math_operations import HardwareMathOperations
+from ._two_complement_fixed_point_config import FixedPointConfig
+
+TOTAL_BITS = 8
+FRAC_BITS = 3
+
+
+def to_signed(value: int, bits: int) -> int:
+    value &= (1 << bits) - 1
+    return value - (1 << bits) if value >> (bits - 1) else value
+
+
+def cut_down(x: int) -> int:
+    """Literal translation of `cut_down` in linear.tpl.vhd."""
+    temp2 = to_signed(x >> FRAC_BITS, TOTAL_BITS)
+    temp3 = x & ((1 << FRAC_BITS) - 1)
+    if temp2 < 0 and temp3 != 0:
+        temp2 += 1
+    if x > 0 and temp2 < 0:
+        temp2 = (1 << (TOTAL_BITS - 1)) - 1
+    elif x < 0 and temp2 > 0:
+        temp2 = -(1 << (TOTAL_BITS - 1))
+    return temp2
+
+
+def mac_cut_down(x: int) -> int:
+    """Literal translation of `cut_down` in fxp_mac.vhd."""
+    result = to_signed(x >> FRAC_BITS, TOTAL_BITS)
+    dropped_fractional_part = x & ((1 << FRAC_BITS) - 1)
+    if result < 0 and dropped_fractional_part != 0:
+        result += 1
+    if x < 0 and result >= 0:
+        result = -(1 << (TOTAL_BITS - 1))
+    elif x >= 0 and result < 0:
+        result = (1 << (TOTAL_BITS - 1)) - 1
+    return result
+
+
+def multiply_accumulate(pairs: list[tuple[int, int]]) -> int:
+    accumulator = 0
+    for a, b in pairs:
+        accumulator = to_signed(accumulator + a * b, 2 * TOTAL_BITS)
+    return accumulator
+
+
+def random_integers(*shape: int) -> torch.Tensor:
+    low, high = -(1 << (TOTAL_BITS - 1)), 1 << (TOTAL_BITS - 1)
+    return torch.randint(low, high, shape)
+
+
+class HardwareMathOperationsTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(0)
+        self.operations = HardwareMathOperations(
+            FixedPointConfig(total_bits=TOTAL_BITS, frac_bits=FRAC_BITS)
+        )
+
+    def rational(self, integers: torch.Tensor) -> torch.Tensor:
+        return self.operations.as_rational(integers)
+
+    def integers(self, rational: torch.Tensor) -> list:
+        return self.operations.as_integer(rational).tolist()
+
+    def test_linear_matches_linear_template(self) -> None:
+        x, weight, bias = (
+            random_integers(16, 5),
+            random_integers(3, 5),
+            random_integers(3),
+        )
+        fxp_one = 1 << FRAC_BITS
+        expected = [
+            [
+                cut_down(
+                    multiply_accumulate(
+                        [(fxp_one, bias[j].item())]
+                        + list(zip(weight[j].tolist(), x[i].tolist()))
+                    )
+                )
+                for j in range(3)
+            ]
+            for i in range(16)
+        ]
+
+        actual = self.operations.linear(
+            self.rational(x), self.rational(weight), self.rational(bias)
+        )
+
+        self.assertEqual(expected, self.integers(actual))
+
+    def test_matmul_matches_mac(self) -> None:
+        a, b = random_integers(16, 4), random_integers(4, 2)
+        expected = [
+            [
+                mac_cut_down(multiply_accumulate(list(zip(row, column))))
+                for column in b.T.tolist()
+            ]
+            for row in a.tolist()
+        ]
+
+        actual = self.operations.matmul(self.rational(a), self.rational(b))
+
+        self.assertEqual(expected, self.integers(actual))
+
+    def test_mac_saturates_tiny_negative_results_to_minimum(self) -> None:
+        actual = self.operations.matmul(
+            self.rational(torch.tensor([[-1]])), self.rational(torch.tensor([[1]]))
+        )
+        self.assertEqual([[-(1 << (TOTAL_BITS - 1))]], self.integers(actual))
+
+    def test_conv1d_matches_mac_with_bias(self) -> None:
+        x, weight, bias = (
+            random_integers(2, 2, 6),
+            random_integers(3, 2, 3),
+            random_integers(3),
+        )
+        fxp_one = 1 << FRAC_BITS
+        expected = [
+            [
+                [
+                    mac_cut_down(
+                        multiply_accumulate(
+                            [
+                                (x[n, c, t + k].item(), weight[o, c, k].item())
+                                for c in range(2)
+                                for k in range(3)
+                            ]
+                            + [(fxp_one, bias[o].item())]
+                        )
+                    )
+                    for t in range(4)
+                ]
+                for o in range(3)
+            ]
+            for n in range(2)
+        ]
+
+        actual = self.operations.conv1d(
+            self.rational(x),
+            self.rational(weight),
+            self.rational(bias),
+            stride=(1,),
+            padding=(0,),
+            dilation=(1,),
+            groups=1,
+        )
+
+        self.assertEqual(expected, self.integers(actual))
+
+    def test_add_wraps_around(self) -> None:
+        actual = self.operations.add(torch.tensor([15.0]), torch.tensor([1.0]))
+        self.assertTensorEqual([-16.0], actual)
+
+    def test_mul_rounds_towards_zero(self) -> None:
+        actual = self.operations.mul(torch.tensor([-0.375, 0.375]), torch.tensor([0.5]))
+        self.assertTensorEqual([-0.125, 0.125], actual)
+
+    def test_hard_sigmoid_uses_template_constants(self) -> None:
+        actual = self.operations.hard_sigmoid(torch.tensor([-4.0, -1.0, 0.0, 1.0, 4.0]))
+        self.assertTensorEqual([0.0, 0.375, 0.5, 0.625, 1.0], actual)
+
+    def test_lstm_cell_matches_lstm_cell_template(self) -> None:
+        input_size, hidden_size = 2, 3
+        x = random_integers(4, input_size) // 4
+        h, c = (
+            random_integers(4, hidden_size) // 4,
+            random_integers(4, hidden_size) // 4,
+        )
+        w_ih = random_integers(4 * hidden_size, input_size) // 4
+        w_hh = random_integers(4 * hidden_size, hidden_size) // 4
+        b_ih, b_hh = random_integers(4 * hidden_size), random_integers(4 * hidden_size)
+
+        actual_h, actual_c = self.operations.lstm_cell(
+            self.rational(x),
+            (self.rational(h), self.rational(c)),
+            self.rational(w_ih),
+            self.rational(w_hh),
+            self.rational(b_ih),
+            self.rational(b_hh),
+        )
+
+        one = 1 << FRAC_BITS
+
+        def multiply(a: int, b: int) -> int:
+            return cut_down(a * b)
+
+        def hard_sigmoid(a: int) -> int:
+            if a <= -3 * one:
+                return 0
+            if a >= 3 * one:
+                return one
+            return to_signed(multiply(a, round(one / 6)) + round(one / 2), TOTAL_BITS)
+
+        def hard_tanh(a: int) -> int:
+            return min(max(a, -one), one)
+
+        expected_h, expected_c = [], []
+        for n in range(4):
+            x_h = x[n].tolist() + h[n].tolist()
+            gates = []
+            for row in range(4 * hidden_size):
+                weights = w_ih[row].tolist() + w_hh[row].tolist()
+                bias = to_signed(b_ih[row].item() + b_hh[row].item(), TOTAL_BITS)
+                dot = cut_down(multiply_accumulate(list(zip(x_h, weights))))
+                gates.append(to_signed(dot + bias, TOTAL_BITS))
+            i, f, g, o = (
+                gates[k * hidden_size : (k + 1) * hidden_size] for k in range(4)
+            )
+            new_c = [
+                to_signed(
+                    multiply(hard_sigmoid(f[k]), c[n, k].item())
+                    + multiply(hard_sigmoid(i[k]), hard_tanh(g[k])),
+                    TOTAL_BITS,
+                )
+                for k in range(hidden_size)
+            ]
+            expected_c.append(new_c)
+            expected_h.append(
+                [
+                    multiply(hard_sigmoid(o[k]), hard_tanh(new_c[k]))
+                    for k in range(hidden_size)
+                ]
+            )
+
+        self.assertEqual(expected_h, self.integers(actual_h))
+        self.assertEqual(expected_c, self.integers(actual_c))
+
+    def test_linear_layer_uses_linear_template(self) -> None:
+        layer = Linear(
+            in_features=5, out_features=3, operations=self.operations, bias=True
+        )
+        x = self.rational(random_integers(16, 5))
+        with torch.no_grad():
+            layer.weight.copy_(self.rational(random_integers(3, 5)))
+            layer.bias.copy_(self.rational(random_integers(3)))
+            actual = layer(x)
+        expected = self.operations.linear(x, layer.weight, layer.bias)
+        self.assertTensorEqual(expected, actual)
+
+    def test_lstm_layer_uses_lstm_cell_template(self) -> None:
+        lstm = LSTM(
+            input_size=2,
+            hidden_size=3,
+            bias=True,
+            batch_first=True,
+            layers=_HardwareLayers(self.operations),
+        )
+        for parameter in lstm.parameters():
+            with torch.no_grad():
+                parameter.copy_(self.rational(random_integers(*parameter.shape) // 4))
+        x = self.rational(random_integers(2, 4, 2) // 4)
+        cell = lstm.cell
+
+        with torch.no_grad():
+            outputs, _ = lstm(x)
+            state = None
+            for t in range(4):
+                state = self.operations.lstm_cell(
+                    x[:, t],
+                    state,
+                    cell.linear_ih.weight,
+                    cell.linear_hh.weight,
+                    cell.linear_ih.bias,
+                    cell.linear_hh.bias,
+                )
+                self.assertTensorEqual(state[0], outputs[:, t])
+
+
+class _HardwareLayers:
+    def __init__(self, operations: HardwareMathOperations) -> None:
+        self.operations = operations
+
+    def lstm(self, input_size: int, hidden_size: int, bias: bool) -> LSTMCell:
+        return LSTMCell(
+            input_size=input_size,
+            hidden_size=hidden_size,
+            bias=bias,
+            operations=self.operations,
+            sigmoid_factory=torch.nn.Identity,
+            tanh_factory=torch.nn.Identity,
+        )
+
+
+@pytest.mark.parametrize(
+    "x1, x2, expected",
+    [
+        ((0.5, 0.5), (0.5, 0.5), 0.5),
+        ((-0.25, -1.0), (0.5, 0.5), -0.5),
+        ((-4.0, -4.0), (3.75, 3.75), -4.0),
+        ((1.5, -1.0), (0.5, 2.0), -1.25),
+        ((3.75, 1.0), (1.0, 1.0), 3.75),
+    ],
+)
+def test_matmul_matches_mac_simulation(
+    x1: tuple[float, float], x2: tuple[float, float], expected: float
+) -> None:
+    # same vectors as the GHDL simulation in mac/_hw_test.py
+    operations = HardwareMathOperations(FixedPointConfig(total_bits=5, frac_bits=2))
+    assert expected == operations.matmul(torch.tensor(x1), torch.tensor(x2)).item()
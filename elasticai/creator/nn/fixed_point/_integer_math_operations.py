@@ -0,0 +1,108 @@
+import torch
+from torch import Tensor
+from torch.nn.functional import conv1d
+
+from elasticai.creator.base_modules.conv1d import MathOperations as Conv1dOps
+from elasticai.creator.base_modules.gru_cell import MathOperations as GRUOps
+from elasticai.creator.base_modules.linear import MathOperations as LinearOps
+from elasticai.creator.base_modules.lstm_cell import MathOperations as LSTMOps
+
+from ._two_complement_fixed_point_config import FixedPointConfig
+
+_EXACT_FLOAT64_BITS = 53
+
+
+def _accumulator_dtype(total_bits: int, num_summands: int) -> torch.dtype:
+    """float64 GEMMs are much faster than int64 ones and still exact, as long as
+    every partial sum of `num_summands` products fits into the 53 bit mantissa.
+    """
+    product_bits = 2 * (total_bits - 1)
+    if product_bits + num_summands.bit_length() <= _EXACT_FLOAT64_BITS:
+        return torch.float64
+    return torch.int64
+
+
+def _storage_dtype(total_bits: int) -> torch.dtype:
+    if total_bits <= 16:
+        return torch.int16
+    if total_bits <= 32:
+        return torch.int32
+    return torch.int64
+
+
+class IntegerMathOperations(LinearOps, Conv1dOps, LSTMOps, GRUOps):
+    """Fixed point arithmetic on raw two's complement integers.
+
+    Activations and weights are kept as int16/int32 tensors holding the
+    fixed point values scaled by `2**frac_bits`. Products are accumulated with
+    `2 * frac_bits` fractional bits and requantized (round towards zero,
+    saturate) once per operation, which yields the same results as
+    `MathOperations` without any float round trips in between.
+    Use `as_integer` and `as_rational` to convert at the edges of a model.
+    """
+
+    def __init__(self, config: FixedPointConfig) -> None:
+        self.config = config
+        self.dtype = _storage_dtype(config.total_bits)
+        self._one = 1 << config.frac_bits
+        self._min = config.minimum_as_integer
+        self._max = config.maximum_as_integer
+
+    def as_integer(self, a: Tensor) -> Tensor:
+        clamped = torch.clamp(
+            a, min=self.config.minimum_as_rational, max=self.config.maximum_as_rational
+        )
+        return torch.trunc(clamped * self._one).to(self.dtype)
+
+    def as_rational(self, a: Tensor) -> Tensor:
+        return a.to(torch.float32) / self._one
+
+    def quantize(self, a: Tensor) -> Tensor:
+        if a.is_floating_point():
+            return self.as_integer(a)
+        return self._saturate(a)
+
+    def add(self, a: Tensor, b: Tensor) -> Tensor:
+        return self._saturate(a.to(torch.int64) + b.to(torch.int64))
+
+    def mul(self, a: Tensor, b: Tensor) -> Tensor:
+        return self._requantize(a.to(torch.int64) * b.to(torch.int64))
+
+    def matmul(self, a: Tensor, b: Tensor) -> Tensor:
+        accumulator_type = _accumulator_dtype(self.config.total_bits, a.shape[-1])
+        accumulator = torch.matmul(a.to(accumulator_type), b.to(accumulator_type))
+        return self._requantize(accumulator.to(torch.int64))
+
+    def conv1d(
+        self,
+        x: Tensor,
+        weight: Tensor,
+        bias: Tensor | None,
+        stride: tuple[int, ...],
+        padding: tuple[int, ...] | str,
+        dilation: tuple[int, ...],
+        groups: int,
+    ) -> Tensor:
+        accumulator_type = _accumulator_dtype(
+            self.config.total_bits, num_summands=weight.shape[1] * weight.shape[2] + 1
+        )
+        accumulator = conv1d(
+            input=x.to(accumulator_type),
+            weight=weight.to(accumulator_type),
+            bias=(
+                None
+                if bias is None
+                else bias.to(accumulator_type) * self._one  # type: ignore
+            ),
+            stride=stride,
+            padding=padding,
+            dilation=dilation,
+            groups=groups,
+        )
+        return self._requantize(accumulator.to(torch.int64))
+
+    def _saturate(self, a: Tensor) -> Tensor:
+        return torch.clamp(a, min=self._min, max=self._max).to(self.dtype)
+
+    def _requantize(self, accumulator: Tensor) -> Tensor:
+        return self._saturate(torch.div(accumulator, self._one, rounding_mode="trunc"))
@@ -0,0 +1,113 @@
+import torch
+
+from elasticai.creator.base_modules.conv1d import Conv1d
+from elasticai.creator.base_modules.linear import Linear
+from elasticai.creator.base_modules.lstm_cell import LSTMCell
+from tests.tensor_test_case import TensorTestCase
+
+from ._integer_math_operations import IntegerMathOperations
+from ._math_operations import MathOperations
+from ._two_complement_fixed_point_config import FixedPointConfig
+from .hard_sigmoid import HardSigmoid
+from .hard_tanh import HardTanh
+
+
+class IntegerMathOperationsTest(TensorTestCase):
+    def setUp(self) -> None:
+        self.config = FixedPointConfig(total_bits=4, frac_bits=2)
+        self.operations = IntegerMathOperations(config=self.config)
+
+    def integers(self, values: list) -> torch.Tensor:
+        return self.operations.as_integer(torch.tensor(values))
+
+    def test_values_are_stored_as_int16(self) -> None:
+        actual = self.operations.quantize(torch.tensor([1.0]))
+        self.assertEqual(torch.int16, actual.dtype)
+
+    def test_quantize_clamps_minus5_to_minus8(self) -> None:
+        actual = self.operations.quantize(torch.tensor([-5.0]))
+        self.assertTensorEqual([-8], actual)
+
+    def test_quantize_rounds_1_1_to_4(self) -> None:
+        actual = self.operations.quantize(torch.tensor([1.1]))
+        self.assertTensorEqual([4], actual)
+
+    def test_quantize_saturates_integers(self) -> None:
+        actual = self.operations.quantize(torch.tensor([-20, 3, 20]))
+        self.assertTensorEqual([-8, 3, 7], actual)
+
+    def test_add(self) -> None:
+        a = self.integers([-0.25, 0.5, 1.0])
+        b = self.integers([-1.5, 1.0, 1.5])
+        actual = self.operations.as_rational(self.operations.add(a, b))
+        self.assertTensorEqual([-1.75, 1.5, 1.75], actual)
+
+    def test_matmul(self) -> None:
+        a = self.integers([[-2.0, -1.75, -1.5], [-0.25, 0.0, 0.25], [1.25, 1.5, 1.75]])
+        b = self.integers([[-0.25], [0.5], [0.25]])
+        actual = self.operations.as_rational(self.operations.matmul(a, b))
+        self.assertTensorEqual([[-0.75], [0.0], [0.75]], actual)
+
+    def test_mul(self) -> None:
+        a = self.integers([-0.5, 1.5, 0.5])
+        b = self.integers([0.5, 1.5, 1.25])
+        actual = self.operations.as_rational(self.operations.mul(a, b))
+        self.assertTensorEqual([-0.25, 1.75, 0.5], actual)
+
+
+class IntegerDomainLayersTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(0)
+        self.config = FixedPointConfig(total_bits=8, frac_bits=4)
+        self.integer_ops = IntegerMathOperations(self.config)
+        self.float_ops = MathOperations(self.config)
+
+    def inputs(self, *shape: int) -> torch.Tensor:
+        return self.float_ops.quantize(torch.randn(*shape) * 2)
+
+    def test_linear_matches_float_domain(self) -> None:
+        float_linear = Linear(5, 3, operations=self.float_ops, bias=True)
+        integer_linear = Linear(5, 3, operations=self.integer_ops, bias=True)
+        integer_linear.load_state_dict(float_linear.state_dict())
+        x = self.inputs(4, 5)
+
+        expected = float_linear(x)
+        actual = self.integer_ops.as_rational(
+            integer_linear(self.integer_ops.as_integer(x))
+        )
+
+        self.assertTensorEqual(expected, actual)
+
+    def test_conv1d_matches_float_domain(self) -> None:
+        float_conv = Conv1d(
+            self.float_ops, in_channels=2, out_channels=3, kernel_size=3
+        )
+        integer_conv = Conv1d(
+            self.integer_ops, in_channels=2, out_channels=3, kernel_size=3
+        )
+        integer_conv.load_state_dict(float_conv.state_dict())
+        x = self.inputs(2, 2, 10)
+
+        expected = float_conv(x)
+        actual = self.integer_ops.as_rational(
+            integer_conv(self.integer_ops.as_integer(x))
+        )
+
+        self.assertTensorEqual(expected, actual)
+
+    def test_lstm_cell_keeps_integer_state(self) -> None:
+        def activation(constructor):
+            return lambda: constructor(total_bits=8, frac_bits=4)
+
+        cell = LSTMCell(
+            input_size=2,
+            hidden_size=3,
+            bias=True,
+            operations=self.integer_ops,
+            sigmoid_factory=activation(HardSigmoid),
+            tanh_factory=activation(HardTanh),
+        )
+        h, c = cell(self.integer_ops.as_integer(self.inputs(4, 2)))
+
+        self.assertEqual((torch.int16, torch.int16), (h.dtype, c.dtype))
+        self.assertEqual((4, 3), tuple(h.shape))
@@ -0,0 +1,45 @@
+from functools import cache
+
+import torch
+
+WIDTH = 16
+TAPS = 0xB400  # x^16 + x^14 + x^13 + x^11 + 1, maximal length
+_PERIOD = (1 << WIDTH) - 1
+
+
+@cache
+def _sequence() -> tuple[torch.Tensor, torch.Tensor]:
+    states = [1]
+    for _ in range(_PERIOD - 1):
+        state = states[-1]
+        states.append((state >> 1) ^ (TAPS if state & 1 else 0))
+    sequence = torch.tensor(states, dtype=torch.int64)
+    positions = torch.zeros(1 << WIDTH, dtype=torch.int64)
+    positions[sequence] = torch.arange(_PERIOD)
+    return sequence, positions
+
+
+class LinearFeedbackShiftRegister:
+    """16 bit Galois LFSR, the random source of the `StochasticRounding` design.
+
+    `next(count)` returns the states the hardware register runs through in the
+    next `count` clock cycles, starting with the current one. The states are
+    looked up in a precomputed table instead of being shifted one by one.
+    """
+
+    def __init__(self, seed: int = 1) -> None:
+        if not 0 < seed < (1 << WIDTH):
+            raise ValueError(f"seed must be in [1, {_PERIOD}], but is {seed}")
+        _, positions = _sequence()
+        self._position = int(positions[seed].item())
+
+    @property
+    def state(self) -> int:
+        sequence, _ = _sequence()
+        return int(sequence[self._position].item())
+
+    def next(self, count: int) -> torch.Tensor:
+        sequence, _ = _sequence()
+        indices = torch.remainder(torch.arange(count) + self._position, _PERIOD)
+        self._position = (self._position + count) % _PERIOD
+        return sequence[indices]
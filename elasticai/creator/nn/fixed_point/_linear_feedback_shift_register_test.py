@@ -0,0 +1,32 @@
+import pytest
+
+from ._linear_feedback_shift_register import WIDTH, LinearFeedbackShiftRegister
+
+
+def shift(state: int) -> int:
+    return (state >> 1) ^ (0xB400 if state & 1 else 0)
+
+
+def test_starts_with_seed() -> None:
+    assert [0xACE1] == LinearFeedbackShiftRegister(seed=0xACE1).next(1).tolist()
+
+
+def test_matches_shifting_the_register() -> None:
+    lfsr = LinearFeedbackShiftRegister(seed=0xACE1)
+    expected = [0xACE1]
+    for _ in range(9):
+        expected.append(shift(expected[-1]))
+    assert expected == lfsr.next(4).tolist() + lfsr.next(6).tolist()
+
+
+def test_has_maximal_period() -> None:
+    lfsr = LinearFeedbackShiftRegister(seed=1)
+    states = lfsr.next((1 << WIDTH) - 1)
+    assert len(set(states.tolist())) == (1 << WIDTH) - 1
+    assert 1 == lfsr.state
+
+
+@pytest.mark.parametrize("seed", [0, 1 << WIDTH])
+def test_rejects_invalid_seed(seed: int) -> None:
+    with pytest.raises(ValueError):
+        LinearFeedbackShiftRegister(seed=seed)
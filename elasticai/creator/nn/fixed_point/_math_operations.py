@@ -1,36 +1,187 @@
-from typing import cast
-
 import torch
 from torch import Tensor
+from torch.nn.functional import conv1d
 
 from elasticai.creator.base_modules.conv1d import MathOperations as Conv1dOps
+from elasticai.creator.base_modules.gru_cell import MathOperations as GRUOps
 from elasticai.creator.base_modules.linear import MathOperations as LinearOps
 from elasticai.creator.base_modules.lstm_cell import MathOperations as LSTMOps
+from elasticai.creator.base_modules.straight_through import straight_through
 
-from ._round_to_fixed_point import RoundToFixedPoint
+from ._gradient_quantization import GradientCounters, QuantizeGradient
+from ._hardware_math_operations import HardwareMathOperations
+from ._linear_feedback_shift_register import WIDTH as LFSR_WIDTH
+from ._linear_feedback_shift_register import LinearFeedbackShiftRegister
 from ._two_complement_fixed_point_config import FixedPointConfig
 
 
-class MathOperations(LinearOps, Conv1dOps, LSTMOps):
-    def __init__(self, config: FixedPointConfig) -> None:
+class MathOperations(LinearOps, Conv1dOps, LSTMOps, GRUOps):
+    """Fixed point arithmetic on rational tensors.
+
+    `config` describes activations, `parameter_config` (defaults to `config`)
+    weights and biases. Either of them can select stochastic rounding, which
+    draws its random numbers from a `LinearFeedbackShiftRegister` seeded with
+    `seed`, so it yields the same results as the `StochasticRounding` design.
+
+    If `gradient_config` is given, the backward pass is emulated in that
+    format as well: the gradients of all operands and results are rounded
+    towards zero and saturated, rounding errors are counted in
+    `gradient_counters`.
+    """
+
+    def __init__(
+        self,
+        config: FixedPointConfig,
+        parameter_config: FixedPointConfig | None = None,
+        seed: int = 1,
+        gradient_config: FixedPointConfig | None = None,
+    ) -> None:
         self.config = config
+        self.gradient_config = gradient_config
+        self.gradient_counters = GradientCounters()
+        self._minimum = config.minimum_as_rational
+        self._maximum = config.maximum_as_rational
+        self._scale = float(1 << config.frac_bits)
+        self._lfsr = LinearFeedbackShiftRegister(seed)
+        self._hardware = HardwareMathOperations(config)
+        self._parameter_operations = (
+            self
+            if parameter_config is None or parameter_config == config
+            else MathOperations(parameter_config, seed=seed)
+        )
 
-    def quantize(self, a: torch.Tensor) -> torch.Tensor:
-        return self._round(self._clamp(a))
+    @property
+    def lfsr_state(self) -> int:
+        """State of the LFSR that stochastic rounding draws from next."""
+        return self._lfsr.state
 
-    def _clamp(self, a: torch.Tensor) -> torch.Tensor:
-        return torch.clamp(
-            a, min=self.config.minimum_as_rational, max=self.config.maximum_as_rational
+    def load_lfsr_state(self, state: int) -> None:
+        """Continue stochastic rounding from `state`, e.g., one exported by
+        `lfsr_state`."""
+        self._lfsr = LinearFeedbackShiftRegister(state)
+
+    @property
+    def parameter_config(self) -> FixedPointConfig:
+        return self._parameter_operations.config
+
+    def quantize_parameter(self, a: torch.Tensor) -> torch.Tensor:
+        return self._parameter_operations.quantize(a)
+
+    def quantize(
+        self, a: torch.Tensor, out: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """Clamp and round `a` onto the fixed point grid.
+
+        Without autograd the clamp, round and rescale steps run as in-place
+        passes over a single buffer. That buffer is `out` if given (`out=a`
+        is allowed), otherwise one new tensor.
+        """
+        if self.config.stochastic_rounding:
+            return self._quantize_stochastically(a, out)
+        if self._needs_grad(a):
+            quantized = self._round(self._clamp(a))
+            if out is None:
+                return quantized
+            return out.copy_(quantized)
+        return (
+            torch.clamp(a, min=self._minimum, max=self._maximum, out=out)
+            .mul_(self._scale)
+            .trunc_()
+            .div_(self._scale)
         )
 
+    def _quantize_stochastically(
+        self, a: torch.Tensor, out: torch.Tensor | None
+    ) -> torch.Tensor:
+        """Round down after adding 16 random fractional bits to the value, i.e.,
+        up with a probability equal to the distance from the lower grid point."""
+        clamped = self._clamp(a)
+        fine = torch.floor(
+            clamped.detach().to(torch.float64) * (self._scale * (1 << LFSR_WIDTH))
+        ).to(torch.int64)
+        noise = self._lfsr.next(a.numel()).reshape(a.shape).to(a.device)
+        rounded = torch.bitwise_right_shift(fine + noise, LFSR_WIDTH).to(clamped.dtype)
+        rounded = rounded.div_(self._scale)
+        if self._needs_grad(clamped):
+            rounded = straight_through(rounded, clamped)
+        if out is None:
+            return rounded
+        return out.copy_(rounded)
+
+    @staticmethod
+    def _needs_grad(a: torch.Tensor) -> bool:
+        return torch.is_grad_enabled() and a.requires_grad
+
+    def _quantize_gradient(self, a: torch.Tensor) -> torch.Tensor:
+        if self.gradient_config is None or not self._needs_grad(a):
+            return a
+        return QuantizeGradient.apply(a, self.gradient_config, self.gradient_counters)
+
+    def _quantize_intermediate(self, a: torch.Tensor) -> torch.Tensor:
+        if self._needs_grad(a) or not a.is_floating_point():
+            return self.quantize(a)
+        return self.quantize(a, out=a)
+
+    def _clamp(self, a: torch.Tensor) -> torch.Tensor:
+        return torch.clamp(a, min=self._minimum, max=self._maximum)
+
     def _round(self, a: torch.Tensor) -> torch.Tensor:
-        return cast(torch.Tensor, RoundToFixedPoint.apply(a, self.config))
+        rounded = torch.trunc(a.detach() * self._scale).div_(self._scale)
+        return straight_through(rounded, a)
 
     def add(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
-        return self._clamp(a + b)
+        summed = self._quantize_gradient(a) + self._quantize_gradient(b)
+        if self._needs_grad(summed) or not summed.is_floating_point():
+            return self._quantize_gradient(self._clamp(summed))
+        return summed.clamp_(min=self._minimum, max=self._maximum)
 
     def matmul(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
-        return self.quantize(torch.matmul(a, b))
+        product = torch.matmul(self._quantize_gradient(a), self._quantize_gradient(b))
+        return self._quantize_gradient(self._quantize_intermediate(product))
+
+    def fused_linear(
+        self, x: torch.Tensor, weight: torch.Tensor, bias: torch.Tensor | None
+    ) -> torch.Tensor:
+        """`x @ weight.T + bias` with the result of `linear.tpl.vhd`, which
+        seeds its accumulator with the bias and cuts it down once, see
+        `HardwareMathOperations.linear`. The operands have to be on the fixed
+        point grid. The backward pass treats the cut down as a clamp of the
+        exact sum."""
+        value = self._hardware.linear(
+            x.detach(), weight.detach(), None if bias is None else bias.detach()
+        ).to(x.dtype)
+        if not torch.is_grad_enabled() or not any(
+            t is not None and t.requires_grad for t in (x, weight, bias)
+        ):
+            return value
+        exact = torch.matmul(
+            self._quantize_gradient(x), self._quantize_gradient(weight).T
+        )
+        if bias is not None:
+            exact = exact + self._quantize_gradient(bias)
+        return self._quantize_gradient(straight_through(value, self._clamp(exact)))
 
     def mul(self, a: Tensor, b: Tensor) -> Tensor:
-        return self.quantize(a * b)
+        product = self._quantize_gradient(a) * self._quantize_gradient(b)
+        return self._quantize_gradient(self._quantize_intermediate(product))
+
+    def conv1d(
+        self,
+        x: torch.Tensor,
+        weight: torch.Tensor,
+        bias: torch.Tensor | None,
+        stride: tuple[int, ...],
+        padding: tuple[int, ...] | str,
+        dilation: tuple[int, ...],
+        groups: int,
+    ) -> torch.Tensor:
+        result = conv1d(
+            input=self._quantize_gradient(x),
+            weight=self._quantize_gradient(weight),
+            bias=None if bias is None else self._quantize_gradient(bias),
+            stride=stride,
+            padding=padding,
+            dilation=dilation,
+            groups=groups,
+        )
+        return self._quantize_gradient(self._quantize_intermediate(result))
@@ -2,6 +2,8 @@ import torch
 
 from tests.tensor_test_case import TensorTestCase
 
+from ._linear_feedback_shift_register import WIDTH as LFSR_WIDTH
+from ._linear_feedback_shift_register import LinearFeedbackShiftRegister
 from ._math_operations import MathOperations
 from ._two_complement_fixed_point_config import FixedPointConfig
 
@@ -43,3 +45,82 @@ class FixedPointMathOperationsTest(TensorTestCase):
         actual = self.operations.mul(a, b)
         expected = [-0.25, 1.75, 0.5]
         self.assertTensorEqual(expected, actual)
+
+    def test_quantize_writes_into_out(self) -> None:
+        a = torch.tensor([-5.0, 1.1, 0.3])
+        actual = self.operations.quantize(a, out=a)
+        self.assertIs(a, actual)
+        self.assertTensorEqual([-2.0, 1.0, 0.25], a)
+
+    def test_quantize_leaves_input_untouched(self) -> None:
+        a = torch.tensor([-5.0, 1.125])
+        _ = self.operations.quantize(a)
+        self.assertTensorEqual([-5.0, 1.125], a)
+
+    def test_quantize_with_and_without_autograd_agree(self) -> None:
+        a = torch.linspace(-3, 3, 97, requires_grad=True)
+        with_grad = self.operations.quantize(a)
+        with torch.no_grad():
+            without_grad = self.operations.quantize(a)
+        self.assertTensorEqual(with_grad.detach(), without_grad)
+
+    def test_quantize_passes_gradient_of_values_in_range(self) -> None:
+        a = torch.tensor([-5.0, 0.3, 1.1], requires_grad=True)
+        self.operations.quantize(a).sum().backward()
+        self.assertTensorEqual([0.0, 1.0, 1.0], a.grad)
+
+    def test_matmul_does_not_modify_operands_without_autograd(self) -> None:
+        a = torch.tensor([[1.75, 1.75]])
+        b = torch.tensor([[1.75], [1.75]])
+        with torch.no_grad():
+            actual = self.operations.matmul(a, b)
+        self.assertTensorEqual([[1.75]], actual)
+        self.assertTensorEqual([[1.75, 1.75]], a)
+
+
+class StochasticRoundingTest(TensorTestCase):
+    def setUp(self) -> None:
+        self.config = FixedPointConfig(
+            total_bits=8, frac_bits=2, stochastic_rounding=True
+        )
+
+    def test_rounds_to_one_of_the_neighbouring_grid_points(self) -> None:
+        operations = MathOperations(self.config)
+        actual = operations.quantize(torch.full((1000,), 0.3))
+        self.assertEqual({0.25, 0.5}, set(actual.tolist()))
+
+    def test_is_unbiased(self) -> None:
+        operations = MathOperations(self.config)
+        actual = operations.quantize(torch.full((10000,), 0.3))
+        self.assertAlmostEqual(0.3, actual.mean().item(), places=2)
+
+    def test_keeps_values_on_the_grid(self) -> None:
+        operations = MathOperations(self.config)
+        values = torch.tensor([-32.0, -1.25, 0.0, 0.75, 31.75])
+        self.assertTensorEqual(values, operations.quantize(values))
+
+    def test_is_reproducible_for_same_seed(self) -> None:
+        x = torch.linspace(-3, 3, 100)
+        first = MathOperations(self.config, seed=42).quantize(x)
+        second = MathOperations(self.config, seed=42).quantize(x)
+        self.assertTensorEqual(first, second)
+
+    def test_adds_lfsr_states_as_fractional_bits(self) -> None:
+        x = torch.tensor([0.3, -0.3, 1.1])
+        lfsr = LinearFeedbackShiftRegister(seed=7)
+        fine = torch.floor(x.double() * 2 ** (2 + LFSR_WIDTH)).long()
+        expected = ((fine + lfsr.next(3)) >> LFSR_WIDTH) / 4
+        actual = MathOperations(self.config, seed=7).quantize(x)
+        self.assertTensorEqual(expected, actual)
+
+    def test_passes_gradient_straight_through(self) -> None:
+        x = torch.tensor([0.3, 40.0], requires_grad=True)
+        MathOperations(self.config).quantize(x).sum().backward()
+        self.assertTensorEqual([1.0, 0.0], x.grad)
+
+    def test_rounds_parameters_and_activations_separately(self) -> None:
+        deterministic = FixedPointConfig(total_bits=8, frac_bits=2)
+        operations = MathOperations(deterministic, parameter_config=self.config)
+        x = torch.full((1000,), 0.3)
+        self.assertEqual({0.25}, set(operations.quantize(x).tolist()))
+        self.assertEqual({0.25, 0.5}, set(operations.quantize_parameter(x).tolist()))
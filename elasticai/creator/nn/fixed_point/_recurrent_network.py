@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from typing import Protocol, cast
+
+import torch
+
+from elasticai.creator.nn.fixed_point.lstm.design.lstm import LSTMNetworkDesign
+from elasticai.creator.nn.fixed_point.lstm.design.testbench import LSTMTestBench
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design_creator import DesignCreator
+
+from ._two_complement_fixed_point_config import FixedPointConfig
+
+
+class _RecurrentLayer(Protocol):
+    input_size: int
+    hidden_size: int
+
+    @property
+    def fixed_point_config(self) -> FixedPointConfig: ...
+
+    def create_design(self) -> Design: ...
+
+
+class RecurrentNetwork(DesignCreator, torch.nn.Module):
+    """Recurrent layer followed by a linear layer applied to the output of
+    the last step. The design is an `LSTMNetworkDesign` driving the cell of
+    the recurrent layer.
+
+    Subclasses name the attribute holding the recurrent layer in
+    `_recurrent_name`.
+    """
+
+    _recurrent_name: str
+
+    def __init__(self, layers: list[torch.nn.Module]) -> None:
+        super().__init__()
+        self.add_module(self._recurrent_name, layers[0])
+        self.layer_names = [f"fp_linear_{i}" for i in range(len(layers[1:]))]
+        if len(self.layer_names) > 1:
+            raise NotImplementedError(
+                "the network design supports a single linear layer after the"
+                f" recurrent layer, but got {len(self.layer_names)}"
+            )
+        self.layers = torch.nn.Sequential(
+            OrderedDict(
+                {name: layer for name, layer in zip(self.layer_names, layers[1:])}
+            )
+        )
+
+    @property
+    def _recurrent(self) -> _RecurrentLayer:
+        return cast(_RecurrentLayer, self.get_submodule(self._recurrent_name))
+
+    def create_design(self, name: str) -> LSTMNetworkDesign:
+        recurrent = self._recurrent
+        return LSTMNetworkDesign(
+            lstm=recurrent.create_design(),
+            linear_layer=self.layers[0].create_design(self.layer_names[0]),
+            total_bits=recurrent.fixed_point_config.total_bits,
+            frac_bits=recurrent.fixed_point_config.frac_bits,
+            hidden_size=recurrent.hidden_size,
+            input_size=recurrent.input_size,
+        )
+
+    def create_testbench(self, test_bench_name, uut: Design) -> LSTMTestBench:
+        return LSTMTestBench(test_bench_name, uut)
+
+    def forward(self, x):
+        x, _ = self.get_submodule(self._recurrent_name)(x)
+        x = x[:, -1]
+        return self.layers(x)
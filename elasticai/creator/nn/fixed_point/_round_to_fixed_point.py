@@ -8,23 +8,31 @@ from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import
 
 
 class RoundToFixedPoint(torch.autograd.Function):
+    """Round towards zero onto the fixed point grid (straight-through gradient).
+
+    Call as `apply(x, config)` or `apply(x, config, check_bounds)`. Pass
+    `check_bounds=False` if `x` is known to be clamped already, e.g. after
+    `MathOperations.quantize`, to skip building the out of bounds mask.
+    """
+
     @staticmethod
     def forward(ctx: Any, *args: Any, **kwargs: Any) -> torch.Tensor:
-        if len(args) != 2:
+        if len(args) not in (2, 3):
             raise TypeError(
-                "apply() takes exactly two arguments "
-                "(x: torch.Tensor, config: FixedPointConfig)"
+                "apply() takes two or three arguments "
+                "(x: torch.Tensor, config: FixedPointConfig, check_bounds: bool)"
             )
         x: torch.Tensor = args[0]
         config: FixedPointConfig = args[1]
+        check_bounds: bool = args[2] if len(args) == 3 else True
 
-        fxp_ints = config.as_integer(x)
-        out_of_bounds = fxp_ints[config.integer_out_of_bounds(fxp_ints)]
-        if torch.any(out_of_bounds):
+        scale = float(1 << config.frac_bits)
+        fxp_ints = torch.trunc(x * scale)
+        if check_bounds and torch.any(config.integer_out_of_bounds(fxp_ints)):
             raise ValueError("Cannot quantize tensor. Values out of bounds.")
 
-        return config.as_rational(fxp_ints)
+        return fxp_ints.div_(scale)
 
     @staticmethod
     def backward(ctx: Any, *grad_outputs: Any) -> Any:
-        return *grad_outputs, None
+        return *grad_outputs, None, None
@@ -41,3 +41,15 @@ def test_round_typical_values() -> None:
         expected=roundToFxp([-1.3, 0.1, 1.6]),
         actual=[-1.25, 0, 1.5],
     )
+
+
+def test_round_skips_bounds_check_if_requested() -> None:
+    config = FixedPointConfig(total_bits=4, frac_bits=2)
+    actual = RoundToFixedPoint.apply(torch.tensor([2.0]), config, False)
+    assertTensorEqual(expected=[2.0], actual=cast(torch.Tensor, actual))
+
+
+def test_round_passes_gradient_straight_through() -> None:
+    inputs = torch.tensor([-1.3, 0.1, 1.6], requires_grad=True)
+    roundToFxp(inputs).sum().backward()
+    assertTensorEqual(expected=[1.0, 1.0, 1.0], actual=cast(torch.Tensor, inputs.grad))
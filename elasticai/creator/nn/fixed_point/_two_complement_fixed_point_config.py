@@ -31,6 +31,7 @@ class ConvertableToFixedPointValues(Protocol[T]):
 class FixedPointConfig:
     total_bits: int
     frac_bits: int
+    stochastic_rounding: bool = False
 
     @property
     def minimum_as_integer(self) -> int:
@@ -46,7 +47,7 @@ class FixedPointConfig:
 
     @property
     def maximum_as_rational(self) -> float:
-        return int("1" * (self.total_bits - 1), 2) / (1 << self.frac_bits)
+        return ((1 << (self.total_bits - 1)) - 1) / (1 << self.frac_bits)
 
     def integer_out_of_bounds(self, number: T) -> T:
         return (number < self.minimum_as_integer) | (number > self.maximum_as_integer)
@@ -15,6 +15,7 @@ class DummyConv1d:
         self.name: str = "conv1d"
         self.kernel_size: int = 1
         self.input_signal_length = 1
+        self.output_signal_length = 1
         self.in_channels = in_channels
         self.out_channels = out_channels
         self.port: Port = create_port(
@@ -14,6 +14,11 @@ entity conv1d_fxp_MAC_RoundToZero is
         KERNEL_SIZE : natural;
         IN_CHANNELS : natural;
         OUT_CHANNELS : natural;
+        OUTPUT_WIDTH : natural;
+        STRIDE : natural;
+        DILATION : natural;
+        PADDING_LEFT : natural;
+        GROUPS : natural;
         X_ADDRESS_WIDTH : natural;
         Y_ADDRESS_WIDTH : natural
     );
@@ -42,6 +47,9 @@ architecture rtl of conv1d_fxp_MAC_RoundToZero is
     end function;
 
     constant FXP_ONE : signed(TOTAL_WIDTH-1 downto 0) := to_signed(2**FRAC_WIDTH,TOTAL_WIDTH);
+    -- each output channel only sees the input channels of its group
+    constant GROUP_IN_CHANNELS : natural := IN_CHANNELS/GROUPS;
+    constant GROUP_OUT_CHANNELS : natural := OUT_CHANNELS/GROUPS;
 
     signal mac_reset : std_logic;
     signal next_sample : std_logic;
@@ -49,16 +57,16 @@ architecture rtl of conv1d_fxp_MAC_RoundToZero is
     signal x2 : signed(TOTAL_WIDTH-1 downto 0);
     signal sum : signed(TOTAL_WIDTH-1 downto 0);
     signal mac_done : std_logic;
-    type data is array (0 to OUT_CHANNELS*(VECTOR_WIDTH-KERNEL_SIZE+1)-1) of signed(TOTAL_WIDTH-1 downto 0);
+    type data is array (0 to OUT_CHANNELS*OUTPUT_WIDTH-1) of signed(TOTAL_WIDTH-1 downto 0);
     signal y_ram : data;
 
     signal n_clock : std_logic;
     signal w : signed(TOTAL_WIDTH-1 downto 0);
     signal b : signed(TOTAL_WIDTH-1 downto 0);
-    signal w_address : unsigned(ceil_log2(OUT_CHANNELS*IN_CHANNELS*KERNEL_SIZE)-1 downto 0);
+    signal w_address : unsigned(ceil_log2(OUT_CHANNELS*GROUP_IN_CHANNELS*KERNEL_SIZE)-1 downto 0);
     signal b_address : unsigned(ceil_log2(OUT_CHANNELS)-1 downto 0);
 
-    type t_state is (s_reset, s_data_transfer_MAC, s_MAC_mul_x_w, s_MAC_add_b, s_MAC_get_result, s_reset_mac, s_done);
+    type t_state is (s_reset, s_data_transfer_MAC, s_MAC_mul_x_w, s_MAC_mul_zero, s_MAC_add_b, s_MAC_get_result, s_reset_mac, s_done);
     signal state : t_state;
 begin
     -- connecting signals to ports
@@ -67,7 +75,7 @@ begin
 
     conv1d_fxp_MAC : entity work.fxp_MAC_RoundToZero
         generic map(
-            VECTOR_WIDTH => KERNEL_SIZE*IN_CHANNELS+1, -- +1 need for Bias
+            VECTOR_WIDTH => KERNEL_SIZE*GROUP_IN_CHANNELS+1, -- +1 need for Bias
             TOTAL_WIDTH => TOTAL_WIDTH,
             FRAC_WIDTH => FRAC_WIDTH
         )
@@ -82,10 +90,12 @@ begin
 
     main : process (clock)
         variable kernel_counter : unsigned(ceil_log2(KERNEL_SIZE+1) downto 0); -- too big integer(round(log2(var-1)) downto 0)
-        variable input_counter : unsigned(ceil_log2(VECTOR_WIDTH+1) downto 0); -- too big integer(round(log2(var-1)) downto 0)
+        variable input_counter : unsigned(ceil_log2(OUTPUT_WIDTH+1) downto 0); -- too big integer(round(log2(var-1)) downto 0)
         variable input_channel_counter : unsigned(ceil_log2(IN_CHANNELS+1) downto 0); -- too big integer(round(log2(var-1)) downto 0)
         variable output_channel_counter : unsigned(ceil_log2(OUT_CHANNELS+1) downto 0); -- too big integer(round(log2(var-1)) downto 0)
         variable bias_added : std_logic;
+        variable position : integer;
+        variable channel : integer;
     begin
         if reset = '1' then
             -- reset such that MAC_enable triggers MAB_enable directly
@@ -113,15 +123,22 @@ begin
                     report("debug: conv1d: state = s_data_transfer_MAC");
                     mac_reset <= '0';
                     next_sample <= '0';
-                    if input_counter /= VECTOR_WIDTH-KERNEL_SIZE+1 then
+                    if input_counter /= OUTPUT_WIDTH then
                         if output_channel_counter /= OUT_CHANNELS then
-                            if input_channel_counter /= IN_CHANNELS then
+                            if input_channel_counter /= GROUP_IN_CHANNELS then
                                 if kernel_counter /= KERNEL_SIZE then
                                     report("debug: conv1d: Input   output_c    input_c     kernel");
                                     report("debug: conv1d: " & to_bstring(input_counter) &"     "& to_bstring(output_channel_counter) &"          " & to_bstring(input_channel_counter)  & "          " & to_bstring(kernel_counter));
-                                    x_address <= resize(input_channel_counter * VECTOR_WIDTH + kernel_counter + input_counter, x_address'length);
-                                    w_address <= resize(input_channel_counter * VECTOR_WIDTH + kernel_counter, w_address'length);
-                                    state <= s_MAC_mul_x_w;
+                                    -- position of the tap in the signal, taps in the padding are fed in as zeros
+                                    position := to_integer(input_counter)*STRIDE + to_integer(kernel_counter)*DILATION - PADDING_LEFT;
+                                    channel := (to_integer(output_channel_counter)/GROUP_OUT_CHANNELS)*GROUP_IN_CHANNELS + to_integer(input_channel_counter);
+                                    w_address <= to_unsigned((to_integer(output_channel_counter)*GROUP_IN_CHANNELS + to_integer(input_channel_counter))*KERNEL_SIZE + to_integer(kernel_counter), w_address'length);
+                                    if position >= 0 and position < VECTOR_WIDTH then
+                                        x_address <= to_unsigned(channel*VECTOR_WIDTH + position, x_address'length);
+                                        state <= s_MAC_mul_x_w;
+                                    else
+                                        state <= s_MAC_mul_zero;
+                                    end if;
                                     kernel_counter := kernel_counter + 1;
                                 else
                                     kernel_counter := (others => '0');
@@ -130,6 +147,7 @@ begin
                             elsif bias_added = '0' then
                                 report("debug: conv1d: add bias");
                                 bias_added := '1';
+                                b_address <= resize(output_channel_counter, b_address'length);
                                 state <= s_MAC_add_b;
                             elsif bias_added = '1' then
                                 --read MAC output from last computation and write to y_ram
@@ -148,7 +166,7 @@ begin
                     else
                         state <= s_done;
                     end if;
-                elsif state = s_MAC_mul_x_w or state = s_MAC_add_b then
+                elsif state = s_MAC_mul_x_w or state = s_MAC_mul_zero or state = s_MAC_add_b then
                     report("debug: conv1d: state = mul_x or add_b" );
                     next_sample <= '1';
                     state <= s_data_transfer_MAC;
@@ -160,7 +178,7 @@ begin
                         --next_sample <= '0';
                         report("debug: conv1d: write sum to y_ram");
                         report("debug: conv1d: sum=" & to_bstring(sum));
-                        y_ram(to_integer(resize((output_channel_counter-1)*(VECTOR_WIDTH-KERNEL_SIZE+1)+input_counter, y_ram'length))) <= sum;
+                        y_ram(to_integer(resize((output_channel_counter-1)*OUTPUT_WIDTH+input_counter, y_ram'length))) <= sum;
                         state <= s_reset_MAC;
                     end if;
                 elsif state = s_done then
@@ -192,6 +210,9 @@ begin
             if state = s_MAC_mul_x_w then
                 x1 <= x;
                 x2 <= w;
+            elsif state = s_MAC_mul_zero then
+                x1 <= (others => '0');
+                x2 <= w;
             elsif state = s_MAC_add_b then
                 x1 <= FXP_ONE;
                 x2 <= b;
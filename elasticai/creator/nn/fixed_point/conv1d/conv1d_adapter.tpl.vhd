@@ -23,6 +23,11 @@ architecture rtl of ${name} is
     constant KERNEL_SIZE : natural := ${kernel_size};
     constant IN_CHANNELS : natural := ${in_channels};
     constant OUT_CHANNELS : natural := ${out_channels};
+    constant OUTPUT_WIDTH : natural := ${output_width};
+    constant STRIDE : natural := ${stride};
+    constant DILATION : natural := ${dilation};
+    constant PADDING_LEFT : natural := ${padding_left};
+    constant GROUPS : natural := ${groups};
     constant X_ADDRESS_WIDTH : natural := ${x_address_width};
     constant Y_ADDRESS_WIDTH : natural := ${y_address_width};
 begin
@@ -34,6 +39,11 @@ begin
             KERNEL_SIZE => KERNEL_SIZE,
             IN_CHANNELS => IN_CHANNELS,
             OUT_CHANNELS => OUT_CHANNELS,
+            OUTPUT_WIDTH => OUTPUT_WIDTH,
+            STRIDE => STRIDE,
+            DILATION => DILATION,
+            PADDING_LEFT => PADDING_LEFT,
+            GROUPS => GROUPS,
             X_ADDRESS_WIDTH => X_ADDRESS_WIDTH,
             Y_ADDRESS_WIDTH => Y_ADDRESS_WIDTH
         )
@@ -1,4 +1,5 @@
 import math
+from typing import cast
 
 from elasticai.creator.file_generation.savable import Path
 from elasticai.creator.file_generation.template import (
@@ -23,7 +24,28 @@ def generate_parameters_from_port(port: Port) -> dict[str, str]:
     return params
 
 
+def padding_per_side(
+    padding: int | tuple[int, ...] | str, kernel_size: int, dilation: int
+) -> tuple[int, int]:
+    """Zero padding left and right of the signal, for the `padding` argument
+    of `torch.nn.Conv1d`."""
+    if padding == "valid":
+        return 0, 0
+    if padding == "same":
+        total = dilation * (kernel_size - 1)
+        return total // 2, total - total // 2
+    if isinstance(padding, tuple):
+        (padding,) = padding
+    return cast(int, padding), cast(int, padding)
+
+
 class Conv1d(Design, Conv1dDesignProtocol):
+    """`weights` has the shape `(out_channels, in_channels // groups,
+    kernel_size)` like for `torch.nn.Conv1d`, `padding` gives the number of
+    zeros in front of and behind the signal. Padded positions are fed into
+    the MAC as zeros, so they take a cycle like all other taps.
+    """
+
     def __init__(
         self,
         name: str,
@@ -35,8 +57,17 @@ class Conv1d(Design, Conv1dDesignProtocol):
         kernel_size: int,
         weights: list[list[list[int]]],
         bias: list[int],
+        stride: int = 1,
+        padding: tuple[int, int] = (0, 0),
+        dilation: int = 1,
+        groups: int = 1,
     ) -> None:
         super().__init__(name=name)
+        if in_channels % groups != 0 or out_channels % groups != 0:
+            raise ValueError(
+                f"in_channels ({in_channels}) and out_channels ({out_channels}) must"
+                f" be divisible by groups ({groups})"
+            )
         self._total_bits = total_bits
         self._frac_bits = frac_bits
         self._in_channels = in_channels
@@ -45,8 +76,19 @@ class Conv1d(Design, Conv1dDesignProtocol):
         self._kernel_size = kernel_size
         self._weights = weights
         self._bias = bias
-        self.output_signal_length = math.floor(
-            self.input_signal_length - self.kernel_size + 1
+        self._stride = stride
+        self._padding = padding
+        self._dilation = dilation
+        self._groups = groups
+        self._output_signal_length = math.floor(
+            (
+                self.input_signal_length
+                + sum(padding)
+                - dilation * (self.kernel_size - 1)
+                - 1
+            )
+            / stride
+            + 1
         )
         self._port = create_port(
             x_width=self._total_bits,
@@ -63,6 +105,10 @@ class Conv1d(Design, Conv1dDesignProtocol):
     def input_signal_length(self) -> int:
         return self._input_signal_length
 
+    @property
+    def output_signal_length(self) -> int:
+        return self._output_signal_length
+
     @property
     def kernel_size(self) -> int:
         return self._kernel_size
@@ -99,6 +145,11 @@ class Conv1d(Design, Conv1dDesignProtocol):
                 out_channels=str(self._out_channels),
                 kernel_size=str(self.kernel_size),
                 vector_width=str(self.input_signal_length),
+                output_width=str(self.output_signal_length),
+                stride=str(self._stride),
+                dilation=str(self._dilation),
+                padding_left=str(self._padding[0]),
+                groups=str(self._groups),
                 name=self.name,
             )
             | generate_parameters_from_port(self._port),
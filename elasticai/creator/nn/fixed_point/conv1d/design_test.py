@@ -1,8 +1,10 @@
 from typing import cast
 
 import pytest
+import torch
 
 from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
 
 from .design import Conv1d
 
@@ -103,3 +105,105 @@ end architecture rtl;"""
     actual_code = saved_files["conv1d_b_rom.vhd"]
     assert expected_code == actual_code
 
+
+def create_design(**kwargs) -> Conv1d:
+    arguments = (
+        dict(
+            name="conv1d",
+            total_bits=8,
+            frac_bits=4,
+            in_channels=4,
+            out_channels=2,
+            kernel_size=3,
+            signal_length=9,
+            weights=[[[1, 2, 3], [4, 5, 6]], [[-1, -2, -3], [-4, -5, -6]]],
+            bias=[0, 0],
+            groups=2,
+        )
+        | kwargs
+    )
+    return Conv1d(**arguments)  # type: ignore[arg-type]
+
+
+def emulate_addressing(
+    design: Conv1d,
+    x: list[int],
+    stride: int,
+    padding: tuple[int, int],
+    dilation: int,
+    groups: int,
+) -> list[int]:
+    """Mirrors the address computation of `conv1d.tpl.vhd`."""
+    w = design._flatten_params(design._weights)
+    group_in = design.in_channels // groups
+    group_out = design.out_channels // groups
+    y = []
+    for o in range(design.out_channels):
+        for i in range(design.output_signal_length):
+            total = 0
+            for c in range(group_in):
+                for k in range(design.kernel_size):
+                    position = i * stride + k * dilation - padding[0]
+                    weight = w[(o * group_in + c) * design.kernel_size + k]
+                    if 0 <= position < design.input_signal_length:
+                        channel = (o // group_out) * group_in + c
+                        value = x[channel * design.input_signal_length + position]
+                        total += weight * value
+            y.append(total)
+    return y
+
+
+@pytest.mark.parametrize(
+    "stride, padding, dilation, groups",
+    [(1, (0, 0), 1, 1), (2, (1, 1), 1, 2), (1, (2, 2), 2, 2), (3, (0, 2), 1, 1)],
+)
+def test_addressing_computes_torch_conv1d(
+    stride: int, padding: tuple[int, int], dilation: int, groups: int
+) -> None:
+    torch.manual_seed(0)
+    weight = torch.randint(-8, 8, (2, 4 // groups, 3))
+    x = torch.randint(-8, 8, (4, 9))
+    design = create_design(
+        weights=weight.tolist(),
+        stride=stride,
+        padding=padding,
+        dilation=dilation,
+        groups=groups,
+    )
+    expected = torch.nn.functional.conv1d(
+        torch.nn.functional.pad(x, padding)[None],
+        weight,
+        stride=stride,
+        dilation=dilation,
+        groups=groups,
+    )[0]
+
+    actual = emulate_addressing(
+        design, x.flatten().tolist(), stride, padding, dilation, groups
+    )
+
+    assert expected.flatten().tolist() == actual
+
+
+def test_output_length_respects_stride_padding_and_dilation() -> None:
+    design = create_design(stride=2, padding=(1, 2), dilation=2)
+    assert 4 == design.output_signal_length
+    assert calculate_address_width(4 * 2) == design.port["y_address"].width
+
+
+def test_groups_must_divide_channels() -> None:
+    with pytest.raises(ValueError):
+        create_design(in_channels=3)
+
+
+def test_core_gets_stride_padding_dilation_and_groups() -> None:
+    code = save_design(create_design(stride=2, padding=(1, 1), dilation=2))[
+        "conv1d.vhd"
+    ]
+    for line in [
+        "STRIDE => STRIDE",
+        "DILATION => DILATION",
+        "PADDING_LEFT => PADDING_LEFT",
+        "GROUPS => GROUPS",
+    ]:
+        assert line in code
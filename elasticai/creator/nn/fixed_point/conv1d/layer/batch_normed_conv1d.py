@@ -3,15 +3,24 @@ from typing import Any, cast
 import torch
 
 from elasticai.creator.base_modules.conv1d import Conv1d as Conv1dBase
+from elasticai.creator.nn.fixed_point._batch_norm_folding import FoldedParameterCache
 from elasticai.creator.nn.fixed_point._math_operations import MathOperations
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
 )
 from elasticai.creator.nn.fixed_point.conv1d.design import Conv1d as Conv1dDesign
+from elasticai.creator.nn.fixed_point.conv1d.design import padding_per_side
 from elasticai.creator.vhdl.design_creator import DesignCreator
 
 
 class BatchNormedConv1d(DesignCreator, torch.nn.Module):
+    """Fixed point 1d convolution followed by batch normalization.
+
+    In eval mode the forward pass is a single quantized
+    convolution with the folded parameters of the design, see
+    `BatchNormedLinear`.
+    """
+
     def __init__(
         self,
         total_bits: int,
@@ -50,6 +59,7 @@ class BatchNormedConv1d(DesignCreator, torch.nn.Module):
             track_running_stats=True,
             device=device,
         )
+        self._folded_parameters = FoldedParameterCache(self._config)
 
     @property
     def conv_weight(self) -> torch.Tensor:
@@ -68,6 +78,18 @@ class BatchNormedConv1d(DesignCreator, torch.nn.Module):
         return self._batch_norm.bias
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if not self.training:
+            weight, bias = self._folded()
+            return self._operations.conv1d(
+                x=x,
+                weight=weight,
+                bias=bias,
+                stride=self._conv1d.stride,
+                padding=self._conv1d.padding,
+                dilation=self._conv1d.dilation,
+                groups=self._conv1d.groups,
+            )
+
         has_batches = x.dim() == 3
 
         if not has_batches:
@@ -91,23 +113,7 @@ class BatchNormedConv1d(DesignCreator, torch.nn.Module):
         def flatten_tuple(x: int | tuple[int, ...]) -> int:
             return x[0] if isinstance(x, tuple) else x
 
-        bn_mean = cast(torch.Tensor, self._batch_norm.running_mean)
-        bn_variance = cast(torch.Tensor, self._batch_norm.running_var)
-        bn_epsilon = self._batch_norm.eps
-        conv_weight = self._conv1d.weight
-        conv_bias = (
-            torch.tensor([0] * self._conv1d.out_channels)
-            if self._conv1d.bias is None
-            else self._conv1d.bias
-        )
-
-        std = torch.sqrt(bn_variance + bn_epsilon)
-        weights = conv_weight / std
-        bias = (conv_bias - bn_mean) / std
-
-        if self._batch_norm.affine:
-            weights = (self._batch_norm.weight * weights.t()).t()
-            bias = self._batch_norm.weight * bias + self._batch_norm.bias
+        weights, bias = self._folded()
 
         return Conv1dDesign(
             name=name,
@@ -119,4 +125,15 @@ class BatchNormedConv1d(DesignCreator, torch.nn.Module):
             kernel_size=flatten_tuple(self._conv1d.kernel_size),
             weights=cast(list[list[list[int]]], float_to_signed_int(weights.tolist())),
             bias=cast(list[int], float_to_signed_int(bias.tolist())),
+            stride=flatten_tuple(self._conv1d.stride),
+            padding=padding_per_side(
+                self._conv1d.padding,
+                flatten_tuple(self._conv1d.kernel_size),
+                flatten_tuple(self._conv1d.dilation),
+            ),
+        )
+
+    def _folded(self) -> tuple[torch.Tensor, torch.Tensor]:
+        return self._folded_parameters.get(
+            self, self._conv1d.weight, self._conv1d.bias, self._batch_norm
         )
@@ -31,3 +31,43 @@ def test_that_batch_dimension_is_kept() -> None:
     prediction = conv(input_data)
     batch_dimension = prediction.shape[0]
     assert batch_dimension == 3
+
+
+def trained_conv1d() -> BatchNormedConv1d:
+    torch.manual_seed(0)
+    conv = BatchNormedConv1d(
+        total_bits=8,
+        frac_bits=4,
+        kernel_size=3,
+        signal_length=6,
+        in_channels=2,
+        out_channels=4,
+        bn_momentum=1,
+    )
+    conv(torch.randn(5, 2, 6))
+    return conv.eval()
+
+
+def test_design_folds_batch_norm_per_output_channel() -> None:
+    conv = trained_conv1d()
+    with torch.no_grad():
+        conv.conv_weight.fill_(1.0)
+        conv.bn_weight.copy_(torch.tensor([0.5, 1.0, 1.5, 2.0]))
+    std = torch.sqrt(conv._batch_norm.running_var + conv._batch_norm.eps)
+    expected = torch.round(torch.tensor([0.5, 1.0, 1.5, 2.0]) / std * 16)
+    weights = torch.tensor(conv.create_design("conv")._weights, dtype=torch.float32)
+    assert torch.equal(weights, expected[:, None, None].expand(4, 2, 3))
+
+
+def test_eval_output_is_single_convolution_with_design_parameters() -> None:
+    conv = trained_conv1d()
+    x = conv._operations.quantize(torch.randn(3, 2, 6))
+    weight, bias = conv._folded()
+    design = conv.create_design("conv")
+    assert torch.equal(weight * 16, torch.tensor(design._weights, dtype=torch.float32))
+    with torch.no_grad():
+        expected = conv._operations.conv1d(
+            x, weight, bias, stride=(1,), padding=(0,), dilation=(1,), groups=1
+        )
+        assert torch.equal(conv(x), expected)
+        assert torch.equal(conv(x[0]), expected[0])
@@ -1,13 +1,19 @@
-from typing import Any, cast
+from typing import Any, Optional, cast
 
 import torch
 
 from elasticai.creator.base_modules.conv1d import Conv1d as Conv1dBase
+from elasticai.creator.nn.fixed_point._gradient_quantization import (
+    GradientCounters,
+    quantize_parameter_gradients,
+)
 from elasticai.creator.nn.fixed_point._math_operations import MathOperations
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
 )
 from elasticai.creator.nn.fixed_point.conv1d.design import Conv1d as Conv1dDesign
+from elasticai.creator.nn.fixed_point.conv1d.design import padding_per_side
+from elasticai.creator.nn.fixed_point.conv1d.streaming_design import StreamingConv1d
 from elasticai.creator.vhdl.design_creator import DesignCreator
 
 from ..testbench import Conv1dTestbench
@@ -22,23 +28,72 @@ class Conv1d(DesignCreator, Conv1dBase):
         out_channels: int,
         signal_length: int,
         kernel_size: int | tuple[int],
+        stride: int | tuple[int] = 1,
+        padding: int | tuple[int] | str = 0,
+        dilation: int | tuple[int] = 1,
+        groups: int = 1,
         bias: bool = True,
         device: Any = None,
+        gradient_config: Optional[FixedPointConfig] = None,
     ) -> None:
         self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
         self._signal_length = signal_length
         super().__init__(
-            operations=MathOperations(config=self._config),
+            operations=MathOperations(
+                config=self._config, gradient_config=gradient_config
+            ),
             in_channels=in_channels,
             out_channels=out_channels,
             kernel_size=kernel_size,
+            stride=stride,
+            padding=padding,
+            dilation=dilation,
+            groups=groups,
             bias=bias,
             device=device,
         )
+        if gradient_config is not None:
+            quantize_parameter_gradients(
+                self.parameters(), gradient_config, self.gradient_counters
+            )
 
     def create_testbench(self, name: str, uut: Conv1dDesign) -> Conv1dTestbench:
         return Conv1dTestbench(name=name, uut=uut, fxp_params=self._config)
 
+    @property
+    def gradient_counters(self) -> GradientCounters:
+        return cast(MathOperations, self._operations).gradient_counters
+
+    def create_stream_design(self, name: str) -> StreamingConv1d:
+        """Design that computes what `stream` does, on a stream of samples
+        instead of an addressed buffer holding the whole signal."""
+        if self.stride != (1,) or self.dilation != (1,) or self.groups != 1:
+            raise ValueError(
+                "stream designs support neither stride, dilation nor groups"
+            )
+        if self.padding not in ((0,), "valid"):
+            raise ValueError("stream designs only support unpadded convolutions")
+        with torch.no_grad():
+            weight = self._operations.quantize_parameter(self.weight)
+            bias = (
+                torch.zeros(self.out_channels)
+                if self.bias is None
+                else self._operations.quantize_parameter(self.bias)
+            )
+        return StreamingConv1d(
+            name=name,
+            total_bits=self._config.total_bits,
+            frac_bits=self._config.frac_bits,
+            in_channels=self.in_channels,
+            out_channels=self.out_channels,
+            kernel_size=self.kernel_size[0],
+            weights=cast(list[list[list[int]]], self._as_integers(weight)),
+            bias=cast(list[int], self._as_integers(bias)),
+        )
+
+    def _as_integers(self, quantized: torch.Tensor) -> list:
+        return torch.round(quantized * (1 << self._config.frac_bits)).int().tolist()
+
     def create_design(self, name: str) -> Conv1dDesign:
         def float_to_signed_int(value: float | list) -> int | list:
             if isinstance(value, list):
@@ -64,4 +119,12 @@ class Conv1d(DesignCreator, Conv1dBase):
             kernel_size=flatten_tuple(self.kernel_size),
             weights=signed_int_weights,
             bias=signed_int_bias,
+            stride=flatten_tuple(self.stride),
+            padding=padding_per_side(
+                self.padding,
+                flatten_tuple(self.kernel_size),
+                flatten_tuple(self.dilation),
+            ),
+            dilation=flatten_tuple(self.dilation),
+            groups=self.groups,
         )
@@ -197,3 +197,49 @@ def test_ensure_bias_is_0_5(to_1d_input_tensor) -> None:
     predictions = conv(inputs).tolist()
     expected = to_1d_input_tensor(0.5).tolist()
     assert expected == predictions
+
+
+def test_design_gets_stride_padding_dilation_and_groups() -> None:
+    conv = Conv1d(
+        total_bits=8,
+        frac_bits=4,
+        in_channels=4,
+        out_channels=2,
+        kernel_size=3,
+        signal_length=9,
+        padding="same",
+        dilation=2,
+        groups=2,
+    )
+    design = conv.create_design("conv")
+    assert design.output_signal_length == 9
+    assert conv(torch.zeros(1, 4, 9)).shape[-1] == design.output_signal_length
+
+
+def test_stream_design_rejects_strided_convolutions() -> None:
+    conv = Conv1d(
+        total_bits=8,
+        frac_bits=4,
+        in_channels=1,
+        out_channels=1,
+        kernel_size=3,
+        signal_length=9,
+        stride=2,
+    )
+    with pytest.raises(ValueError):
+        conv.create_stream_design("conv")
+
+
+@pytest.mark.parametrize("padding", [1, "same"])
+def test_stream_design_rejects_padded_convolutions(padding: int | str) -> None:
+    conv = Conv1d(
+        total_bits=8,
+        frac_bits=4,
+        in_channels=1,
+        out_channels=1,
+        kernel_size=3,
+        signal_length=9,
+        padding=padding,
+    )
+    with pytest.raises(ValueError):
+        conv.create_stream_design("conv")
@@ -0,0 +1,172 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+library ${work_library_name};
+use ${work_library_name}.all;
+
+-- 1d convolution on a stream of samples.
+-- A column of IN_CHANNELS values arrives value by value while x_valid and
+-- x_ready are set. The last KERNEL_SIZE columns are kept in a ring buffer,
+-- write_column points to the column being written, so after a column is
+-- complete the next one holds the oldest column of the window. Once
+-- KERNEL_SIZE columns arrived, every complete column starts the computation
+-- of the OUT_CHANNELS values of one output column. Each takes one cycle per
+-- weight, then it is put out on y with y_valid set for one cycle. No input
+-- is accepted during the computation.
+entity ${name} is
+    generic (
+        DATA_WIDTH : integer := ${data_width};
+        FRAC_WIDTH : integer := ${frac_width};
+        IN_CHANNELS : integer := ${in_channels};
+        OUT_CHANNELS : integer := ${out_channels};
+        KERNEL_SIZE : integer := ${kernel_size};
+        ACC_WIDTH : integer := ${acc_width}
+    );
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+
+        x : in std_logic_vector(DATA_WIDTH-1 downto 0);
+        x_valid : in std_logic;
+        x_ready : out std_logic;
+
+        y : out std_logic_vector(DATA_WIDTH-1 downto 0);
+        y_valid : out std_logic
+    );
+end ${name};
+
+architecture rtl of ${name} is
+    constant TAPS : integer := KERNEL_SIZE*IN_CHANNELS;
+    constant MIN_VALUE : integer := -2**(DATA_WIDTH-1);
+    constant MAX_VALUE : integer := 2**(DATA_WIDTH-1)-1;
+
+    type t_bias is array (0 to OUT_CHANNELS-1) of integer;
+    constant BIAS : t_bias := (
+        $bias
+    );
+
+    function biased(b : integer) return signed is
+    begin
+        return shift_left(to_signed(b, ACC_WIDTH), FRAC_WIDTH);
+    end function;
+
+    -- truncates towards zero and saturates like the software
+    function finish(sum : signed(ACC_WIDTH-1 downto 0)) return signed is
+        variable shifted : signed(ACC_WIDTH-1 downto 0);
+    begin
+        shifted := shift_right(sum, FRAC_WIDTH);
+        if sum < 0 and shift_left(shifted, FRAC_WIDTH) /= sum then
+            shifted := shifted + 1;
+        end if;
+        if shifted > MAX_VALUE then
+            shifted := to_signed(MAX_VALUE, shifted'length);
+        elsif shifted < MIN_VALUE then
+            shifted := to_signed(MIN_VALUE, shifted'length);
+        end if;
+        return shifted(DATA_WIDTH-1 downto 0);
+    end function;
+
+    type t_state is (s_receive, s_compute);
+    signal state : t_state;
+
+    type t_ring is array (0 to TAPS-1) of signed(DATA_WIDTH-1 downto 0);
+    signal ring : t_ring := (others => (others => '0'));
+
+    signal n_clock : std_logic;
+    signal reset : std_logic;
+    signal w_in : std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal addr_w : std_logic_vector(${w_addr_width}-1 downto 0) := (others => '0');
+begin
+    n_clock <= not clock;
+    reset <= not enable;
+    x_ready <= '1' when state = s_receive and reset = '0' else '0';
+
+    main : process (clock, reset)
+        variable channel : integer range 0 to IN_CHANNELS-1 := 0;
+        variable write_column : integer range 0 to KERNEL_SIZE-1 := 0;
+        variable columns : integer range 0 to KERNEL_SIZE-1 := 0;
+        variable read_column : integer range 0 to KERNEL_SIZE-1 := 0;
+        variable read_channel : integer range 0 to IN_CHANNELS-1 := 0;
+        variable tap : integer range 0 to TAPS-1 := 0;
+        variable out_channel : integer range 0 to OUT_CHANNELS-1 := 0;
+        variable var_addr_w : integer range 0 to OUT_CHANNELS*TAPS-1 := 0;
+        variable sum : signed(ACC_WIDTH-1 downto 0) := (others => '0');
+    begin
+        if reset = '1' then
+            state <= s_receive;
+            y_valid <= '0';
+            channel := 0;
+            write_column := 0;
+            columns := 0;
+            var_addr_w := 0;
+        elsif rising_edge(clock) then
+            y_valid <= '0';
+            if state = s_receive then
+                if x_valid = '1' then
+                    ring(write_column*IN_CHANNELS + channel) <= signed(x);
+                    if channel < IN_CHANNELS-1 then
+                        channel := channel + 1;
+                    else
+                        channel := 0;
+                        if write_column < KERNEL_SIZE-1 then
+                            write_column := write_column + 1;
+                        else
+                            write_column := 0;
+                        end if;
+                        if columns < KERNEL_SIZE-1 then
+                            columns := columns + 1;
+                        else
+                            read_column := write_column;
+                            read_channel := 0;
+                            tap := 0;
+                            out_channel := 0;
+                            var_addr_w := 0;
+                            sum := biased(BIAS(0));
+                            state <= s_compute;
+                        end if;
+                    end if;
+                end if;
+            else
+                sum := sum + ring(read_column*IN_CHANNELS + read_channel) * signed(w_in);
+                if var_addr_w < OUT_CHANNELS*TAPS-1 then
+                    var_addr_w := var_addr_w + 1;
+                end if;
+                if read_channel < IN_CHANNELS-1 then
+                    read_channel := read_channel + 1;
+                else
+                    read_channel := 0;
+                    if read_column < KERNEL_SIZE-1 then
+                        read_column := read_column + 1;
+                    else
+                        read_column := 0;
+                    end if;
+                end if;
+
+                if tap < TAPS-1 then
+                    tap := tap + 1;
+                else
+                    tap := 0;
+                    y <= std_logic_vector(finish(sum));
+                    y_valid <= '1';
+                    if out_channel < OUT_CHANNELS-1 then
+                        out_channel := out_channel + 1;
+                        sum := biased(BIAS(out_channel));
+                    else
+                        state <= s_receive;
+                    end if;
+                end if;
+            end if;
+        end if;
+
+        addr_w <= std_logic_vector(to_unsigned(var_addr_w, addr_w'length));
+    end process main;
+
+    rom_w : entity ${work_library_name}.${weights_rom_name}(rtl)
+    port map (
+        clk  => n_clock,
+        en   => '1',
+        addr => addr_w,
+        data => w_in
+    );
+end architecture rtl;
@@ -0,0 +1,107 @@
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.code_generation.code_abstractions import (
+    create_array_elements,
+)
+from elasticai.creator.vhdl.design import std_signals as _signals
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.design.signal import Signal
+from elasticai.creator.vhdl.shared_designs.rom import Rom
+
+
+class StreamingConv1d(Design):
+    """Fixed point 1d convolution on a stream of samples.
+
+    Instead of reading a complete signal through `x_address`, the design
+    accepts one value per cycle while `x_valid` and `x_ready` are set, the
+    `in_channels` values of a column one after another. The last
+    `kernel_size` columns are kept in a ring buffer. After each column, as
+    soon as `kernel_size` columns arrived, the `out_channels` values of the
+    new output column are put out one after another, each marked by
+    `y_valid`. Products are accumulated exactly, starting from
+    `bias * 2**frac_bits`, and the sum is truncated towards zero and
+    saturated once, like `MathOperations.conv1d` does.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        total_bits: int,
+        frac_bits: int,
+        in_channels: int,
+        out_channels: int,
+        kernel_size: int,
+        weights: list[list[list[int]]],
+        bias: list[int],
+        work_library_name: str = "work",
+    ) -> None:
+        super().__init__(name=name)
+        self.total_bits = total_bits
+        self.frac_bits = frac_bits
+        self.in_channels = in_channels
+        self.out_channels = out_channels
+        self.kernel_size = kernel_size
+        self.weights = weights
+        self.bias = bias
+        self.work_library_name = work_library_name
+
+    @property
+    def port(self) -> Port:
+        return Port(
+            incoming=[
+                _signals.enable(),
+                _signals.clock(),
+                _signals.x(self.total_bits),
+                Signal(name="x_valid", width=0),
+            ],
+            outgoing=[
+                Signal(name="x_ready", width=0),
+                _signals.y(self.total_bits),
+                Signal(name="y_valid", width=0),
+            ],
+        )
+
+    def rom_values(self) -> list[int]:
+        """Weights in the order the ring buffer is read: by output channel,
+        then kernel position, then input channel."""
+        return [
+            self.weights[out_channel][in_channel][position]
+            for out_channel in range(self.out_channels)
+            for position in range(self.kernel_size)
+            for in_channel in range(self.in_channels)
+        ]
+
+    def save_to(self, destination: Path) -> None:
+        rom_name = f"{self.name}_w_rom"
+        taps = self.kernel_size * self.in_channels
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="streaming_conv1d.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                weights_rom_name=rom_name,
+                work_library_name=self.work_library_name,
+                data_width=str(self.total_bits),
+                frac_width=str(self.frac_bits),
+                in_channels=str(self.in_channels),
+                out_channels=str(self.out_channels),
+                kernel_size=str(self.kernel_size),
+                w_addr_width=str(calculate_address_width(self.out_channels * taps)),
+                acc_width=str(2 * self.total_bits + taps.bit_length()),
+                bias=create_array_elements(self.bias),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+        rom = Rom(
+            name=rom_name,
+            data_width=self.total_bits,
+            values_as_integers=self.rom_values(),
+        )
+        rom.save_to(destination.create_subpath(rom_name))
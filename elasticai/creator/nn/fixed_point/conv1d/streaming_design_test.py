@@ -0,0 +1,102 @@
+import torch
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryPath
+
+from .layer import Conv1d
+from .streaming_design import StreamingConv1d
+
+TOTAL_BITS = 8
+FRAC_BITS = 4
+
+
+def create_layer() -> Conv1d:
+    torch.manual_seed(42)
+    return Conv1d(
+        total_bits=TOTAL_BITS,
+        frac_bits=FRAC_BITS,
+        in_channels=2,
+        out_channels=3,
+        signal_length=9,
+        kernel_size=3,
+    )
+
+
+def emulate(design: StreamingConv1d, samples: list[list[int]]) -> list[list[int]]:
+    """Mirrors the datapath of `streaming_conv1d.tpl.vhd` on integers."""
+    weights = design.rom_values()
+    taps = design.kernel_size * design.in_channels
+    ring = [0] * taps
+    write_column = 0
+    columns = 0
+    outputs = []
+    for column in samples:
+        for channel, value in enumerate(column):
+            ring[write_column * design.in_channels + channel] = value
+        write_column = (write_column + 1) % design.kernel_size
+        if columns < design.kernel_size - 1:
+            columns += 1
+            continue
+        output = []
+        for out_channel in range(design.out_channels):
+            total = design.bias[out_channel] << design.frac_bits
+            for tap in range(taps):
+                read_column = (write_column + tap // design.in_channels) % (
+                    design.kernel_size
+                )
+                value = ring[
+                    read_column * design.in_channels + tap % design.in_channels
+                ]
+                total += value * weights[out_channel * taps + tap]
+            output.append(finish(total))
+        outputs.append(output)
+    return outputs
+
+
+def finish(total: int) -> int:
+    truncated = abs(total) >> FRAC_BITS
+    truncated = truncated if total >= 0 else -truncated
+    return max(-(2 ** (TOTAL_BITS - 1)), min(2 ** (TOTAL_BITS - 1) - 1, truncated))
+
+
+def test_emulated_design_computes_what_stream_does() -> None:
+    layer = create_layer()
+    inputs = torch.randint(-128, 128, (1, 2, 9)) / 16
+    expected = torch.cat(
+        [layer.stream(column) for column in inputs.split(1, dim=-1)], dim=-1
+    )
+
+    design = layer.create_stream_design("conv")
+    samples = (inputs[0].T * 16).int().tolist()
+    actual = torch.tensor(emulate(design, samples)).T[None] / 16
+
+    assert expected.tolist() == actual.tolist()
+
+
+def test_rom_holds_weights_by_output_position_and_input_channel() -> None:
+    design = StreamingConv1d(
+        name="conv",
+        total_bits=8,
+        frac_bits=4,
+        in_channels=2,
+        out_channels=1,
+        kernel_size=2,
+        weights=[[[1, 2], [3, 4]]],
+        bias=[0],
+    )
+    assert [1, 3, 2, 4] == design.rom_values()
+
+
+def test_saves_design_and_weight_rom() -> None:
+    destination = InMemoryPath("build", parent=None)
+    create_layer().create_stream_design("conv").save_to(destination)
+
+    code = "\n".join(destination.children["conv"].text)
+    assert "entity conv is" in code
+    assert "KERNEL_SIZE : integer := 3;" in code
+    assert "conv_w_rom" in destination.children
+
+
+def test_port_consumes_a_stream() -> None:
+    port = create_layer().create_stream_design("conv").port
+    assert {"enable", "clock", "x", "x_valid"} == {s.name for s in port.incoming}
+    assert {"x_ready", "y", "y_valid"} == {s.name for s in port.outgoing}
@@ -10,7 +10,6 @@ from elasticai.creator.file_generation.template import (
 )
 
 from elasticai.creator.nn.fixed_point.number_converter import NumberConverter, FXPParams
-import math
 
 
 class Conv1dDesign(Protocol):
@@ -29,6 +28,11 @@ class Conv1dDesign(Protocol):
     def port(self) -> Port:
         ...
 
+    @property
+    @abstractmethod
+    def output_signal_length(self) -> int:
+        ...
+
     @property
     @abstractmethod
     def kernel_size(self) -> int:
@@ -57,9 +61,7 @@ class Conv1dTestbench:
         self._fxp_params = fxp_params
         self._converter = NumberConverter(self._fxp_params)
         self._kernel_size = uut.kernel_size
-        self._output_signal_length = math.floor(
-            self._input_signal_length - self._kernel_size + 1
-        )
+        self._output_signal_length = uut.output_signal_length
         self._y_address_width = uut.port["y_address"].width
 
     def save_to(self, destination: Path):
@@ -0,0 +1,155 @@
+from functools import partial
+
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design import std_signals
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.design.signal import Signal
+from elasticai.creator.vhdl.shared_designs.rom import Rom
+
+
+class FPGRUCell(Design):
+    """Hardware GRU cell computing one time step, see `gru_cell.tpl.vhd`.
+
+    The port equals the one of `FPLSTMCell`, so the cell can take the place
+    of the LSTM cell in an `LSTMNetworkDesign`. Like there, `x_data` carries
+    a single value per step, so only an `input_size` of one is supported.
+    Weights and biases are shaped like those of `torch.nn.GRUCell`. Each
+    gate gets a weight ROM holding the rows of `[w_ih, w_hh]` one after
+    another, the input and hidden biases are kept in separate ROMs.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        hardtanh: Design,
+        hardsigmoid: Design,
+        total_bits: int,
+        frac_bits: int,
+        w_ih: list[list[int]],
+        w_hh: list[list[int]],
+        b_ih: list[int],
+        b_hh: list[int],
+        work_library_name: str = "work",
+    ) -> None:
+        super().__init__(name=name)
+        self.input_size = len(w_ih[0])
+        self.hidden_size = len(w_ih) // 3
+        if self.input_size != 1:
+            raise ValueError(
+                f"the cell reads a single input value per step, but input_size is"
+                f" {self.input_size}"
+            )
+        self.total_bits = total_bits
+        self.frac_bits = frac_bits
+        self.weights_ih = w_ih
+        self.weights_hh = w_hh
+        self.biases_ih = b_ih
+        self.biases_hh = b_hh
+        self.work_library_name = work_library_name
+        self._htanh = hardtanh
+        self._hsigmoid = hardsigmoid
+        self._ram_name = f"dual_port_2_clock_ram_{self.name}"
+
+    @property
+    def _hidden_addr_width(self) -> int:
+        return calculate_address_width(self.hidden_size)
+
+    @property
+    def port(self) -> Port:
+        ctrl_signal = partial(Signal, width=0)
+        return Port(
+            incoming=[
+                std_signals.clock(),
+                ctrl_signal("reset"),
+                std_signals.enable(),
+                ctrl_signal("zero_state"),
+                Signal("x_data", width=self.total_bits),
+                ctrl_signal("h_out_en"),
+                Signal("h_out_addr", width=self._hidden_addr_width),
+            ],
+            outgoing=[
+                std_signals.done(),
+                Signal("h_out_data", self.total_bits),
+            ],
+        )
+
+    def rom_values(self) -> dict[str, list[int]]:
+        """Contents of the ROMs by base name, the names of the entities are
+        `f"{base_name}_rom_{name}"`."""
+        rows = [
+            row_ih + row_hh for row_ih, row_hh in zip(self.weights_ih, self.weights_hh)
+        ]
+        h = self.hidden_size
+
+        def gate(values: list, index: int) -> list:
+            return values[index * h : (index + 1) * h]
+
+        def flatten(gate_rows: list[list[int]]) -> list[int]:
+            return [value for row in gate_rows for value in row]
+
+        return dict(
+            wr=flatten(gate(rows, 0)),
+            wz=flatten(gate(rows, 1)),
+            wn=flatten(gate(rows, 2)),
+            bir=gate(self.biases_ih, 0),
+            biz=gate(self.biases_ih, 1),
+            bin=gate(self.biases_ih, 2),
+            bhr=gate(self.biases_hh, 0),
+            bhz=gate(self.biases_hh, 1),
+            bhn=gate(self.biases_hh, 2),
+        )
+
+    def get_file_load_order(self) -> list[str]:
+        return [f"{name}_rom_{self.name}.vhd" for name in self.rom_values()] + [
+            f"{self._ram_name}.vhd",
+            f"{self._htanh.name}.vhd",
+            f"{self._hsigmoid.name}.vhd",
+        ]
+
+    def save_to(self, destination: Path) -> None:
+        destination = destination.create_subpath(self.name)
+        for base_name, values in self.rom_values().items():
+            rom_name = f"{base_name}_rom_{self.name}"
+            rom = Rom(
+                name=rom_name, data_width=self.total_bits, values_as_integers=values
+            )
+            rom.save_to(destination.create_subpath(rom_name))
+
+        ram = InProjectTemplate(
+            package="elasticai.creator.nn.fixed_point.lstm.design",
+            file_name="dual_port_2_clock_ram.tpl.vhd",
+            parameters=dict(name=self.name),
+        )
+        destination.create_subpath(self._ram_name).as_file(".vhd").write(ram)
+        self._htanh.save_to(destination)
+        self._hsigmoid.save_to(destination)
+
+        vector_length = self.input_size + self.hidden_size
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="gru_cell.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                library=self.work_library_name,
+                ram_name=self._ram_name,
+                tanh_name=self._htanh.name,
+                sigmoid_name=self._hsigmoid.name,
+                data_width=str(self.total_bits),
+                frac_width=str(self.frac_bits),
+                input_size=str(self.input_size),
+                hidden_size=str(self.hidden_size),
+                hidden_addr_width=str(self._hidden_addr_width),
+                w_addr_width=str(
+                    calculate_address_width(vector_length * self.hidden_size)
+                ),
+                acc_width=str(2 * self.total_bits + vector_length.bit_length()),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
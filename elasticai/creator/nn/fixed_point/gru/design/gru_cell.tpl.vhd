@@ -0,0 +1,338 @@
+-- GRU cell computing one time step.
+-- The gates of the hidden units are computed one unit after another. For
+-- each unit the input and hidden parts of the reset, update and new gate
+-- are accumulated separately over one tap of [x, h] per cycle, because the
+-- reset gate only scales the hidden part of the new gate. All additions
+-- saturate, products are truncated towards zero and saturated, just like
+-- MathOperations does. The new hidden state n + z*(h-n) is kept in temp_h
+-- until all units are done and copied to buffer_h afterwards, so that all
+-- units see the previous hidden state. Like for the lstm cell, x_data is
+-- the single input value of the step and h_out_addr reads the new hidden
+-- state once done is set.
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+library ${library};
+
+entity ${name} is
+    generic (
+        DATA_WIDTH  : integer := ${data_width};
+        FRAC_WIDTH  : integer := ${frac_width};
+
+        INPUT_SIZE  : integer := ${input_size};
+        HIDDEN_SIZE : integer := ${hidden_size};
+
+        HIDDEN_ADDR_WIDTH : integer := ${hidden_addr_width};  -- equals to ceil(log2(hidden_size))
+        W_ADDR_WIDTH : integer := ${w_addr_width};            -- equals to ceil(log2((input_size+hidden_size)*hidden_size))
+        ACC_WIDTH : integer := ${acc_width}
+    );
+    port (
+        clock      : in std_logic;
+        reset      : in std_logic;
+        enable     : in std_logic;   -- start computing when it is '1'
+        zero_state : in std_logic;   -- first step, the previous hidden state is zero
+
+        x_data : in std_logic_vector(DATA_WIDTH-1 downto 0);
+
+        done : out std_logic;
+
+        h_out_en   : in std_logic;
+        h_out_addr : in std_logic_vector(HIDDEN_ADDR_WIDTH-1 downto 0);
+        h_out_data : out std_logic_vector(DATA_WIDTH-1 downto 0)
+    );
+end ${name};
+
+architecture rtl of ${name} is
+    constant VECTOR_LENGTH : integer := INPUT_SIZE + HIDDEN_SIZE;
+    constant MIN_VALUE : integer := -2**(DATA_WIDTH-1);
+    constant MAX_VALUE : integer := 2**(DATA_WIDTH-1)-1;
+
+    function saturate(value : signed) return signed is
+    begin
+        if value > MAX_VALUE then
+            return to_signed(MAX_VALUE, DATA_WIDTH);
+        elsif value < MIN_VALUE then
+            return to_signed(MIN_VALUE, DATA_WIDTH);
+        end if;
+        return resize(value, DATA_WIDTH);
+    end function;
+
+    -- truncates a sum of products towards zero and saturates
+    function finish(sum : signed(ACC_WIDTH-1 downto 0)) return signed is
+        variable shifted : signed(ACC_WIDTH-1 downto 0);
+    begin
+        shifted := shift_right(sum, FRAC_WIDTH);
+        if sum < 0 and shift_left(shifted, FRAC_WIDTH) /= sum then
+            shifted := shifted + 1;
+        end if;
+        return saturate(shifted);
+    end function;
+
+    function add(a : signed(DATA_WIDTH-1 downto 0);
+                 b : signed(DATA_WIDTH-1 downto 0)) return signed is
+    begin
+        return saturate(resize(a, DATA_WIDTH+1) + resize(b, DATA_WIDTH+1));
+    end function;
+
+    function multiply(a : signed(DATA_WIDTH-1 downto 0);
+                      b : signed(DATA_WIDTH-1 downto 0)) return signed is
+    begin
+        return finish(resize(a * b, ACC_WIDTH));
+    end function;
+
+    type t_state is (s_fetch, s_mac, s_activate, s_update, s_done);
+    signal state : t_state;
+
+    signal n_clock : std_logic;
+
+    signal w_addr : std_logic_vector(W_ADDR_WIDTH-1 downto 0) := (others => '0');
+    signal b_addr : std_logic_vector(HIDDEN_ADDR_WIDTH-1 downto 0) := (others => '0');
+    signal std_wr, std_wz, std_wn : std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal std_bir, std_biz, std_bin : std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal std_bhr, std_bhz, std_bhn : std_logic_vector(DATA_WIDTH-1 downto 0);
+
+    signal h_read_addr : std_logic_vector(HIDDEN_ADDR_WIDTH-1 downto 0) := (others => '0');
+    signal h_read_data : std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal h_write_addr : std_logic_vector(HIDDEN_ADDR_WIDTH-1 downto 0) := (others => '0');
+    signal h_write_data : std_logic_vector(DATA_WIDTH-1 downto 0) := (others => '0');
+    signal h_we : std_logic := '0';
+
+    signal temp_h_addr : std_logic_vector(HIDDEN_ADDR_WIDTH-1 downto 0) := (others => '0');
+    signal temp_h_read_addr : std_logic_vector(HIDDEN_ADDR_WIDTH-1 downto 0);
+    signal temp_h_read_data : std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal temp_h_write_addr : std_logic_vector(HIDDEN_ADDR_WIDTH-1 downto 0) := (others => '0');
+    signal temp_h_write_data : std_logic_vector(DATA_WIDTH-1 downto 0) := (others => '0');
+    signal temp_h_we : std_logic := '0';
+
+    signal sigmoid_in, sigmoid_out : std_logic_vector(DATA_WIDTH-1 downto 0) := (others => '0');
+    signal tanh_in, tanh_out : std_logic_vector(DATA_WIDTH-1 downto 0) := (others => '0');
+begin
+    n_clock <= not clock;
+
+    main : process (clock, reset)
+        variable tap : integer range 0 to VECTOR_LENGTH := 0;
+        variable unit : integer range 0 to HIDDEN_SIZE-1 := 0;
+        variable matrix_idx : integer range 0 to VECTOR_LENGTH*HIDDEN_SIZE-1 := 0;
+        variable h_idx : integer range 0 to HIDDEN_SIZE-1 := 0;
+        variable step : integer range 0 to 4 := 0;
+        variable value : signed(DATA_WIDTH-1 downto 0);
+        variable sum_xr, sum_xz, sum_xn : signed(ACC_WIDTH-1 downto 0);
+        variable sum_hr, sum_hz, sum_hn : signed(ACC_WIDTH-1 downto 0);
+        variable r, z, n, h_prev : signed(DATA_WIDTH-1 downto 0);
+    begin
+        if reset = '1' then
+            state <= s_fetch;
+            done <= '0';
+            h_we <= '0';
+            temp_h_we <= '0';
+            tap := 0;
+            unit := 0;
+            matrix_idx := 0;
+            h_idx := 0;
+            step := 0;
+        elsif rising_edge(clock) then
+            h_we <= '0';
+            temp_h_we <= '0';
+            if enable = '1' then
+                case state is
+                    when s_fetch =>
+                        -- the weights of the first tap arrive with the next edge
+                        tap := 0;
+                        sum_xr := (others => '0');
+                        sum_xz := (others => '0');
+                        sum_xn := (others => '0');
+                        sum_hr := (others => '0');
+                        sum_hz := (others => '0');
+                        sum_hn := (others => '0');
+                        state <= s_mac;
+
+                    when s_mac =>
+                        if tap < INPUT_SIZE then
+                            value := signed(x_data);
+                        elsif zero_state = '1' then
+                            value := (others => '0');
+                        else
+                            value := signed(h_read_data);
+                        end if;
+                        if tap < INPUT_SIZE then
+                            sum_xr := sum_xr + value * signed(std_wr);
+                            sum_xz := sum_xz + value * signed(std_wz);
+                            sum_xn := sum_xn + value * signed(std_wn);
+                        else
+                            sum_hr := sum_hr + value * signed(std_wr);
+                            sum_hz := sum_hz + value * signed(std_wz);
+                            sum_hn := sum_hn + value * signed(std_wn);
+                        end if;
+                        tap := tap + 1;
+                        if tap < VECTOR_LENGTH then
+                            matrix_idx := matrix_idx + 1;
+                            if tap >= INPUT_SIZE then
+                                h_idx := tap - INPUT_SIZE;
+                            end if;
+                        else
+                            -- previous hidden state of this unit for the update
+                            h_idx := unit;
+                            step := 0;
+                            state <= s_activate;
+                        end if;
+
+                    when s_activate =>
+                        -- the shared activations take two edges each
+                        if step = 0 then
+                            if zero_state = '1' then
+                                h_prev := (others => '0');
+                            else
+                                h_prev := signed(h_read_data);
+                            end if;
+                            sigmoid_in <= std_logic_vector(add(
+                                add(finish(sum_xr), signed(std_bir)),
+                                add(finish(sum_hr), signed(std_bhr))));
+                        elsif step = 1 then
+                            sigmoid_in <= std_logic_vector(add(
+                                add(finish(sum_xz), signed(std_biz)),
+                                add(finish(sum_hz), signed(std_bhz))));
+                        elsif step = 2 then
+                            r := signed(sigmoid_out);
+                            tanh_in <= std_logic_vector(add(
+                                add(finish(sum_xn), signed(std_bin)),
+                                multiply(r, add(finish(sum_hn), signed(std_bhn)))));
+                        elsif step = 3 then
+                            z := signed(sigmoid_out);
+                        else
+                            n := signed(tanh_out);
+                            temp_h_write_addr <= std_logic_vector(to_unsigned(unit, HIDDEN_ADDR_WIDTH));
+                            temp_h_write_data <= std_logic_vector(add(n, multiply(z, add(h_prev, -n))));
+                            temp_h_we <= '1';
+                            if unit < HIDDEN_SIZE-1 then
+                                unit := unit + 1;
+                                matrix_idx := matrix_idx + 1;
+                                state <= s_fetch;
+                            else
+                                unit := 0;
+                                state <= s_update;
+                            end if;
+                        end if;
+                        if step < 4 then
+                            step := step + 1;
+                        else
+                            step := 0;
+                        end if;
+
+                    when s_update =>
+                        -- copy temp_h to buffer_h, one cycle to read and one to write
+                        if step = 0 then
+                            temp_h_addr <= std_logic_vector(to_unsigned(unit, HIDDEN_ADDR_WIDTH));
+                            step := 1;
+                        else
+                            h_write_addr <= std_logic_vector(to_unsigned(unit, HIDDEN_ADDR_WIDTH));
+                            h_write_data <= temp_h_read_data;
+                            h_we <= '1';
+                            step := 0;
+                            if unit < HIDDEN_SIZE-1 then
+                                unit := unit + 1;
+                            else
+                                state <= s_done;
+                            end if;
+                        end if;
+
+                    when s_done =>
+                        done <= '1';
+                end case;
+            end if;
+
+            w_addr <= std_logic_vector(to_unsigned(matrix_idx, W_ADDR_WIDTH));
+            b_addr <= std_logic_vector(to_unsigned(unit, HIDDEN_ADDR_WIDTH));
+            h_read_addr <= std_logic_vector(to_unsigned(h_idx, HIDDEN_ADDR_WIDTH));
+        end if;
+    end process main;
+
+    temp_h_read_addr <= h_out_addr when state = s_done else temp_h_addr;
+    h_out_data <= temp_h_read_data;
+
+    buffer_h : entity ${library}.${ram_name}(rtl)
+    generic map (
+        RAM_WIDTH => DATA_WIDTH,
+        RAM_DEPTH_WIDTH => HIDDEN_ADDR_WIDTH,
+        RAM_PERFORMANCE => "LOW_LATENCY",
+        INIT_FILE => ""
+    )
+    port map (
+        addra  => h_write_addr,
+        addrb  => h_read_addr,
+        dina   => h_write_data,
+        clka   => clock,
+        clkb   => n_clock,
+        wea    => h_we,
+        enb    => '1',
+        rstb   => '0',
+        regceb => '0',
+        doutb  => h_read_data
+    );
+
+    temp_h : entity ${library}.${ram_name}(rtl)
+    generic map (
+        RAM_WIDTH => DATA_WIDTH,
+        RAM_DEPTH_WIDTH => HIDDEN_ADDR_WIDTH,
+        RAM_PERFORMANCE => "LOW_LATENCY",
+        INIT_FILE => ""
+    )
+    port map (
+        addra  => temp_h_write_addr,
+        addrb  => temp_h_read_addr,
+        dina   => temp_h_write_data,
+        clka   => clock,
+        clkb   => n_clock,
+        wea    => temp_h_we,
+        enb    => '1',
+        rstb   => '0',
+        regceb => '0',
+        doutb  => temp_h_read_data
+    );
+
+    shared_sigmoid : entity ${library}.${sigmoid_name}(rtl)
+    port map (
+        enable => '1',
+        clock  => clock,
+        x      => sigmoid_in,
+        y      => sigmoid_out
+    );
+
+    shared_tanh : entity ${library}.${tanh_name}(rtl)
+    port map (
+        enable => '1',
+        clock  => clock,
+        x      => tanh_in,
+        y      => tanh_out
+    );
+
+    -- weights [W_i*, W_h*] of the reset, update and new gate, row by row
+    rom_wr : entity ${library}.wr_rom_${name}(rtl)
+    port map (clk => n_clock, en => '1', addr => w_addr, data => std_wr);
+
+    rom_wz : entity ${library}.wz_rom_${name}(rtl)
+    port map (clk => n_clock, en => '1', addr => w_addr, data => std_wz);
+
+    rom_wn : entity ${library}.wn_rom_${name}(rtl)
+    port map (clk => n_clock, en => '1', addr => w_addr, data => std_wn);
+
+    -- input and hidden biases are added after their own products
+    rom_bir : entity ${library}.bir_rom_${name}(rtl)
+    port map (clk => n_clock, en => '1', addr => b_addr, data => std_bir);
+
+    rom_biz : entity ${library}.biz_rom_${name}(rtl)
+    port map (clk => n_clock, en => '1', addr => b_addr, data => std_biz);
+
+    rom_bin : entity ${library}.bin_rom_${name}(rtl)
+    port map (clk => n_clock, en => '1', addr => b_addr, data => std_bin);
+
+    rom_bhr : entity ${library}.bhr_rom_${name}(rtl)
+    port map (clk => n_clock, en => '1', addr => b_addr, data => std_bhr);
+
+    rom_bhz : entity ${library}.bhz_rom_${name}(rtl)
+    port map (clk => n_clock, en => '1', addr => b_addr, data => std_bhz);
+
+    rom_bhn : entity ${library}.bhn_rom_${name}(rtl)
+    port map (clk => n_clock, en => '1', addr => b_addr, data => std_bhn);
+end architecture rtl;
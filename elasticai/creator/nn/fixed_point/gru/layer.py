@@ -0,0 +1,106 @@
+from typing import Optional, cast
+
+import torch
+
+from elasticai.creator.base_modules.gru import GRU
+from elasticai.creator.base_modules.gru_cell import GRUCell
+from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
+    FixedPointConfig,
+)
+from elasticai.creator.nn.fixed_point.gru.design.fp_gru_cell import FPGRUCell
+from elasticai.creator.nn.fixed_point.hard_sigmoid import HardSigmoid
+from elasticai.creator.nn.fixed_point.hard_tanh import HardTanh
+from elasticai.creator.vhdl.design_creator import DesignCreator
+
+from .._gradient_quantization import GradientCounters, quantize_parameter_gradients
+from .._math_operations import MathOperations
+from .._recurrent_network import RecurrentNetwork
+
+
+class GRUNetwork(RecurrentNetwork):
+    """`FixedPointGRUWithHardActivations` followed by a linear layer. The GRU
+    cell has the same port as the LSTM cell, so it takes its place in the
+    design."""
+
+    _recurrent_name = "gru"
+
+
+class FixedPointGRUWithHardActivations(GRU, DesignCreator):
+    """Fixed point GRU using `HardSigmoid` and `HardTanh`, on its own or as
+    first layer of a `GRUNetwork`. The design computes a single time step,
+    see `FPGRUCell`."""
+
+    def __init__(
+        self,
+        total_bits: int,
+        frac_bits: int,
+        input_size: int,
+        hidden_size: int,
+        bias: bool,
+        gradient_config: Optional[FixedPointConfig] = None,
+    ) -> None:
+        config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
+        operations = MathOperations(config=config, gradient_config=gradient_config)
+
+        class LayerFactory:
+            def gru(self, input_size: int, hidden_size: int, bias: bool) -> GRUCell:
+                def activation(constructor):
+                    def wrapped_constructor():
+                        return constructor(total_bits=total_bits, frac_bits=frac_bits)
+
+                    return wrapped_constructor
+
+                return GRUCell(
+                    operations=operations,
+                    sigmoid_factory=activation(HardSigmoid),
+                    tanh_factory=activation(HardTanh),
+                    input_size=input_size,
+                    hidden_size=hidden_size,
+                    bias=bias,
+                )
+
+        super().__init__(
+            input_size=input_size,
+            hidden_size=hidden_size,
+            bias=bias,
+            batch_first=True,
+            layers=LayerFactory(),
+        )
+
+        self._config = config
+        self._operations = operations
+        if gradient_config is not None:
+            quantize_parameter_gradients(
+                self.parameters(), gradient_config, operations.gradient_counters
+            )
+
+    @property
+    def fixed_point_config(self) -> FixedPointConfig:
+        return self._config
+
+    @property
+    def gradient_counters(self) -> GradientCounters:
+        return self._operations.gradient_counters
+
+    def create_design(self, name: str = "gru_cell") -> FPGRUCell:
+        """The ROMs hold the parameters as quantized by the forward pass."""
+        cell = cast(GRUCell, self.cell)
+
+        def as_integers(parameter: Optional[torch.Tensor]) -> list:
+            if parameter is None:
+                return [0] * 3 * self.hidden_size
+            with torch.no_grad():
+                quantized = self._operations.quantize_parameter(parameter)
+            return torch.round(quantized * (1 << self._config.frac_bits)).int().tolist()
+
+        return FPGRUCell(
+            name=name,
+            hardtanh=cell.tanh.create_design(f"{name}_hardtanh"),
+            hardsigmoid=cell.sigmoid.create_design(f"{name}_hardsigmoid"),
+            total_bits=self._config.total_bits,
+            frac_bits=self._config.frac_bits,
+            w_ih=as_integers(cell.linear_ih.weight),
+            w_hh=as_integers(cell.linear_hh.weight),
+            b_ih=as_integers(cell.linear_ih.bias),
+            b_hh=as_integers(cell.linear_hh.bias),
+        )
@@ -0,0 +1,163 @@
+from typing import cast
+
+import pytest
+import torch
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryPath
+from elasticai.creator.nn.fixed_point import Linear
+from elasticai.creator.nn.fixed_point.hard_sigmoid.design import (
+    HardSigmoid as HardSigmoidDesign,
+)
+from elasticai.creator.nn.fixed_point.hard_tanh.design import HardTanh as HardTanhDesign
+
+from .design.fp_gru_cell import FPGRUCell
+from .layer import FixedPointGRUWithHardActivations, GRUNetwork
+
+TOTAL_BITS = 8
+FRAC_BITS = 4
+MIN_VALUE = -(2 ** (TOTAL_BITS - 1))
+MAX_VALUE = 2 ** (TOTAL_BITS - 1) - 1
+
+
+def create_gru(input_size: int = 1) -> FixedPointGRUWithHardActivations:
+    torch.manual_seed(42)
+    return FixedPointGRUWithHardActivations(
+        total_bits=TOTAL_BITS,
+        frac_bits=FRAC_BITS,
+        input_size=input_size,
+        hidden_size=3,
+        bias=True,
+    )
+
+
+def saturate(value: int) -> int:
+    return max(MIN_VALUE, min(MAX_VALUE, value))
+
+
+def finish(total: int) -> int:
+    truncated = abs(total) >> FRAC_BITS
+    return saturate(truncated if total >= 0 else -truncated)
+
+
+def add(a: int, b: int) -> int:
+    return saturate(a + b)
+
+
+def multiply(a: int, b: int) -> int:
+    return finish(a * b)
+
+
+def hard_sigmoid(design: HardSigmoidDesign, x: int) -> int:
+    """Mirrors `hard_sigmoid.tpl.vhd` on integers."""
+    if x <= design._zero_threshold:
+        return 0
+    if x >= design._one_threshold:
+        return design._one
+    return multiply(x, design._slope) + design._y_intercept
+
+
+def hard_tanh(design: HardTanhDesign, x: int) -> int:
+    """Mirrors `hard_tanh.tpl.vhd` on integers."""
+    return max(design._min_val, min(design._max_val, x))
+
+
+def emulate_step(design: FPGRUCell, x: int, h_prev: list[int]) -> list[int]:
+    """Mirrors the datapath of `gru_cell.tpl.vhd` on integers."""
+    sigmoid = cast(HardSigmoidDesign, design._hsigmoid)
+    tanh = cast(HardTanhDesign, design._htanh)
+    roms = design.rom_values()
+    vector_length = design.input_size + design.hidden_size
+    taps = [x, *h_prev]
+    h = []
+    for unit in range(design.hidden_size):
+
+        def gate(name: str) -> int:
+            w = roms[f"w{name}"][unit * vector_length : (unit + 1) * vector_length]
+            x_part = sum(t * v for t, v in zip(taps[:1], w[:1]))
+            h_part = sum(t * v for t, v in zip(taps[1:], w[1:]))
+            return add(finish(x_part), roms[f"bi{name}"][unit]), add(
+                finish(h_part), roms[f"bh{name}"][unit]
+            )
+
+        r = hard_sigmoid(sigmoid, add(*gate("r")))
+        z = hard_sigmoid(sigmoid, add(*gate("z")))
+        x_n, h_n = gate("n")
+        n = hard_tanh(tanh, add(x_n, multiply(r, h_n)))
+        h.append(add(n, multiply(z, add(h_prev[unit], -n))))
+    return h
+
+
+def test_emulated_design_computes_what_the_layer_does() -> None:
+    gru = create_gru()
+    design = gru.create_design()
+    scale = 1 << FRAC_BITS
+
+    torch.manual_seed(0)
+    inputs = torch.trunc(torch.randn(4, 6, 1) * 2 * scale) / scale
+    with torch.no_grad():
+        outputs, _ = gru(inputs)
+
+    for sequence, expected in zip(inputs, outputs):
+        h_prev = [0, 0, 0]
+        for x, h in zip(sequence, expected):
+            h_prev = emulate_step(design, int(x.item() * scale), h_prev)
+            assert (h * scale).to(torch.int64).tolist() == h_prev
+
+
+def test_outputs_are_on_the_fixed_point_grid() -> None:
+    outputs, h = create_gru(input_size=2)(torch.randn(4, 5, 2))
+    assert (4, 5, 3) == tuple(outputs.shape)
+    assert (1, 4, 3) == tuple(h.shape)
+    assert torch.equal(outputs, torch.trunc(outputs * 16) / 16)
+
+
+def test_design_has_the_port_of_the_lstm_cell() -> None:
+    port = create_gru().create_design().port
+    assert {
+        "clock",
+        "reset",
+        "enable",
+        "zero_state",
+        "x_data",
+        "h_out_en",
+        "h_out_addr",
+    } == {s.name for s in port.incoming}
+    assert {"done", "h_out_data"} == {s.name for s in port.outgoing}
+
+
+def test_design_saves_cell_roms_ram_and_activations() -> None:
+    destination = InMemoryPath("build", parent=None)
+    create_gru().create_design("gru").save_to(destination)
+
+    files = destination.children["gru"].children
+    roms = {f"{name}_rom_gru" for name in ("wr", "wz", "wn")} | {
+        f"b{part}{gate}_rom_gru" for part in "ih" for gate in "rzn"
+    }
+    expected = roms | {
+        "gru",
+        "dual_port_2_clock_ram_gru",
+        "gru_hardtanh",
+        "gru_hardsigmoid",
+    }
+    assert expected == set(files)
+    assert "entity gru is" in "\n".join(files["gru"].text)
+
+
+def test_design_needs_a_single_input() -> None:
+    with pytest.raises(ValueError):
+        create_gru(input_size=2).create_design()
+
+
+def test_network_design_drives_the_gru_cell() -> None:
+    network = GRUNetwork(
+        [
+            create_gru(),
+            Linear(total_bits=8, frac_bits=4, in_features=3, out_features=1),
+        ]
+    )
+    assert (4, 1) == tuple(network(torch.randn(4, 6, 1)).shape)
+
+    destination = InMemoryPath("build", parent=None)
+    network.create_design("network").save_to(destination)
+    code = "\n".join(destination.children["lstm_network"].text)
+    assert "entity work.gru_cell(rtl)" in code
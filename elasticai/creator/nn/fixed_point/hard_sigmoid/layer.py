@@ -1,4 +1,10 @@
+import torch
+
 from elasticai.creator.base_modules.hard_sigmoid import HardSigmoid as HardSigmoidBase
+from elasticai.creator.base_modules.straight_through import straight_through
+from elasticai.creator.nn.fixed_point._hardware_math_operations import (
+    HardwareMathOperations,
+)
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
 )
@@ -8,9 +14,23 @@ from .design import HardSigmoid as HardSigmoidDesign
 
 
 class HardSigmoid(DesignCreator, HardSigmoidBase):
+    """Hard sigmoid computed like its design: inputs are truncated onto the
+    fixed point grid, the linear part uses the quantized slope and y
+    intercept. Gradients are the ones of `torch.nn.Hardsigmoid`."""
+
     def __init__(self, total_bits: int, frac_bits: int) -> None:
         super().__init__()
         self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
+        self._hardware = HardwareMathOperations(self._config)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if x.is_floating_point():
+            y = self._hardware.hard_sigmoid(x.detach()).to(x.dtype)
+            if torch.is_grad_enabled() and x.requires_grad:
+                return straight_through(y, super().forward(x))
+            return y
+        y = self._hardware.hard_sigmoid(self._hardware.as_rational(x))
+        return self._hardware.as_integer(y).to(x.dtype)
 
     def create_design(self, name: str) -> HardSigmoidDesign:
         return HardSigmoidDesign(
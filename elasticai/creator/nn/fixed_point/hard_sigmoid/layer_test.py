@@ -1,5 +1,8 @@
 from typing import cast
 
+import pytest
+import torch
+
 from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
 
 from .layer import HardSigmoid
@@ -98,3 +101,46 @@ end architecture rtl;
     design.save_to(build_path)
     actual = cast(InMemoryFile, build_path["sigmoid"]).text
     assert actual == expected
+
+
+@pytest.mark.parametrize("total_bits, frac_bits", [(8, 4), (16, 8)])
+def test_integer_forward_matches_design_arithmetic(
+    total_bits: int, frac_bits: int
+) -> None:
+    sigmoid = HardSigmoid(total_bits=total_bits, frac_bits=frac_bits)
+    design = sigmoid.create_design("sigmoid")
+    one, slope, y_intercept = design._one, design._slope, design._y_intercept
+    zero_threshold, one_threshold = design._zero_threshold, design._one_threshold
+    x = torch.arange(-(1 << (total_bits - 1)), 1 << (total_bits - 1))
+
+    def linear_op(value: int) -> int:
+        product = value * slope
+        truncated = abs(product) >> frac_bits
+        return (truncated if product >= 0 else -truncated) + y_intercept
+
+    expected = [
+        0 if v <= zero_threshold else one if v >= one_threshold else linear_op(v)
+        for v in x.tolist()
+    ]
+
+    assert expected == sigmoid(x).tolist()
+
+
+def test_float_forward_matches_integer_forward() -> None:
+    sigmoid = HardSigmoid(total_bits=8, frac_bits=4)
+    x = torch.arange(-128, 128)
+
+    actual = sigmoid(x.to(torch.float32) / 16) * 16
+
+    assert sigmoid(x).tolist() == actual.to(torch.int64).tolist()
+
+
+def test_float_forward_keeps_hard_sigmoid_gradient() -> None:
+    sigmoid = HardSigmoid(total_bits=8, frac_bits=4)
+    x = torch.tensor([-4.0, -1.0, 0.5, 4.0], requires_grad=True)
+    expected = torch.tensor([-4.0, -1.0, 0.5, 4.0], requires_grad=True)
+
+    sigmoid(x).sum().backward()
+    torch.nn.functional.hardsigmoid(expected).sum().backward()
+
+    assert expected.grad.tolist() == x.grad.tolist()
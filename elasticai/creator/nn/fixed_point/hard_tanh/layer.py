@@ -1,3 +1,5 @@
+import torch
+
 from elasticai.creator.base_modules.hard_tanh import HardTanh as HardTanhBase
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
@@ -14,6 +16,15 @@ class HardTanh(DesignCreator, HardTanhBase):
         super().__init__(min_val, max_val)
         self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
 
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if x.is_floating_point():
+            return super().forward(x)
+        return torch.clamp(
+            x,
+            min=self._config.as_integer(self.min_val),
+            max=self._config.as_integer(self.max_val),
+        )
+
     def create_design(self, name: str) -> HardTanhDesign:
         return HardTanhDesign(
             name=name,
@@ -59,6 +59,23 @@ class Linear(Design):
             )
         )
 
+    def _mac_parameters(self) -> dict[str, str | list[str]]:
+        """Parameters of `linear.tpl.vhd` that define the weights: their
+        width, the weight `FXP_ONE` that seeds the accumulator with the bias
+        and the lines computing the product `TEMP` of `w` and `x`."""
+        return dict(
+            weight_width="DATA_WIDTH",
+            fxp_one="to_signed(2**FRAC_WIDTH,DATA_WIDTH)",
+            product=["TEMP := w * x;"],
+        )
+
+    def _weights_rom(self, name: str) -> Rom:
+        return Rom(
+            name=name,
+            data_width=self.data_width,
+            values_as_integers=self._flatten_params(self.weights),
+        )
+
     @staticmethod
     def _flatten_params(params: list[list[int]]) -> list[int]:
         return list(chain(*params))
@@ -67,7 +84,7 @@ class Linear(Design):
         rom_name = dict(weights=f"{self.name}_w_rom", bias=f"{self.name}_b_rom")
 
         template = InProjectTemplate(
-            package=module_to_package(self.__module__),
+            package=module_to_package(__name__),
             file_name="linear.tpl.vhd",
             parameters=dict(
                 layer_name=self.name,
@@ -76,15 +93,12 @@ class Linear(Design):
                 work_library_name=self.work_library_name,
                 resource_option=f'"{self.resource_option}"',
                 **self._template_parameters(),
+                **self._mac_parameters(),
             ),
         )
         destination.create_subpath(self.name).as_file(".vhd").write(template)
 
-        weights_rom = Rom(
-            name=rom_name["weights"],
-            data_width=self.data_width,
-            values_as_integers=self._flatten_params(self.weights),
-        )
+        weights_rom = self._weights_rom(rom_name["weights"])
         weights_rom.save_to(destination.create_subpath(rom_name["weights"]))
 
         bias_rom = Rom(
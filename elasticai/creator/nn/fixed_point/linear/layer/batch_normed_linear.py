@@ -3,6 +3,7 @@ from typing import Any, cast
 import torch
 
 from elasticai.creator.base_modules.linear import Linear as LinearBase
+from elasticai.creator.nn.fixed_point._batch_norm_folding import FoldedParameterCache
 from elasticai.creator.nn.fixed_point._math_operations import MathOperations
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
@@ -12,6 +13,15 @@ from elasticai.creator.vhdl.design_creator import DesignCreator
 
 
 class BatchNormedLinear(DesignCreator, torch.nn.Module):
+    """Fixed point linear layer followed by batch normalization.
+
+    In eval mode the batch normalization is folded into the weights and
+    bias, which are rounded onto the fixed point grid, see
+    `FoldedParameterCache`. The forward pass is then the linear operation of
+    the design from `create_design`, with exactly its parameters: the bias
+    is added to the exact sum of products, which is quantized once.
+    """
+
     def __init__(
         self,
         total_bits: int,
@@ -43,6 +53,7 @@ class BatchNormedLinear(DesignCreator, torch.nn.Module):
             track_running_stats=True,
             device=device,
         )
+        self._folded_parameters = FoldedParameterCache(self._operations.config)
 
     @property
     def lin_weight(self) -> torch.Tensor:
@@ -61,6 +72,10 @@ class BatchNormedLinear(DesignCreator, torch.nn.Module):
         return self._batch_norm.bias
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if not self.training:
+            weight, bias = self._folded()
+            return self._operations.fused_linear(x, weight, bias)
+
         has_batches = x.dim() == 2
         input_shape = x.shape if has_batches else (1, -1)
         output_shape = (x.shape[0], -1) if has_batches else (-1,)
@@ -78,23 +93,7 @@ class BatchNormedLinear(DesignCreator, torch.nn.Module):
                 return list(map(float_to_signed_int, value))
             return self._operations.config.as_integer(value)
 
-        bn_mean = cast(torch.Tensor, self._batch_norm.running_mean)
-        bn_variance = cast(torch.Tensor, self._batch_norm.running_var)
-        bn_epsilon = self._batch_norm.eps
-        lin_weight = self._linear.weight
-        lin_bias = (
-            torch.tensor([0] * self._linear.out_features)
-            if self._linear.bias is None
-            else self._linear.bias
-        )
-
-        std = torch.sqrt(bn_variance + bn_epsilon)
-        weights = lin_weight / std
-        bias = (lin_bias - bn_mean) / std
-
-        if self._batch_norm.affine:
-            weights = (self._batch_norm.weight * weights.t()).t()
-            bias = self._batch_norm.weight * bias + self._batch_norm.bias
+        weights, bias = self._folded()
 
         return LinearDesign(
             in_feature_num=self._linear.in_features,
@@ -105,3 +104,8 @@ class BatchNormedLinear(DesignCreator, torch.nn.Module):
             bias=cast(list[int], float_to_signed_int(bias.tolist())),
             name=name,
         )
+
+    def _folded(self) -> tuple[torch.Tensor, torch.Tensor]:
+        return self._folded_parameters.get(
+            self, self._linear.weight, self._linear.bias, self._batch_norm
+        )
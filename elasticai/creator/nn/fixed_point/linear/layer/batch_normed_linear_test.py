@@ -0,0 +1,78 @@
+import torch
+
+from elasticai.creator.nn.fixed_point._hardware_math_operations import (
+    HardwareMathOperations,
+)
+from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
+    FixedPointConfig,
+)
+
+from .batch_normed_linear import BatchNormedLinear
+
+
+def trained_linear() -> BatchNormedLinear:
+    torch.manual_seed(0)
+    linear = BatchNormedLinear(
+        total_bits=8, frac_bits=4, in_features=3, out_features=2, bn_momentum=1
+    )
+    with torch.no_grad():
+        linear.bn_weight.copy_(torch.tensor([1.5, -0.5]))
+        linear.bn_bias.copy_(torch.tensor([0.25, 0.5]))
+    linear(torch.randn(8, 3))
+    return linear.eval()
+
+
+def test_eval_output_matches_design_emulation() -> None:
+    linear = trained_linear()
+    design = linear.create_design("linear")
+    config = FixedPointConfig(total_bits=8, frac_bits=4)
+    hardware = HardwareMathOperations(config)
+    weight = config.as_rational(torch.tensor(design.weights, dtype=torch.float32))
+    bias = config.as_rational(torch.tensor(design.bias, dtype=torch.float32))
+    x = hardware.quantize(torch.randn(512, 3) * 2)
+    expected = hardware.linear(x, weight, bias)
+    with torch.no_grad():
+        assert torch.equal(linear(x), expected)
+
+
+def test_eval_output_does_not_depend_on_grad_mode() -> None:
+    linear = trained_linear()
+    x = linear._operations.quantize(torch.randn(64, 3) * 2)
+    with torch.no_grad():
+        expected = linear(x)
+    assert torch.equal(linear(x), expected)
+
+
+def test_eval_output_supports_unbatched_inputs() -> None:
+    linear = trained_linear()
+    x = torch.tensor([0.5, -1.0, 2.0])
+    with torch.no_grad():
+        assert torch.equal(linear(x), linear(x[None])[0])
+
+
+def test_folded_parameters_follow_running_statistics() -> None:
+    linear = trained_linear()
+    x = torch.tensor([[0.5, -1.0, 2.0]])
+    with torch.no_grad():
+        before = linear(x)
+        linear.train()
+        linear(torch.randn(8, 3) * 4 + 2)
+        linear.eval()
+        after = linear(x)
+    assert not torch.equal(before, after)
+
+
+def test_folded_parameters_follow_weight_updates() -> None:
+    linear = trained_linear()
+    x = torch.tensor([[0.5, -1.0, 2.0]])
+    with torch.no_grad():
+        before = linear(x)
+        linear.lin_weight.mul_(-1)
+        after = linear(x)
+    assert not torch.equal(before, after)
+
+
+def test_gradients_reach_batch_norm_parameters_in_eval_mode() -> None:
+    linear = trained_linear()
+    linear(torch.tensor([[0.5, -1.0, 2.0]])).sum().backward()
+    assert linear.bn_weight.grad is not None
@@ -1,6 +1,10 @@
-from typing import Any, cast
+from typing import Any, Optional, cast
 
 from elasticai.creator.base_modules.linear import Linear as LinearBase
+from elasticai.creator.nn.fixed_point._gradient_quantization import (
+    GradientCounters,
+    quantize_parameter_gradients,
+)
 from elasticai.creator.nn.fixed_point._math_operations import MathOperations
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
@@ -18,15 +22,26 @@ class Linear(DesignCreator, LinearBase):
         frac_bits: int,
         bias: bool = True,
         device: Any = None,
+        gradient_config: Optional[FixedPointConfig] = None,
     ) -> None:
         self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
         super().__init__(
             in_features=in_features,
             out_features=out_features,
-            operations=MathOperations(config=self._config),
+            operations=MathOperations(
+                config=self._config, gradient_config=gradient_config
+            ),
             bias=bias,
             device=device,
         )
+        if gradient_config is not None:
+            quantize_parameter_gradients(
+                self.parameters(), gradient_config, self.gradient_counters
+            )
+
+    @property
+    def gradient_counters(self) -> GradientCounters:
+        return cast(MathOperations, self._operations).gradient_counters
 
     def create_design(self, name: str) -> LinearDesign:
         def float_to_signed_int(value: float | list) -> int | list:
@@ -159,7 +159,8 @@ architecture rtl of linear is
     --signal addr_b : std_logic_vector((log2(OUT_FEATURE_NUM)-1) downto 0) := (others=>'0');
     signal addr_b : std_logic_vector(Y_ADDR_WIDTH-1 downto 0) := (others=>'0');
 
-    signal fxp_x, fxp_w, fxp_b, fxp_y : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal fxp_x, fxp_b, fxp_y : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal fxp_w : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
     signal macc_sum : signed(2*DATA_WIDTH-1 downto 0) := (others=>'0');
 
     signal reset : std_logic := '0';
@@ -188,7 +189,8 @@ begin
         variable current_input_idx : integer  range 0 to IN_FEATURE_NUM-1 := 0;
         variable var_addr_w : integer range 0 to OUT_FEATURE_NUM*IN_FEATURE_NUM-1 := 0;
         variable var_sum, var_y : signed(2*DATA_WIDTH-1 downto 0);
-        variable var_w, var_x : signed(DATA_WIDTH-1 downto 0);
+        variable var_x : signed(DATA_WIDTH-1 downto 0);
+        variable var_w : signed(DATA_WIDTH-1 downto 0);
         variable y_write_en : std_logic;
         variable var_y_write_idx : integer;
     begin
@@ -33,7 +33,7 @@ architecture rtl of ${layer_name} is
     -- Functions
     -----------------------------------------------------------
     -- macc
-    function multiply_accumulate(w : in signed(DATA_WIDTH-1 downto 0);
+    function multiply_accumulate(w : in signed(${weight_width}-1 downto 0);
                     x : in signed(DATA_WIDTH-1 downto 0);
                     y_0 : in signed(2*DATA_WIDTH-1 downto 0)
             ) return signed is
@@ -42,7 +42,7 @@ architecture rtl of ${layer_name} is
         variable TEMP2 : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
         variable TEMP3 : signed(FRAC_WIDTH-1 downto 0) := (others=>'0');
     begin
-        TEMP := w * x;
+        $product
 
         return TEMP+y_0;
     end function;
@@ -84,19 +84,20 @@ architecture rtl of ${layer_name} is
     -- Signals
     -----------------------------------------------------------
     constant FXP_ZERO : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
-    constant FXP_ONE : signed(DATA_WIDTH-1 downto 0) := to_signed(2**FRAC_WIDTH,DATA_WIDTH);
+    constant FXP_ONE : signed(${weight_width}-1 downto 0) := ${fxp_one};
 
     type t_state is (s_stop, s_forward, s_idle);
 
     signal n_clock : std_logic;
-    signal w_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal w_in : std_logic_vector(${weight_width}-1 downto 0) := (others=>'0');
     signal b_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
 
     signal addr_w : std_logic_vector(log2(IN_FEATURE_NUM*OUT_FEATURE_NUM)-1 downto 0) := (others=>'0');
     --signal addr_b : std_logic_vector((log2(OUT_FEATURE_NUM)-1) downto 0) := (others=>'0');
     signal addr_b : std_logic_vector(Y_ADDR_WIDTH-1 downto 0) := (others=>'0');
 
-    signal fxp_x, fxp_w, fxp_b, fxp_y : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal fxp_x, fxp_b, fxp_y : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal fxp_w : signed(${weight_width}-1 downto 0) := (others=>'0');
     signal macc_sum : signed(2*DATA_WIDTH-1 downto 0) := (others=>'0');
 
     signal reset : std_logic := '0';
@@ -125,7 +126,8 @@ begin
         variable current_input_idx : integer  range 0 to IN_FEATURE_NUM-1 := 0;
         variable var_addr_w : integer range 0 to OUT_FEATURE_NUM*IN_FEATURE_NUM-1 := 0;
         variable var_sum, var_y : signed(2*DATA_WIDTH-1 downto 0);
-        variable var_w, var_x : signed(DATA_WIDTH-1 downto 0);
+        variable var_x : signed(DATA_WIDTH-1 downto 0);
+        variable var_w : signed(${weight_width}-1 downto 0);
         variable y_write_en : std_logic;
         variable var_y_write_idx : integer;
     begin
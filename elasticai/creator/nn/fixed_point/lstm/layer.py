@@ -1,5 +1,4 @@
-from collections import OrderedDict
-from typing import cast
+from typing import Optional, cast
 
 import torch
 
@@ -11,50 +10,37 @@ from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import
 from elasticai.creator.nn.fixed_point.hard_sigmoid import HardSigmoid
 from elasticai.creator.nn.fixed_point.hard_tanh import HardTanh
 from elasticai.creator.nn.fixed_point.lstm.design.fp_lstm_cell import FPLSTMCell
-from elasticai.creator.nn.fixed_point.lstm.design.lstm import LSTMNetworkDesign
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.design_creator import DesignCreator
 
+from .._gradient_quantization import GradientCounters, quantize_parameter_gradients
 from .._math_operations import MathOperations
-from .design.testbench import LSTMTestBench
-
-
-class LSTMNetwork(DesignCreator, torch.nn.Module):
-    def __init__(self, layers: list[torch.nn.Module]):
-        super().__init__()
-        self.lstm = layers[0]
-        self.layer_names = [f"fp_linear_{i}" for i in range(len(layers[1:]))]
-        if len(self.layer_names) > 1:
-            raise NotImplementedError
-        self.layers = torch.nn.Sequential(
-            OrderedDict(
-                {name: layer for name, layer in zip(self.layer_names, layers[1:])}
-            )
-        )
+from .._recurrent_network import RecurrentNetwork
 
-    def create_design(self, name: str) -> LSTMNetworkDesign:
-        first_lstm = cast(FixedPointLSTMWithHardActivations, self.lstm)
-        total_bits = first_lstm.fixed_point_config.total_bits
-        frac_bits = first_lstm.fixed_point_config.frac_bits
-        hidden_size = first_lstm.hidden_size
-        input_size = first_lstm.input_size
-
-        return LSTMNetworkDesign(
-            lstm=first_lstm.create_design(),
-            linear_layer=self.layers[0].create_design(self.layer_names[0]),
-            total_bits=total_bits,
-            frac_bits=frac_bits,
-            hidden_size=hidden_size,
-            input_size=input_size,
-        )
 
-    def create_testbench(self, test_bench_name, uut: Design) -> LSTMTestBench:
-        return LSTMTestBench(test_bench_name, uut)
+class LSTMNetwork(RecurrentNetwork):
+    """`FixedPointLSTMWithHardActivations` followed by a linear layer."""
 
-    def forward(self, x):
-        x, (_, _) = self.lstm(x)
-        x = x[:, -1]
-        return self.layers(x)
+    _recurrent_name = "lstm"
+
+    def stream(self, x: torch.Tensor) -> torch.Tensor:
+        """Output for each step of `x`, continuing the sequence of the
+        previous calls. See `FixedPointLSTMWithHardActivations.stream`."""
+        return self.layers(self._lstm.stream(x))
+
+    def reset_stream(self) -> None:
+        self._lstm.reset_stream()
+
+    @property
+    def stream_state(self) -> Optional[tuple[torch.Tensor, torch.Tensor]]:
+        return self._lstm.stream_state
+
+    def load_stream_state(self, state: tuple[torch.Tensor, torch.Tensor]) -> None:
+        self._lstm.load_stream_state(state)
+
+    @property
+    def _lstm(self) -> "FixedPointLSTMWithHardActivations":
+        return cast(FixedPointLSTMWithHardActivations, self.lstm)
 
 
 class FixedPointLSTMWithHardActivations(LSTM, DesignCreator):
@@ -72,8 +58,12 @@ class FixedPointLSTMWithHardActivations(LSTM, DesignCreator):
         input_size: int,
         hidden_size: int,
         bias: bool,
+        gradient_config: Optional[FixedPointConfig] = None,
+        fused: bool = False,
+        checkpoint_every: Optional[int] = None,
     ) -> None:
         config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
+        operations = MathOperations(config=config, gradient_config=gradient_config)
 
         class LayerFactory:
             def lstm(self, input_size: int, hidden_size: int, bias: bool) -> LSTMCell:
@@ -84,12 +74,13 @@ class FixedPointLSTMWithHardActivations(LSTM, DesignCreator):
                     return wrapped_constructor
 
                 return LSTMCell(
-                    operations=MathOperations(config=config),
+                    operations=operations,
                     sigmoid_factory=activation(HardSigmoid),
                     tanh_factory=activation(HardTanh),
                     input_size=input_size,
                     hidden_size=hidden_size,
                     bias=bias,
+                    fused=fused,
                 )
 
         super().__init__(
@@ -98,14 +89,63 @@ class FixedPointLSTMWithHardActivations(LSTM, DesignCreator):
             bias=bias,
             batch_first=True,
             layers=LayerFactory(),
+            checkpoint_every=checkpoint_every,
         )
 
         self._config = config
+        self._operations = operations
+        self._stream_state: Optional[tuple[torch.Tensor, torch.Tensor]] = None
+        if gradient_config is not None:
+            quantize_parameter_gradients(
+                self.parameters(), gradient_config, operations.gradient_counters
+            )
+
+    def stream(self, x: torch.Tensor) -> torch.Tensor:
+        """Process the steps in `x` (shaped like the input of `forward`),
+        starting from the state left behind by the previous call, and return
+        their outputs. Like the hardware cell, that keeps its state until
+        `zero_state` is set, the first call after `reset_stream` starts from
+        zero. Feeding one step at a time costs a single step per call instead
+        of a window. The state is kept detached from the autograd graph.
+        """
+        outputs, state = self(x, self._stream_state)
+        self._stream_state = self._quantized_state(state)
+        return outputs
+
+    def reset_stream(self) -> None:
+        self._stream_state = None
+
+    @property
+    def stream_state(self) -> Optional[tuple[torch.Tensor, torch.Tensor]]:
+        """Copy of the `(h, c)` state kept by `stream`, shaped like the state
+        returned by `forward`, or `None` after a reset."""
+        if self._stream_state is None:
+            return None
+        h, c = self._stream_state
+        return h.clone(), c.clone()
+
+    def load_stream_state(self, state: tuple[torch.Tensor, torch.Tensor]) -> None:
+        """Continue streaming from `state`, e.g., one exported by
+        `stream_state`, it is rounded onto the fixed point grid."""
+        self._stream_state = self._quantized_state(state)
+
+    def _quantized_state(
+        self, state: tuple[torch.Tensor, torch.Tensor]
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        h, c = state
+        return (
+            self._operations.quantize(h.detach()),
+            self._operations.quantize(c.detach()),
+        )
 
     @property
     def fixed_point_config(self) -> FixedPointConfig:
         return self._config
 
+    @property
+    def gradient_counters(self) -> GradientCounters:
+        return self._operations.gradient_counters
+
     def create_design(self, name: str = "lstm_cell") -> Design:
         def float_to_signed_int(value: float | list) -> int | list:
             if isinstance(value, list):
@@ -0,0 +1,135 @@
+import torch
+
+from elasticai.creator.nn.fixed_point import Linear
+from tests.tensor_test_case import TensorTestCase
+
+from .layer import FixedPointLSTMWithHardActivations, LSTMNetwork
+
+
+def create_lstm() -> FixedPointLSTMWithHardActivations:
+    return FixedPointLSTMWithHardActivations(
+        total_bits=8, frac_bits=4, input_size=2, hidden_size=3, bias=True
+    )
+
+
+def create_network() -> LSTMNetwork:
+    return LSTMNetwork(
+        [
+            create_lstm(),
+            Linear(total_bits=8, frac_bits=4, in_features=3, out_features=1),
+        ]
+    )
+
+
+class HoistedInputProjectionTest(TensorTestCase):
+    """Hoisting runs the input projection as one matmul over all steps. The
+    products of 16 bit formats need about 30 bits, so float32 sums are not
+    exact and bit identity to the cell-by-cell evaluation is checked here on
+    the real fixed point operations."""
+
+    def test_is_bit_identical_to_cell_by_cell_evaluation(self) -> None:
+        for total_bits, frac_bits in [(16, 8), (16, 12), (8, 4)]:
+            for grad_enabled in (True, False):
+                with self.subTest(
+                    total_bits=total_bits,
+                    frac_bits=frac_bits,
+                    grad_enabled=grad_enabled,
+                ), torch.set_grad_enabled(grad_enabled):
+                    torch.manual_seed(42)
+                    lstm = FixedPointLSTMWithHardActivations(
+                        total_bits=total_bits,
+                        frac_bits=frac_bits,
+                        input_size=6,
+                        hidden_size=5,
+                        bias=True,
+                    )
+                    inputs = torch.randn(8, 20, 6) * 4
+
+                    state = None
+                    expected = []
+                    for x in torch.unbind(inputs, dim=1):
+                        state = lstm.cell(x, state)
+                        expected.append(state[0])
+                    actual, _ = lstm(inputs)
+
+                    self.assertTensorEqual(torch.stack(expected, dim=1), actual)
+
+
+class StreamingLSTMTest(TensorTestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(42)
+        self.inputs = torch.randn(4, 12, 2)
+
+    def test_streaming_chunks_equals_processing_whole_sequence(self) -> None:
+        lstm = create_lstm()
+        expected, _ = lstm(self.inputs)
+        chunks = [lstm.stream(chunk) for chunk in self.inputs.split([1, 5, 6], dim=1)]
+        self.assertTensorEqual(expected, torch.cat(chunks, dim=1))
+
+    def test_streaming_single_steps_equals_processing_whole_sequence(self) -> None:
+        lstm = create_lstm()
+        expected, _ = lstm(self.inputs)
+        steps = [lstm.stream(step) for step in self.inputs.split(1, dim=1)]
+        self.assertTensorEqual(expected, torch.cat(steps, dim=1))
+
+    def test_reset_starts_from_zero_state(self) -> None:
+        lstm = create_lstm()
+        expected, _ = lstm(self.inputs)
+        lstm.stream(self.inputs)
+        lstm.reset_stream()
+        self.assertIsNone(lstm.stream_state)
+        self.assertTensorEqual(expected, lstm.stream(self.inputs))
+
+    def test_state_is_the_final_state_of_forward(self) -> None:
+        lstm = create_lstm()
+        _, (h, c) = lstm(self.inputs)
+        lstm.stream(self.inputs)
+        state = lstm.stream_state
+        assert state is not None
+        self.assertTensorEqual(h, state[0])
+        self.assertTensorEqual(c, state[1])
+
+    def test_imported_state_continues_exported_stream(self) -> None:
+        lstm = create_lstm()
+        first, second = self.inputs.split(6, dim=1)
+        lstm.stream(first)
+        state = lstm.stream_state
+        assert state is not None
+        expected = lstm.stream(second)
+
+        lstm.reset_stream()
+        lstm.load_stream_state(state)
+        self.assertTensorEqual(expected, lstm.stream(second))
+
+    def test_imported_state_is_quantized(self) -> None:
+        lstm = create_lstm()
+        lstm.load_stream_state(
+            (torch.full((1, 4, 3), 0.03), torch.full((1, 4, 3), 100.0))
+        )
+        state = lstm.stream_state
+        assert state is not None
+        self.assertTensorEqual(torch.zeros(1, 4, 3), state[0])
+        self.assertTensorEqual(torch.full((1, 4, 3), 7.9375), state[1])
+
+    def test_state_is_detached(self) -> None:
+        lstm = create_lstm()
+        lstm.stream(self.inputs)
+        state = lstm.stream_state
+        assert state is not None
+        self.assertFalse(state[0].requires_grad or state[1].requires_grad)
+
+
+class StreamingLSTMNetworkTest(TensorTestCase):
+    def test_last_streamed_output_equals_forward(self) -> None:
+        torch.manual_seed(42)
+        network = create_network()
+        inputs = torch.randn(4, 12, 2)
+        expected = network(inputs)
+        for step in inputs.split(1, dim=1):
+            outputs = network.stream(step)
+        self.assertTensorEqual(expected, outputs[:, -1])
+
+    def test_stream_yields_an_output_per_step(self) -> None:
+        network = create_network()
+        outputs = network.stream(torch.randn(4, 5, 2))
+        self.assertEqual((4, 5, 1), tuple(outputs.shape))
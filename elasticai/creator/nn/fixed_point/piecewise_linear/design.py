@@ -0,0 +1,66 @@
+from typing import NamedTuple
+
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.code_generation.code_abstractions import (
+    create_array_elements,
+)
+from elasticai.creator.vhdl.design.design import Design, Port
+
+
+class SlopeTerm(NamedTuple):
+    """`sign * 2**exponent`, `sign` is one of -1, 0 and 1."""
+
+    sign: int
+    exponent: int
+
+
+class PiecewiseLinear(Design):
+    """Segment `k` covers `breakpoints[k]` up to `breakpoints[k+1]` and
+    computes `intercepts[k] + sum(term(x - breakpoints[k]) for term in
+    slopes[k])`, where each term is a shift, on integers."""
+
+    def __init__(
+        self,
+        name: str,
+        total_bits: int,
+        breakpoints: list[int],
+        intercepts: list[int],
+        slopes: list[tuple[SlopeTerm, SlopeTerm]],
+    ) -> None:
+        super().__init__(name)
+        self._total_bits = total_bits
+        self._breakpoints = breakpoints
+        self._intercepts = intercepts
+        self._slopes = slopes
+
+    @property
+    def port(self) -> Port:
+        return create_port(x_width=self._total_bits, y_width=self._total_bits)
+
+    def save_to(self, destination: Path) -> None:
+        first, second = zip(*self._slopes)
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="piecewise_linear.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                data_width=str(self._total_bits),
+                segments=str(len(self._intercepts)),
+                breakpoints=create_array_elements(self._breakpoints),
+                intercepts=create_array_elements(self._intercepts),
+                first_signs=create_array_elements([term.sign for term in first]),
+                first_exponents=create_array_elements(
+                    [term.exponent for term in first]
+                ),
+                second_signs=create_array_elements([term.sign for term in second]),
+                second_exponents=create_array_elements(
+                    [term.exponent for term in second]
+                ),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
@@ -0,0 +1,144 @@
+from typing import NamedTuple
+
+import torch
+
+from elasticai.creator.base_modules.straight_through import straight_through
+from elasticai.creator.nn.fixed_point._math_operations import MathOperations
+from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
+    FixedPointConfig,
+)
+from elasticai.creator.vhdl.design_creator import DesignCreator
+
+from .design import PiecewiseLinear as PiecewiseLinearDesign
+from .design import SlopeTerm
+
+
+class _Segments(NamedTuple):
+    """Integer parameters of all segments, the slope of segment `k` is
+    `sum(signs[k] * 2.0**exponents[k])`."""
+
+    breakpoints: torch.Tensor
+    intercepts: torch.Tensor
+    signs: torch.Tensor
+    exponents: torch.Tensor
+
+
+class PiecewiseLinear(DesignCreator, torch.nn.Module):
+    """Approximates `base_module` by `num_segments` linear segments between
+    equidistant breakpoints in `sampling_intervall`, constant outside of it.
+
+    Each segment starts at the quantized value of `base_module` at its
+    breakpoint. Its slope, the one of the chord to the next breakpoint, is
+    rounded to a sum of two signed powers of two, so that the hardware
+    needs two shifts instead of a multiplier. The forward pass computes
+    exactly what the design does, gradients are the ones of `base_module`.
+    """
+
+    def __init__(
+        self,
+        base_module: torch.nn.Module,
+        total_bits: int,
+        frac_bits: int,
+        num_segments: int,
+        sampling_intervall: tuple[float, float],
+    ) -> None:
+        super().__init__()
+        self._base_module = base_module
+        self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
+        self._operations = MathOperations(self._config)
+        self._breakpoints = torch.nn.Parameter(
+            torch.linspace(*sampling_intervall, num_segments + 1),
+            requires_grad=False,
+        )
+        quantized = self._as_integer(self._operations.quantize(self._breakpoints))
+        if torch.any(quantized[1:] <= quantized[:-1]):
+            raise ValueError(
+                f"{num_segments} segments in {sampling_intervall} are too narrow "
+                f"for {frac_bits} fractional bits."
+            )
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        segments = self._segments()
+        x_as_integer = self._as_integer(self._operations.quantize(x.detach()))
+        outputs = self._config.as_rational(
+            self._evaluate(x_as_integer, segments).to(x.dtype)
+        )
+        if torch.is_grad_enabled() and x.requires_grad:
+            return straight_through(outputs, self._base_module(x))
+        return outputs
+
+    def create_design(self, name: str) -> PiecewiseLinearDesign:
+        segments = self._segments()
+        terms = [
+            tuple(
+                SlopeTerm(sign, exponent)
+                for sign, exponent in zip(signs.tolist(), exponents.tolist())
+            )
+            for signs, exponents in zip(segments.signs, segments.exponents)
+        ]
+        return PiecewiseLinearDesign(
+            name=name,
+            total_bits=self._config.total_bits,
+            breakpoints=segments.breakpoints.tolist(),
+            intercepts=segments.intercepts.tolist(),
+            slopes=terms,  # type: ignore
+        )
+
+    def _as_integer(self, quantized: torch.Tensor) -> torch.Tensor:
+        return torch.round(quantized * (1 << self._config.frac_bits)).to(torch.int64)
+
+    def _segments(self) -> _Segments:
+        with torch.no_grad():
+            breakpoints = self._as_integer(self._operations.quantize(self._breakpoints))
+            values = self._base_module(self._config.as_rational(breakpoints.float()))
+            intercepts = self._as_integer(self._operations.quantize(values))
+        slopes = (intercepts[1:] - intercepts[:-1]) / (
+            breakpoints[1:] - breakpoints[:-1]
+        )
+        first_signs, first_exponents = self._nearest_power_of_two(slopes)
+        residuals = slopes - first_signs * torch.exp2(first_exponents.double())
+        second_signs, second_exponents = self._nearest_power_of_two(residuals)
+        return _Segments(
+            breakpoints=breakpoints,
+            intercepts=intercepts[:-1],
+            signs=torch.stack((first_signs, second_signs), dim=-1),
+            exponents=torch.stack((first_exponents, second_exponents), dim=-1),
+        )
+
+    def _nearest_power_of_two(
+        self, values: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Exponents are limited, so that shifted offsets fit into twice the
+        width of the inputs. Terms below half of the smallest power vanish."""
+        min_exponent = -self._config.total_bits
+        max_exponent = self._config.total_bits - 1
+        magnitudes = values.abs().to(torch.float64)
+        exponents = torch.floor(torch.log2(magnitudes.clamp(min=2.0**min_exponent)))
+        lower = torch.exp2(exponents)
+        exponents = torch.where(
+            magnitudes - lower > 2 * lower - magnitudes, exponents + 1, exponents
+        )
+        exponents = exponents.clamp(min=min_exponent, max=max_exponent).to(torch.int64)
+        signs = torch.sign(values).to(torch.int64)
+        signs = torch.where(magnitudes < 2.0 ** (min_exponent - 1), 0, signs)
+        return signs, exponents
+
+    def _evaluate(self, x: torch.Tensor, segments: _Segments) -> torch.Tensor:
+        breakpoints = segments.breakpoints
+        clamped = torch.clamp(x, min=breakpoints[0], max=breakpoints[-1])
+        index = torch.bucketize(clamped, breakpoints[1:-1], right=True)
+        offset = clamped - breakpoints[index]
+        result = segments.intercepts[index]
+        for term in range(segments.signs.shape[-1]):
+            exponent = segments.exponents[index, term]
+            shifted = torch.where(
+                exponent >= 0,
+                torch.bitwise_left_shift(offset, exponent.clamp(min=0)),
+                torch.bitwise_right_shift(offset, (-exponent).clamp(min=0)),
+            )
+            result = result + segments.signs[index, term] * shifted
+        return torch.clamp(
+            result,
+            min=self._config.minimum_as_integer,
+            max=self._config.maximum_as_integer,
+        )
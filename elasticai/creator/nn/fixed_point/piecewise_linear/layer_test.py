@@ -0,0 +1,102 @@
+import pytest
+import torch
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryPath
+from elasticai.creator.nn.fixed_point.precomputed import Tanh
+
+from .layer import PiecewiseLinear
+
+TOTAL_BITS = 8
+FRAC_BITS = 4
+
+
+def create_tanh(num_segments: int) -> PiecewiseLinear:
+    return PiecewiseLinear(
+        base_module=torch.nn.Tanh(),
+        total_bits=TOTAL_BITS,
+        frac_bits=FRAC_BITS,
+        num_segments=num_segments,
+        sampling_intervall=(-4, 4),
+    )
+
+
+def all_inputs() -> torch.Tensor:
+    return torch.arange(-(1 << (TOTAL_BITS - 1)), 1 << (TOTAL_BITS - 1)) / (
+        1 << FRAC_BITS
+    )
+
+
+def parse_array(code: list[str], name: str) -> list[int]:
+    start = next(
+        i for i, line in enumerate(code) if line.startswith(f"constant {name} ")
+    )
+    end = code.index(");", start)
+    return [int(line.split("=>")[1].strip(",")) for line in code[start + 1 : end]]
+
+
+def simulate_design(code: list[str], x: int) -> int:
+    """Literal translation of the process in piecewise_linear.tpl.vhd."""
+    breakpoints = parse_array(code, "BREAKPOINTS")
+    intercepts = parse_array(code, "INTERCEPTS")
+    terms = [
+        list(zip(parse_array(code, f"{n}_SIGNS"), parse_array(code, f"{n}_EXPONENTS")))
+        for n in ("FIRST", "SECOND")
+    ]
+    clamped = min(max(x, breakpoints[0]), breakpoints[-1])
+    segment = 0
+    for k in range(1, len(intercepts)):
+        if clamped >= breakpoints[k]:
+            segment = k
+    offset = clamped - breakpoints[segment]
+    result = intercepts[segment]
+    for term in terms:
+        sign, exponent = term[segment]
+        shifted = offset << exponent if exponent >= 0 else offset >> -exponent
+        result += sign * shifted
+    return min(max(result, -(1 << (TOTAL_BITS - 1))), (1 << (TOTAL_BITS - 1)) - 1)
+
+
+def test_layer_matches_design_for_all_inputs() -> None:
+    tanh = create_tanh(num_segments=6)
+    build_root = InMemoryPath("build", parent=None)
+    tanh.create_design("tanh").save_to(build_root)
+    code = [line.strip() for line in build_root.children["tanh"].text]
+
+    x = all_inputs()
+    expected = [simulate_design(code, value) for value in (x * 16).int().tolist()]
+    actual = (tanh(x) * 16).int().tolist()
+
+    assert expected == actual
+
+
+def test_is_more_accurate_than_steps_with_equal_table_size() -> None:
+    x = all_inputs()
+    exact = torch.tanh(x)
+    steps = Tanh(TOTAL_BITS, FRAC_BITS, num_steps=9, sampling_intervall=(-4, 4))
+    segments = create_tanh(num_segments=8)
+    steps_error = (steps(x) - exact).abs().max()
+    segments_error = (segments(x) - exact).abs().max()
+    assert segments_error < steps_error
+
+
+def test_reproduces_power_of_two_slopes_exactly() -> None:
+    identity = PiecewiseLinear(
+        base_module=torch.nn.Identity(),
+        total_bits=TOTAL_BITS,
+        frac_bits=FRAC_BITS,
+        num_segments=3,
+        sampling_intervall=(-8, 7.9375),
+    )
+    x = all_inputs()
+    assert torch.equal(x, identity(x))
+
+
+def test_gradients_are_the_ones_of_base_module() -> None:
+    x = torch.tensor([0.5, -1.0], requires_grad=True)
+    create_tanh(num_segments=4)(x).sum().backward()
+    assert torch.allclose(1 - torch.tanh(x.detach()) ** 2, x.grad)
+
+
+def test_rejects_segments_narrower_than_resolution() -> None:
+    with pytest.raises(ValueError):
+        create_tanh(num_segments=200)
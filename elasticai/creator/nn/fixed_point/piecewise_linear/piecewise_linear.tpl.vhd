@@ -0,0 +1,104 @@
+-- Piecewise linear approximation of a scalar function.
+-- The clamped input selects its segment with one stage of parallel
+-- comparators. Each slope is a sum of at most two signed powers of two,
+-- so the offset from the segment start is scaled by two shifts and adds.
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity ${name} is
+    generic (
+        DATA_WIDTH : integer := ${data_width};
+        SEGMENTS : integer := ${segments}
+    );
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+        x      : in std_logic_vector(DATA_WIDTH-1 downto 0);
+        y      : out std_logic_vector(DATA_WIDTH-1 downto 0)
+    );
+end entity ${name};
+
+architecture rtl of ${name} is
+    constant ACC_WIDTH : integer := 2*DATA_WIDTH+2;
+    type breakpoints_t is array (0 to SEGMENTS) of integer;
+    type segment_values_t is array (0 to SEGMENTS-1) of integer;
+
+    constant BREAKPOINTS : breakpoints_t := (
+        $breakpoints
+    );
+    constant INTERCEPTS : segment_values_t := (
+        $intercepts
+    );
+    constant FIRST_SIGNS : segment_values_t := (
+        $first_signs
+    );
+    constant FIRST_EXPONENTS : segment_values_t := (
+        $first_exponents
+    );
+    constant SECOND_SIGNS : segment_values_t := (
+        $second_signs
+    );
+    constant SECOND_EXPONENTS : segment_values_t := (
+        $second_exponents
+    );
+
+    function scaled(value : signed(ACC_WIDTH-1 downto 0);
+                    sign : integer;
+                    exponent : integer) return signed is
+        variable shifted : signed(ACC_WIDTH-1 downto 0);
+    begin
+        if exponent >= 0 then
+            shifted := shift_left(value, exponent);
+        else
+            shifted := shift_right(value, -exponent);
+        end if;
+        if sign > 0 then
+            return shifted;
+        elsif sign < 0 then
+            return -shifted;
+        end if;
+        return to_signed(0, ACC_WIDTH);
+    end function;
+
+    signal fxp_input : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal fxp_output : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+begin
+    fxp_input <= signed(x);
+    y <= std_logic_vector(fxp_output);
+
+    main_process : process (fxp_input)
+        variable clamped : signed(ACC_WIDTH-1 downto 0);
+        variable segment : integer range 0 to SEGMENTS-1;
+        variable offset : signed(ACC_WIDTH-1 downto 0);
+        variable result : signed(ACC_WIDTH-1 downto 0);
+    begin
+        clamped := resize(fxp_input, ACC_WIDTH);
+        if clamped < BREAKPOINTS(0) then
+            clamped := to_signed(BREAKPOINTS(0), ACC_WIDTH);
+        elsif clamped > BREAKPOINTS(SEGMENTS) then
+            clamped := to_signed(BREAKPOINTS(SEGMENTS), ACC_WIDTH);
+        end if;
+
+        segment := 0;
+        for k in 1 to SEGMENTS-1 loop
+            if clamped >= BREAKPOINTS(k) then
+                segment := k;
+            end if;
+        end loop;
+
+        offset := clamped - BREAKPOINTS(segment);
+        result := to_signed(INTERCEPTS(segment), ACC_WIDTH)
+            + scaled(offset, FIRST_SIGNS(segment), FIRST_EXPONENTS(segment))
+            + scaled(offset, SECOND_SIGNS(segment), SECOND_EXPONENTS(segment));
+
+        if result > 2**(DATA_WIDTH-1)-1 then
+            fxp_output <= to_signed(2**(DATA_WIDTH-1)-1, DATA_WIDTH);
+        elsif result < -2**(DATA_WIDTH-1) then
+            fxp_output <= to_signed(-2**(DATA_WIDTH-1), DATA_WIDTH);
+        else
+            fxp_output <= resize(result, DATA_WIDTH);
+        end if;
+    end process;
+end architecture rtl;
@@ -0,0 +1,2 @@
+from ._math_operations import PowerOfTwoMathOperations
+from .layer import PowerOfTwoLinear
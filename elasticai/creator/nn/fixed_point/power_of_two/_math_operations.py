@@ -0,0 +1,50 @@
+import torch
+
+from elasticai.creator.base_modules.straight_through import straight_through
+
+from .._math_operations import MathOperations
+from .._two_complement_fixed_point_config import FixedPointConfig
+
+
+class PowerOfTwoMathOperations(MathOperations):
+    """Fixed point arithmetic with weights restricted to zero and signed powers
+    of two, so that every product is a shift.
+
+    `quantize_parameter` rounds to the nearest of `0` and `±2**e` (ties
+    towards zero) with `-frac_bits <= e <= max_exponent`, larger magnitudes
+    saturate. These weights lie on the fixed point grid of `config`. `linear`
+    is `fused_linear`, so that a `Linear` computes what the design does,
+    every other operation is the one of `MathOperations`.
+    """
+
+    def __init__(self, config: FixedPointConfig) -> None:
+        super().__init__(config)
+        self.min_exponent = -config.frac_bits
+        self.max_exponent = config.total_bits - config.frac_bits - 2
+
+    def quantize_parameter(self, a: torch.Tensor) -> torch.Tensor:
+        clamped = self._clamp(a)
+        signs, exponents = self.signs_and_exponents(clamped.detach())
+        quantized = signs * torch.exp2(exponents.to(a.dtype))
+        if self._needs_grad(a):
+            return straight_through(quantized, clamped)
+        return quantized
+
+    def linear(
+        self, x: torch.Tensor, weight: torch.Tensor, bias: torch.Tensor | None
+    ) -> torch.Tensor:
+        return self.fused_linear(x, weight, bias)
+
+    def signs_and_exponents(self, a: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Integer `signs` (`-1`, `0` or `1`) and `exponents` of the quantized
+        values, the exponents of zeros are `min_exponent`."""
+        mantissas, exponents = torch.frexp(a.abs())
+        # |a| = mantissa * 2**exponent with mantissa in [0.5, 1), so 0.75 is
+        # the midpoint between 2**(exponent - 1) and 2**exponent
+        exponents = exponents - 1 + (mantissas > 0.75).to(exponents.dtype)
+        exponents = torch.clamp(exponents, min=self.min_exponent, max=self.max_exponent)
+        smallest = 2.0**self.min_exponent
+        vanishes = a.abs() <= smallest / 2
+        signs = torch.where(vanishes, 0, torch.sign(a)).to(torch.int64)
+        exponents = torch.where(vanishes, self.min_exponent, exponents)
+        return signs, exponents.to(torch.int64)
@@ -0,0 +1,43 @@
+import pytest
+import torch
+
+from .._two_complement_fixed_point_config import FixedPointConfig
+from ._math_operations import PowerOfTwoMathOperations
+
+operations = PowerOfTwoMathOperations(FixedPointConfig(total_bits=8, frac_bits=4))
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (0.0, 0.0),
+        (0.03125, 0.0),
+        (0.04, 0.0625),
+        (0.09375, 0.0625),
+        (0.094, 0.125),
+        (-0.3, -0.25),
+        (0.75, 0.5),
+        (0.76, 1.0),
+        (5.0, 4.0),
+        (-100.0, -4.0),
+    ],
+)
+def test_rounds_to_nearest_power_of_two(value: float, expected: float) -> None:
+    actual = operations.quantize_parameter(torch.tensor([value]))
+    assert actual.tolist() == [expected]
+
+
+def test_quantize_keeps_fixed_point_grid() -> None:
+    actual = operations.quantize(torch.tensor([0.3, 5.0]))
+    assert actual.tolist() == [0.25, 5.0]
+
+
+def test_signs_and_exponents() -> None:
+    signs, exponents = operations.signs_and_exponents(torch.tensor([-0.5, 0.0, 2.0]))
+    assert (signs.tolist(), exponents.tolist()) == ([-1, 0, 1], [-1, -4, 1])
+
+
+def test_gradient_passes_straight_through() -> None:
+    x = torch.tensor([0.3, -10.0], requires_grad=True)
+    operations.quantize_parameter(x).sum().backward()
+    assert x.grad.tolist() == [1.0, 0.0]
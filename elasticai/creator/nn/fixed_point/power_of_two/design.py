@@ -0,0 +1,103 @@
+from elasticai.creator.vhdl.code_generation.code_abstractions import (
+    to_vhdl_binary_string,
+)
+from elasticai.creator.vhdl.shared_designs.rom import Rom
+
+from ..linear.design import Linear
+
+
+class PowerOfTwoLinear(Linear):
+    """Variant of the fixed point `Linear` design for weights that are zero or
+    signed powers of two, given as integers like for `Linear`.
+
+    The weight ROM stores a code per weight: a sign bit, a zero bit and the
+    shift `log2(abs(weight))`. The design uses the template of `Linear`,
+    whose MAC shifts the input by that amount instead of multiplying it, all
+    other steps and the results are the same.
+
+    There is no power of two `Conv1d`, as the fixed point `Conv1d` design
+    multiplies in the shared `fxp_MAC_RoundToZero` entity, which has no
+    shifting variant.
+    """
+
+    def __init__(
+        self,
+        *,
+        in_feature_num: int,
+        out_feature_num: int,
+        total_bits: int,
+        frac_bits: int,
+        weights: list[list[int]],
+        bias: list[int],
+        name: str,
+        work_library_name: str = "work",
+        resource_option: str = "auto",
+    ) -> None:
+        super().__init__(
+            in_feature_num=in_feature_num,
+            out_feature_num=out_feature_num,
+            total_bits=total_bits,
+            frac_bits=frac_bits,
+            weights=weights,
+            bias=bias,
+            name=name,
+            work_library_name=work_library_name,
+            resource_option=resource_option,
+        )
+        # wide enough for the shift of FXP_ONE, which seeds the bias
+        self.shift_width = max(1, (self.data_width - 1).bit_length())
+        for weight in self._flatten_params(self.weights):
+            if weight != 0 and not (
+                _is_power_of_two(abs(weight))
+                and abs(weight) < 2 ** (self.data_width - 1)
+            ):
+                raise ValueError(
+                    f"{weight} is neither zero nor a power of two that fits into"
+                    f" {self.data_width} bits."
+                )
+
+    def weight_code(self, weight: int) -> int:
+        sign = 1 if weight < 0 else 0
+        if weight == 0:
+            return 1 << self.shift_width
+        return (sign << (self.shift_width + 1)) | (abs(weight).bit_length() - 1)
+
+    def _mac_parameters(self) -> dict[str, str | list[str]]:
+        # to_signed(2**FRAC_WIDTH, DATA_WIDTH) wraps to the minimum if
+        # FRAC_WIDTH is DATA_WIDTH-1, the code keeps that
+        fxp_one = 1 << self.frac_width
+        if fxp_one >= 1 << (self.data_width - 1):
+            fxp_one = -fxp_one
+        return dict(
+            weight_width=str(self._code_width),
+            fxp_one=to_vhdl_binary_string(self.weight_code(fxp_one), self._code_width),
+            product=[
+                "-- w is the code of a sign bit, a zero bit and a shift, so the",
+                "-- product is x shifted by that amount and needs no multiplier",
+                "if w(w'high-1) = '0' then",
+                "    TEMP := shift_left(resize(x, 2*DATA_WIDTH),"
+                " to_integer(unsigned(w(w'high-2 downto 0))));",
+                "    if w(w'high) = '1' then",
+                "        TEMP := -TEMP;",
+                "    end if;",
+                "end if;",
+            ],
+        )
+
+    def _weights_rom(self, name: str) -> Rom:
+        return Rom(
+            name=name,
+            data_width=self._code_width,
+            values_as_integers=[
+                self.weight_code(weight)
+                for weight in self._flatten_params(self.weights)
+            ],
+        )
+
+    @property
+    def _code_width(self) -> int:
+        return self.shift_width + 2
+
+
+def _is_power_of_two(value: int) -> bool:
+    return value > 0 and value & (value - 1) == 0
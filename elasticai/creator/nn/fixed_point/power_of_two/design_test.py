@@ -0,0 +1,84 @@
+from typing import cast
+
+import pytest
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+
+from .design import PowerOfTwoLinear
+
+
+def create_design(
+    weights: list[list[int]], total_bits: int = 8, frac_bits: int = 4
+) -> PowerOfTwoLinear:
+    return PowerOfTwoLinear(
+        name="linear",
+        in_feature_num=len(weights[0]),
+        out_feature_num=len(weights),
+        total_bits=total_bits,
+        frac_bits=frac_bits,
+        weights=weights,
+        bias=[0] * len(weights),
+    )
+
+
+def save_design(design: PowerOfTwoLinear) -> dict[str, list[str]]:
+    destination = InMemoryPath("build", parent=None)
+    design.save_to(destination)
+    files = cast(list[InMemoryFile], list(destination.children.values()))
+    return {file.name: file.text for file in files}
+
+
+def shift_product(code: int, x: int, shift_width: int) -> int:
+    """The product as computed by `multiply_accumulate`."""
+    if code >> shift_width & 1:
+        return 0
+    product = x << (code & ((1 << shift_width) - 1))
+    return -product if code >> (shift_width + 1) & 1 else product
+
+
+def test_saves_layer_and_roms() -> None:
+    files = save_design(create_design([[1, 2]]))
+    assert set(files) == {"linear.vhd", "linear_w_rom.vhd", "linear_b_rom.vhd"}
+
+
+def test_uses_linear_template_with_shifting_mac() -> None:
+    code = "\n".join(save_design(create_design([[1, 2]]))["linear.vhd"])
+    assert "function multiply_accumulate(w : in signed(5-1 downto 0);" in code
+    assert "TEMP := shift_left(resize(x, 2*DATA_WIDTH)" in code
+    assert "w * x" not in code
+
+
+def test_rom_stores_sign_zero_and_shift() -> None:
+    design = create_design([[1, -4, 0, 64]])
+    rom = save_design(design)["linear_w_rom.vhd"]
+    assert design.shift_width == 3
+    assert any('("00000","10010","01000","00110")' in line for line in rom)
+
+
+@pytest.mark.parametrize("total_bits, frac_bits", [(8, 4), (6, 0), (6, 5)])
+def test_shifts_yield_the_products_of_the_multiplier(
+    total_bits: int, frac_bits: int
+) -> None:
+    weights = [0] + [sign * 2**k for k in range(total_bits - 1) for sign in (-1, 1)]
+    design = create_design([weights], total_bits=total_bits, frac_bits=frac_bits)
+    for weight in weights:
+        code = design.weight_code(weight)
+        for x in range(-(2 ** (total_bits - 1)), 2 ** (total_bits - 1)):
+            assert shift_product(code, x, design.shift_width) == weight * x
+
+
+@pytest.mark.parametrize(
+    "frac_bits, expected", [(4, '"00100"'), (6, '"00110"'), (7, '"10111"')]
+)
+def test_fxp_one_code_matches_wrapped_fxp_one(frac_bits: int, expected: str) -> None:
+    design = create_design([[1]], total_bits=8, frac_bits=frac_bits)
+    code = save_design(design)["linear.vhd"]
+    assert any(
+        f"constant FXP_ONE : signed(5-1 downto 0) := {expected};" in line
+        for line in code
+    )
+
+
+def test_rejects_weights_that_are_not_powers_of_two() -> None:
+    with pytest.raises(ValueError):
+        create_design([[3]])
@@ -0,0 +1,62 @@
+from typing import Any, cast
+
+import torch
+
+from elasticai.creator.base_modules.linear import Linear as LinearBase
+from elasticai.creator.vhdl.design_creator import DesignCreator
+
+from .._two_complement_fixed_point_config import FixedPointConfig
+from ._math_operations import PowerOfTwoMathOperations
+from .design import PowerOfTwoLinear as PowerOfTwoLinearDesign
+
+
+class PowerOfTwoLinear(DesignCreator, LinearBase):
+    """Fixed point linear layer with weights rounded to zero or signed powers
+    of two, see `PowerOfTwoMathOperations`. Biases stay on the fixed point
+    grid, since the hardware adds them instead of multiplying with them.
+    """
+
+    def __init__(
+        self,
+        in_features: int,
+        out_features: int,
+        total_bits: int,
+        frac_bits: int,
+        bias: bool = True,
+        device: Any = None,
+    ) -> None:
+        self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
+        super().__init__(
+            in_features=in_features,
+            out_features=out_features,
+            operations=PowerOfTwoMathOperations(self._config),
+            bias=bias,
+            device=device,
+        )
+
+    def _quantized(self, name: str, parameter: torch.Tensor) -> torch.Tensor:
+        if name == "bias":
+            return self._quantized_parameters.get(
+                name, parameter, self._operations.quantize
+            )
+        return super()._quantized(name, parameter)
+
+    def create_design(self, name: str) -> PowerOfTwoLinearDesign:
+        with torch.no_grad():
+            weight = self._quantized("weight", self.weight)
+            bias = (
+                torch.zeros(self.out_features)
+                if self.bias is None
+                else self._quantized("bias", self.bias)
+            )
+        return PowerOfTwoLinearDesign(
+            in_feature_num=self.in_features,
+            out_feature_num=self.out_features,
+            total_bits=self._config.total_bits,
+            frac_bits=self._config.frac_bits,
+            weights=cast(
+                list[list[int]], self._config.as_integer(weight).int().tolist()
+            ),
+            bias=cast(list[int], self._config.as_integer(bias).int().tolist()),
+            name=name,
+        )
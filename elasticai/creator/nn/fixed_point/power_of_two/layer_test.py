@@ -0,0 +1,41 @@
+import torch
+
+from .._hardware_math_operations import HardwareMathOperations
+from .._two_complement_fixed_point_config import FixedPointConfig
+from .layer import PowerOfTwoLinear
+
+
+def test_weights_are_powers_of_two_and_bias_stays_fixed_point() -> None:
+    linear = PowerOfTwoLinear(in_features=2, out_features=1, total_bits=8, frac_bits=4)
+    with torch.no_grad():
+        linear.weight.copy_(torch.tensor([[0.3, -1.7]]))
+        linear.bias.copy_(torch.tensor([0.3]))
+        actual = linear(torch.tensor([1.0, 1.0]))
+    assert actual.tolist() == [0.25 - 2.0 + 0.25]
+
+
+def test_design_weights_are_integer_powers_of_two() -> None:
+    linear = PowerOfTwoLinear(in_features=3, out_features=1, total_bits=8, frac_bits=4)
+    with torch.no_grad():
+        linear.weight.copy_(torch.tensor([[0.3, -1.7, 0.01]]))
+        linear.bias.copy_(torch.tensor([0.3]))
+    design = linear.create_design("linear")
+    assert (design.weights, design.bias) == ([[4, -32, 0]], [4])
+
+
+def test_output_matches_design_emulation() -> None:
+    torch.manual_seed(0)
+    linear = PowerOfTwoLinear(in_features=8, out_features=8, total_bits=8, frac_bits=4)
+    with torch.no_grad():
+        linear.weight.mul_(4)
+        linear.bias.uniform_(-2, 2)
+    design = linear.create_design("linear")
+    config = FixedPointConfig(total_bits=8, frac_bits=4)
+    hardware = HardwareMathOperations(config)
+    weight = config.as_rational(torch.tensor(design.weights, dtype=torch.float32))
+    bias = config.as_rational(torch.tensor(design.bias, dtype=torch.float32))
+    x = hardware.quantize(torch.randn(256, 8) * 2)
+    expected = hardware.linear(x, weight, bias)
+    assert torch.equal(linear(x), expected)
+    with torch.no_grad():
+        assert torch.equal(linear(x), expected)
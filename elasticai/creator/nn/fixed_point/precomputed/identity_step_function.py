@@ -3,6 +3,19 @@ from typing import Any
 import torch
 
 
+def step_indices(x: torch.Tensor, step_lut: torch.Tensor) -> torch.Tensor:
+    """Index of the smallest step in the ascending `step_lut` that is not
+    smaller than the value in `x`, clamped to the range of the steps."""
+    indices = torch.bucketize(x.to(step_lut.dtype), step_lut)
+    return indices.clamp_(max=len(step_lut) - 1)
+
+
+def step_inputs(x: torch.Tensor, step_lut: torch.Tensor) -> torch.Tensor:
+    """Map each value in `x` to the smallest step in `step_lut` that is not
+    smaller than it, clamping to the range of the steps."""
+    return step_lut[step_indices(x, step_lut)]
+
+
 class IdentityStepFunction(torch.autograd.Function):
     @staticmethod
     def forward(ctx: Any, *args: Any, **kwargs: Any) -> torch.Tensor:
@@ -20,14 +33,7 @@ class IdentityStepFunction(torch.autograd.Function):
             raise ValueError(
                 f"Number of steps cannot be less than or equal to 1 (steps == {steps})."
             )
-        x = x.to(torch.float32)
-        x = x.clamp(min=step_lut.min(), max=step_lut.max())
-
-        for step_idx in range(1, len(step_lut)):
-            prev_step, curr_step = step_lut[step_idx - 1], step_lut[step_idx]
-            x[(x > prev_step) & (x <= curr_step)] = curr_step
-
-        return x
+        return step_inputs(x, step_lut)
 
     @staticmethod
     def backward(ctx: Any, *grad_outputs: Any) -> Any:
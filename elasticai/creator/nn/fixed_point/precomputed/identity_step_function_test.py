@@ -43,3 +43,14 @@ def test_raises_error_when_steps_less_than_or_equal_one(steps: int) -> None:
     step_lut = generate_step_lut(-1, 1, steps)
     with pytest.raises(ValueError):
         IdentityStepFunction.apply(inputs, step_lut)
+
+
+def test_matches_masked_assignment_per_step() -> None:
+    step_lut = generate_step_lut(-4, 4, 300)
+    inputs = torch.cat((torch.randn(1000) * 5, step_lut))
+    expected = inputs.clamp(min=-4, max=4)
+    for step_idx in range(1, len(step_lut)):
+        prev_step, curr_step = step_lut[step_idx - 1], step_lut[step_idx]
+        mask = (inputs > prev_step) & (inputs <= curr_step)
+        expected = torch.where(mask, curr_step, expected)
+    assertTensorEqual(expected, IdentityStepFunction.apply(inputs, step_lut))
@@ -2,7 +2,10 @@ from typing import cast
 
 import torch
 
+from elasticai.creator.base_modules.adaptable_silu import AdaptableSiLU
 from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.nn import Sequential
+from elasticai.creator.nn.fixed_point import Tanh
 
 from .precomputed_module import PrecomputedModule
 
@@ -93,3 +96,65 @@ end rtl;
     design.save_to(build_path)
     actual = cast(InMemoryFile, build_path["sigmoid"]).text
     assert actual == expected
+
+
+def create_silu() -> PrecomputedModule:
+    return PrecomputedModule(
+        base_module=AdaptableSiLU(),
+        total_bits=8,
+        frac_bits=4,
+        num_steps=200,
+        sampling_intervall=(-8, 8),
+    )
+
+
+def test_table_lookup_in_eval_mode_matches_training_mode() -> None:
+    module = create_silu()
+    x = torch.randn(50, 20) * 4
+    expected = module(x)
+    module.eval()
+    with torch.no_grad():
+        assert torch.equal(expected, module(x))
+
+
+def test_table_is_recomputed_after_parameter_update() -> None:
+    module = create_silu()
+    module.eval()
+    x = torch.randn(100) * 4
+    with torch.no_grad():
+        module(x)
+        module._base_module.scale.mul_(2)
+        actual = module(x)
+    module.train()
+    assert torch.equal(module(x), actual)
+
+
+def test_design_evaluates_all_steps_in_one_forward_pass() -> None:
+    class CountingTanh(torch.nn.Tanh):
+        calls = 0
+
+        def forward(self, input: torch.Tensor) -> torch.Tensor:
+            CountingTanh.calls += 1
+            return super().forward(input)
+
+    tanh = PrecomputedModule(
+        base_module=CountingTanh(),
+        total_bits=8,
+        frac_bits=2,
+        num_steps=100,
+        sampling_intervall=(-5, 5),
+    )
+    tanh.create_design("tanh").save_to(InMemoryPath("build", parent=None))
+    assert 1 == CountingTanh.calls
+
+
+def test_wide_function_exported_by_sequential_is_combinational() -> None:
+    model = Sequential(Tanh(total_bits=16, frac_bits=8, num_steps=64))
+    destination = InMemoryPath("build", parent=None)
+    model.create_design("network").save_to(destination)
+
+    tanh_design = model[0].create_design("tanh_0")
+    tanh_file = cast(InMemoryPath, destination.children["tanh_0"]).children["tanh_0"]
+    code = "\n".join(cast(InMemoryFile, tanh_file).text)
+    assert "tree" == tanh_design.strategy
+    assert "rising_edge" not in code
@@ -0,0 +1,153 @@
+from collections.abc import Iterable
+from typing import Any, Optional
+
+import torch
+from torch import Tensor
+
+from ._integer_math_operations import _storage_dtype
+from ._linear_feedback_shift_register import WIDTH as LFSR_WIDTH
+from ._linear_feedback_shift_register import LinearFeedbackShiftRegister
+from ._math_operations import MathOperations
+from ._two_complement_fixed_point_config import FixedPointConfig
+
+
+class SGD(torch.optim.Optimizer):
+    """Stochastic gradient descent with momentum on the fixed point grid.
+
+    Every step moves the parameters by a whole number of least significant
+    bits and saturates them to `total_bits`, so the parameters never leave
+    the grid and `create_design` turns them into exactly the integers that
+    the step stored in `state[p]["integer_value"]`. Momentum buffers are stored as integers
+    with `momentum_frac_bits` fractional bits (default `frac_bits`).
+
+    Updates are rounded towards zero, or stochastically with an LFSR seeded
+    with `seed` if `stochastic_rounding` is set. Stochastic rounding keeps
+    updates smaller than one least significant bit from getting lost. The
+    momentum buffers are rounded with a second LFSR, that starts half a
+    period of the sequence after `seed`, so that both draw different random
+    numbers. The states of both LFSRs are part of the `state_dict`.
+    """
+
+    def __init__(
+        self,
+        params: Iterable[Tensor] | Iterable[dict[str, Any]],
+        lr: float,
+        total_bits: int,
+        frac_bits: int,
+        momentum: float = 0.0,
+        weight_decay: float = 0.0,
+        momentum_total_bits: Optional[int] = None,
+        momentum_frac_bits: Optional[int] = None,
+        stochastic_rounding: bool = False,
+        seed: int = 1,
+    ) -> None:
+        if lr < 0:
+            raise ValueError(f"Invalid learning rate: {lr}")
+        if momentum < 0:
+            raise ValueError(f"Invalid momentum value: {momentum}")
+        self.config = FixedPointConfig(
+            total_bits=total_bits,
+            frac_bits=frac_bits,
+            stochastic_rounding=stochastic_rounding,
+        )
+        self.momentum_config = FixedPointConfig(
+            total_bits=(
+                total_bits if momentum_total_bits is None else momentum_total_bits
+            ),
+            frac_bits=frac_bits if momentum_frac_bits is None else momentum_frac_bits,
+            stochastic_rounding=stochastic_rounding,
+        )
+        # one bit more than the parameters, so that a step can cross the
+        # complete range before the result is saturated
+        self._updates = MathOperations(
+            FixedPointConfig(
+                total_bits=total_bits + 1,
+                frac_bits=frac_bits,
+                stochastic_rounding=stochastic_rounding,
+            ),
+            seed=seed,
+        )
+        self._momentum = MathOperations(
+            self.momentum_config, seed=_half_a_period_later(seed)
+        )
+        super().__init__(
+            params, dict(lr=lr, momentum=momentum, weight_decay=weight_decay)
+        )
+
+    def state_dict(self) -> dict[str, Any]:
+        state_dict = super().state_dict()
+        state_dict["lfsr_states"] = dict(
+            updates=self._updates.lfsr_state, momentum=self._momentum.lfsr_state
+        )
+        return state_dict
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        state_dict = dict(state_dict)
+        lfsr_states = state_dict.pop("lfsr_states", None)
+        super().load_state_dict(state_dict)
+        if lfsr_states is not None:
+            self._updates.load_lfsr_state(lfsr_states["updates"])
+            self._momentum.load_lfsr_state(lfsr_states["momentum"])
+
+    @torch.no_grad()
+    def step(self, closure: Any = None) -> Any:
+        loss = None
+        if closure is not None:
+            with torch.enable_grad():
+                loss = closure()
+
+        for group in self.param_groups:
+            for p in group["params"]:
+                if p.grad is not None:
+                    self._update(p, group)
+
+        return loss
+
+    def _update(self, p: Tensor, group: dict[str, Any]) -> None:
+        state = self.state[p]
+        direction = p.grad
+        if group["weight_decay"] != 0:
+            direction = direction.add(p, alpha=group["weight_decay"])
+        if group["momentum"] != 0:
+            direction = self._momentum_step(state, direction, group["momentum"])
+
+        update = self._to_integer(
+            self._updates.quantize(direction * group["lr"]), self._updates.config
+        )
+        value = torch.clamp(
+            self._to_integer(p, self.config).to(torch.int64) - update,
+            min=self.config.minimum_as_integer,
+            max=self.config.maximum_as_integer,
+        )
+        state["integer_value"] = value.to(_storage_dtype(self.config.total_bits))
+        p.copy_(value / (1 << self.config.frac_bits))
+
+    def _momentum_step(
+        self, state: dict[str, Any], gradient: Tensor, momentum: float
+    ) -> Tensor:
+        if "momentum_buffer" not in state:
+            velocity = self._momentum.quantize(gradient)
+        else:
+            previous = self._to_rational(state["momentum_buffer"], self.momentum_config)
+            velocity = self._momentum.quantize(previous * momentum + gradient)
+        state["momentum_buffer"] = self._to_integer(velocity, self.momentum_config)
+        return velocity
+
+    @staticmethod
+    def _to_integer(a: Tensor, config: FixedPointConfig) -> Tensor:
+        """Exact for values on the grid, everything else is truncated."""
+        clamped = torch.clamp(
+            a, min=config.minimum_as_rational, max=config.maximum_as_rational
+        )
+        scaled = torch.trunc(clamped.to(torch.float64) * (1 << config.frac_bits))
+        return scaled.to(_storage_dtype(config.total_bits))
+
+    @staticmethod
+    def _to_rational(a: Tensor, config: FixedPointConfig) -> Tensor:
+        return a.to(torch.float32) / (1 << config.frac_bits)
+
+
+def _half_a_period_later(seed: int) -> int:
+    lfsr = LinearFeedbackShiftRegister(seed)
+    lfsr.next(((1 << LFSR_WIDTH) - 1) // 2)
+    return lfsr.state
@@ -0,0 +1,110 @@
+import pytest
+import torch
+
+from tests.tensor_test_case import TensorTestCase
+
+from .linear import Linear
+from .sgd import SGD
+
+
+def parameter(values: list[float], grad: list[float]) -> torch.nn.Parameter:
+    p = torch.nn.Parameter(torch.tensor(values))
+    p.grad = torch.tensor(grad)
+    return p
+
+
+class SGDTest(TensorTestCase):
+    def test_moves_parameters_by_truncated_update(self) -> None:
+        p = parameter([1.0, 1.0, -1.0], grad=[1.0, 0.1, -1.0])
+        SGD([p], lr=0.5, total_bits=8, frac_bits=2).step()
+        self.assertTensorEqual([0.5, 1.0, -0.5], p)
+
+    def test_saturates_parameters(self) -> None:
+        p = parameter([31.0, -31.0], grad=[-8.0, 8.0])
+        SGD([p], lr=1.0, total_bits=8, frac_bits=2).step()
+        self.assertTensorEqual([31.75, -32.0], p)
+
+    def test_stores_integer_values(self) -> None:
+        p = parameter([1.0, -1.0], grad=[1.0, 1.0])
+        optimizer = SGD([p], lr=0.25, total_bits=8, frac_bits=2)
+        optimizer.step()
+        integer_value = optimizer.state[p]["integer_value"]
+        self.assertEqual(torch.int16, integer_value.dtype)
+        self.assertTensorEqual([3, -5], integer_value)
+
+    def test_keeps_momentum_buffer_as_integers(self) -> None:
+        p = parameter([0.0], grad=[1.0])
+        optimizer = SGD([p], lr=0.25, total_bits=8, frac_bits=2, momentum=0.5)
+        optimizer.step()
+        optimizer.step()
+        momentum_buffer = optimizer.state[p]["momentum_buffer"]
+        self.assertEqual(torch.int16, momentum_buffer.dtype)
+        self.assertTensorEqual([6], momentum_buffer)  # 1.5 = 0.5 * 1.0 + 1.0
+        self.assertTensorEqual([-0.5], p)  # -0.25 * 1.0 - trunc(0.25 * 1.5)
+
+    def test_stochastic_rounding_keeps_small_updates(self) -> None:
+        p = parameter([0.0] * 1000, grad=[0.1] * 1000)
+        SGD([p], lr=1.0, total_bits=8, frac_bits=2).step()
+        self.assertEqual(0.0, p.sum().item())
+
+        p = parameter([0.0] * 1000, grad=[0.1] * 1000)
+        SGD([p], lr=1.0, total_bits=8, frac_bits=2, stochastic_rounding=True).step()
+        self.assertAlmostEqual(-0.1, p.mean().item(), places=2)
+
+    def test_state_dict_matches_design_weights(self) -> None:
+        torch.manual_seed(0)
+        linear = Linear(in_features=3, out_features=2, total_bits=8, frac_bits=4)
+        optimizer = SGD(linear.parameters(), lr=0.1, total_bits=8, frac_bits=4)
+        linear(torch.randn(5, 3)).sum().backward()
+        optimizer.step()
+
+        state = optimizer.state_dict()["state"]
+        design = linear.create_design("linear")
+
+        self.assertEqual(design.weights, state[0]["integer_value"].tolist())
+        self.assertEqual(design.bias, state[1]["integer_value"].tolist())
+
+    def test_momentum_rounding_draws_other_random_numbers(self) -> None:
+        optimizer = SGD(
+            [parameter([0.0], grad=[0.0])],
+            lr=1.0,
+            total_bits=8,
+            frac_bits=2,
+            momentum=0.5,
+            stochastic_rounding=True,
+        )
+        state = optimizer.state_dict()["lfsr_states"]
+        self.assertNotEqual(state["updates"], state["momentum"])
+
+    def test_loading_state_dict_continues_stochastic_rounding(self) -> None:
+        def create() -> tuple[torch.nn.Parameter, SGD]:
+            p = torch.nn.Parameter(torch.zeros(100))
+            optimizer = SGD(
+                [p],
+                lr=1.0,
+                total_bits=8,
+                frac_bits=2,
+                momentum=0.5,
+                stochastic_rounding=True,
+            )
+            return p, optimizer
+
+        def step(p: torch.nn.Parameter, optimizer: SGD) -> None:
+            p.grad = torch.full((100,), 0.1)
+            optimizer.step()
+
+        p, optimizer = create()
+        step(p, optimizer)
+        resumed_p, resumed = create()
+        with torch.no_grad():
+            resumed_p.copy_(p)
+        resumed.load_state_dict(optimizer.state_dict())
+
+        step(p, optimizer)
+        step(resumed_p, resumed)
+        self.assertTensorEqual(p, resumed_p)
+
+
+def test_rejects_negative_learning_rate() -> None:
+    with pytest.raises(ValueError):
+        SGD([parameter([0.0], grad=[0.0])], lr=-1.0, total_bits=8, frac_bits=2)
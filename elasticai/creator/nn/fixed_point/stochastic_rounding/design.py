@@ -0,0 +1,46 @@
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.design.design import Design, Port
+
+from .._linear_feedback_shift_register import TAPS as LFSR_TAPS
+from .._linear_feedback_shift_register import WIDTH as LFSR_WIDTH
+
+
+class StochasticRounding(Design):
+    """Rounds `x` with `LFSR_WIDTH` additional fractional bits to `total_bits`.
+
+    Each enabled clock cycle consumes one state of the LFSR, in the same order
+    as `LinearFeedbackShiftRegister.next`. Disabling the unit resets the LFSR
+    to `seed`.
+    """
+
+    def __init__(self, name: str, total_bits: int, frac_bits: int, seed: int) -> None:
+        super().__init__(name)
+        self._total_bits = total_bits
+        self._frac_bits = frac_bits
+        self._seed = seed
+
+    @property
+    def port(self) -> Port:
+        return create_port(
+            x_width=self._total_bits + LFSR_WIDTH, y_width=self._total_bits
+        )
+
+    def save_to(self, destination: Path) -> None:
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="stochastic_rounding.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                data_width=str(self._total_bits),
+                frac_width=str(self._frac_bits),
+                lfsr_width=str(LFSR_WIDTH),
+                taps=str(LFSR_TAPS),
+                seed=str(self._seed),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
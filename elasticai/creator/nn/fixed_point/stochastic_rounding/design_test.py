@@ -0,0 +1,34 @@
+from elasticai.creator.file_generation.in_memory_path import InMemoryPath
+
+from .design import StochasticRounding
+
+
+def generate_code(design: StochasticRounding) -> str:
+    build_root = InMemoryPath("build", parent=None)
+    design.save_to(build_root)
+    return "\n".join(build_root.children[design.name].text)
+
+
+def test_port_widens_input_by_lfsr_width() -> None:
+    design = StochasticRounding("rounding", total_bits=8, frac_bits=2, seed=1)
+    assert 24 == design.port["x"].width
+    assert 8 == design.port["y"].width
+
+
+def test_generics_are_set() -> None:
+    code = generate_code(
+        StochasticRounding("rounding", total_bits=8, frac_bits=2, seed=44257)
+    )
+    assert "entity rounding is" in code
+    assert "DATA_WIDTH : integer := 8;" in code
+    assert "FRAC_WIDTH : integer := 2;" in code
+    assert "SEED : integer := 44257" in code
+
+
+def test_lfsr_matches_software_model() -> None:
+    code = generate_code(
+        StochasticRounding("rounding", total_bits=8, frac_bits=2, seed=1)
+    )
+    assert "constant LFSR_WIDTH : integer := 16;" in code
+    assert "to_unsigned(46080, LFSR_WIDTH);" in code
+    assert "std_logic_vector(DATA_WIDTH+16-1 downto 0);" in code
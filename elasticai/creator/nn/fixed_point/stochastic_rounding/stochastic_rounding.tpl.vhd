@@ -0,0 +1,63 @@
+-- Stochastic rounding for fixed point data
+-- x carries LFSR_WIDTH more fractional bits than y. A Galois LFSR provides
+-- the random bits that are added to x before the additional fractional bits
+-- are dropped. Results that do not fit into DATA_WIDTH bits are saturated.
+-- Width and taps of the LFSR are fixed by the software model it has to
+-- match, so they are constants instead of generics.
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity ${name} is
+    generic (
+        DATA_WIDTH : integer := ${data_width};
+        FRAC_WIDTH : integer := ${frac_width};
+        SEED : integer := ${seed}
+    );
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+        x      : in std_logic_vector(DATA_WIDTH+${lfsr_width}-1 downto 0);
+        y      : out std_logic_vector(DATA_WIDTH-1 downto 0)
+    );
+end entity ${name};
+
+architecture rtl of ${name} is
+    constant LFSR_WIDTH : integer := ${lfsr_width};
+    constant TAPS : unsigned(LFSR_WIDTH-1 downto 0) := to_unsigned(${taps}, LFSR_WIDTH);
+    constant MAX_VALUE : signed(DATA_WIDTH downto 0) := to_signed(2**(DATA_WIDTH-1)-1, DATA_WIDTH+1);
+    constant MIN_VALUE : signed(DATA_WIDTH downto 0) := to_signed(-2**(DATA_WIDTH-1), DATA_WIDTH+1);
+
+    signal lfsr : unsigned(LFSR_WIDTH-1 downto 0) := to_unsigned(SEED, LFSR_WIDTH);
+    signal fxp_output : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+begin
+    y <= std_logic_vector(fxp_output);
+
+    main_process : process (enable, clock)
+        variable sum : signed(DATA_WIDTH+LFSR_WIDTH downto 0);
+        variable rounded : signed(DATA_WIDTH downto 0);
+    begin
+        if (enable = '0') then
+            lfsr <= to_unsigned(SEED, LFSR_WIDTH);
+            fxp_output <= to_signed(0, DATA_WIDTH);
+        elsif (rising_edge(clock)) then
+            sum := resize(signed(x), sum'length) + signed(resize(lfsr, sum'length));
+            rounded := sum(sum'left downto LFSR_WIDTH);
+
+            if rounded > MAX_VALUE then
+                fxp_output <= MAX_VALUE(DATA_WIDTH-1 downto 0);
+            elsif rounded < MIN_VALUE then
+                fxp_output <= MIN_VALUE(DATA_WIDTH-1 downto 0);
+            else
+                fxp_output <= rounded(DATA_WIDTH-1 downto 0);
+            end if;
+
+            if lfsr(0) = '1' then
+                lfsr <= shift_right(lfsr, 1) xor TAPS;
+            else
+                lfsr <= shift_right(lfsr, 1);
+            end if;
+        end if;
+    end process;
+end architecture rtl;
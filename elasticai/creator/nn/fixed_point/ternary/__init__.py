@@ -0,0 +1,2 @@
+from ._math_operations import TernaryMathOperations
+from .layer import TernaryConv1d, TernaryLinear
@@ -0,0 +1,72 @@
+import torch
+from torch.nn.functional import conv1d
+
+from elasticai.creator.base_modules.straight_through import straight_through
+
+from .._math_operations import MathOperations
+
+_THRESHOLD_FACTOR = 0.7
+
+
+class TernaryMathOperations(MathOperations):
+    """Fixed point arithmetic with ternary weights.
+
+    `quantize_parameter` maps a weight tensor to `scale * t` with `t` in
+    `{-1, 0, 1}`. Weights with a magnitude above `0.7` times the mean
+    magnitude become `±1`, `scale` is the mean magnitude of those weights
+    truncated onto the fixed point grid (at least one least significant bit),
+    so each tensor gets its own scale.
+
+    `matmul` and `conv1d` accumulate in float64, which is exact for the
+    sums of products of fixed point values, before they quantize the result
+    like `MathOperations`. `conv1d` adds the bias afterwards, like `Linear`
+    does. This matches the ternary designs, which sum the inputs with masked
+    additions and subtractions, multiply by `scale` once and add the bias.
+    """
+
+    def quantize_parameter(self, a: torch.Tensor) -> torch.Tensor:
+        ternary, scale = self.ternarize(a.detach())
+        quantized = ternary.to(a.dtype) * scale
+        if self._needs_grad(a):
+            return straight_through(quantized, self._clamp(a))
+        return quantized
+
+    def ternarize(self, a: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Integer tensor `t` of `-1`, `0` and `1` and the `scale`.
+
+        Both stay tensors, so the computation neither synchronizes with the
+        device nor breaks tracing.
+        """
+        magnitudes = self._clamp(a).abs()
+        kept = magnitudes > _THRESHOLD_FACTOR * magnitudes.mean()
+        ternary = torch.where(kept, torch.sign(a), 0).to(torch.int64)
+        mean = torch.where(kept, magnitudes, 0).sum() / kept.sum().clamp_min(1)
+        scale = torch.trunc(mean * self._scale).clamp_min(1) / self._scale
+        return ternary, scale.clamp_max(self._maximum)
+
+    def matmul(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+        product = torch.matmul(a.to(torch.float64), b.to(torch.float64))
+        return self._quantize_intermediate(product).to(a.dtype)
+
+    def conv1d(
+        self,
+        x: torch.Tensor,
+        weight: torch.Tensor,
+        bias: torch.Tensor | None,
+        stride: tuple[int, ...],
+        padding: tuple[int, ...] | str,
+        dilation: tuple[int, ...],
+        groups: int,
+    ) -> torch.Tensor:
+        result = conv1d(
+            input=x.to(torch.float64),
+            weight=weight.to(torch.float64),
+            stride=stride,
+            padding=padding,
+            dilation=dilation,
+            groups=groups,
+        )
+        result = self._quantize_intermediate(result).to(x.dtype)
+        if bias is None:
+            return result
+        return self.add(result, bias[:, None])
@@ -0,0 +1,44 @@
+import torch
+
+from .._two_complement_fixed_point_config import FixedPointConfig
+from ._math_operations import TernaryMathOperations
+
+operations = TernaryMathOperations(FixedPointConfig(total_bits=8, frac_bits=4))
+
+
+def test_ternarizes_with_threshold_relative_to_mean_magnitude() -> None:
+    ternary, scale = operations.ternarize(torch.tensor([1.0, -0.9, 0.1, -0.2]))
+    assert ternary.tolist() == [1, -1, 0, 0]
+    assert scale == 0.9375
+
+
+def test_scale_is_at_least_one_least_significant_bit() -> None:
+    _, scale = operations.ternarize(torch.tensor([0.01, -0.01]))
+    assert scale == 0.0625
+
+
+def test_quantize_parameter_yields_scaled_ternary_values() -> None:
+    actual = operations.quantize_parameter(torch.tensor([1.0, -0.9, 0.1, -0.2]))
+    assert actual.tolist() == [0.9375, -0.9375, 0.0, 0.0]
+
+
+def test_gradient_passes_straight_through() -> None:
+    x = torch.tensor([1.0, -0.9, 0.1, -10.0], requires_grad=True)
+    operations.quantize_parameter(x).sum().backward()
+    assert x.grad.tolist() == [1.0, 1.0, 1.0, 0.0]
+
+
+def test_matmul_truncates_exact_sum() -> None:
+    x = torch.tensor([[0.0625, 0.0625, 0.0625]])
+    weight = torch.tensor([[0.3125], [0.3125], [0.0]])
+    assert operations.matmul(x, weight).tolist() == [[0.0]]
+
+
+def test_ternarize_can_be_traced() -> None:
+    def quantize(a: torch.Tensor) -> torch.Tensor:
+        ternary, scale = operations.ternarize(a)
+        return ternary * scale
+
+    traced = torch.jit.trace(quantize, torch.tensor([1.0, -0.9, 0.1, -0.2]))
+    actual = traced(torch.tensor([0.5, 0.5, -0.5, 0.0]))
+    assert actual.tolist() == [0.5, 0.5, -0.5, 0.0]
@@ -0,0 +1,267 @@
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.code_generation.code_abstractions import (
+    create_array_elements,
+)
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.shared_designs.rom import Rom
+
+_CODES = {0: 0b00, 1: 0b01, -1: 0b11}
+
+
+class TernaryLinear(Design):
+    """Fixed point linear layer with weights `scale * t`, `t` in `{-1, 0, 1}`.
+
+    `weights` holds `t`, `scale` and `bias` are integers like for the fixed
+    point `Linear`. The weights are packed `word_size` per ROM entry with 2
+    bits each. Entries without non zero weights are left out, all others
+    take one cycle, in which an adder tree sums up their inputs.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        in_feature_num: int,
+        out_feature_num: int,
+        total_bits: int,
+        frac_bits: int,
+        weights: list[list[int]],
+        scale: int,
+        bias: list[int],
+        word_size: int = 8,
+        work_library_name: str = "work",
+    ) -> None:
+        super().__init__(name=name)
+        self.in_feature_num = in_feature_num
+        self.out_feature_num = out_feature_num
+        self.total_bits = total_bits
+        self.frac_bits = frac_bits
+        self.weights = weights
+        self.scale = scale
+        self.bias = bias
+        self.word_size = word_size
+        self.work_library_name = work_library_name
+        self.words = -(-in_feature_num // word_size)
+        self.index_width = calculate_address_width(self.words)
+
+    @property
+    def port(self) -> Port:
+        return create_port(
+            x_width=self.total_bits,
+            y_width=self.total_bits,
+            x_count=self.in_feature_num,
+            y_count=self.out_feature_num,
+        )
+
+    def rom_entries(self) -> list[int]:
+        """Per output, the entries of all words with a non zero weight, but at
+        least one. Weight `k` of a word is stored in bits `2k+1 downto 2k`,
+        followed by the index of the word and the flag for the last entry."""
+        entries = []
+        for row in self.weights:
+            words = []
+            for index, start in enumerate(
+                range(0, self.in_feature_num, self.word_size)
+            ):
+                chunk = row[start : start + self.word_size]
+                if any(chunk) or (index == self.words - 1 and not words):
+                    codes = sum(_CODES[w] << (2 * k) for k, w in enumerate(chunk))
+                    words.append(codes | index << (2 * self.word_size))
+            words[-1] |= 1 << (2 * self.word_size + self.index_width)
+            entries.extend(words)
+        return entries
+
+    def save_to(self, destination: Path) -> None:
+        rom_name = f"{self.name}_w_rom"
+        entries = self.rom_entries()
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="linear.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                weights_rom_name=rom_name,
+                work_library_name=self.work_library_name,
+                data_width=str(self.total_bits),
+                frac_width=str(self.frac_bits),
+                x_addr_width=str(self.port["x_address"].width),
+                y_addr_width=str(self.port["y_address"].width),
+                w_addr_width=str(calculate_address_width(len(entries))),
+                in_feature_num=str(self.in_feature_num),
+                out_feature_num=str(self.out_feature_num),
+                word_size=str(self.word_size),
+                words=str(self.words),
+                index_width=str(self.index_width),
+                entries=str(len(entries)),
+                acc_width=str(self.total_bits + self.in_feature_num.bit_length()),
+                scale=str(self.scale),
+                bias=create_array_elements(self.bias),
+                adder_tree=_adder_tree([f"terms({k})" for k in range(self.word_size)]),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+        rom = Rom(
+            name=rom_name,
+            data_width=2 * self.word_size + self.index_width + 1,
+            values_as_integers=entries,
+        )
+        rom.save_to(destination.create_subpath(rom_name))
+
+
+class TernaryConv1d(Design):
+    """Fixed point 1d convolution with ternary weights on the datapath of
+    `TernaryLinear`.
+
+    `weights` has the shape `(out_channels, in_channels // groups,
+    kernel_size)` like for `torch.nn.Conv1d`. Input and output are addressed
+    channel by channel, i.e., `x[c, t]` at `c * signal_length + t`. The ROM
+    only holds the kernels, packed `word_size` taps of one input channel per
+    entry, so its size does not depend on `signal_length`. The entries of an
+    output channel are read again for each output position, taps in the
+    padding are skipped. Words without non zero weights, e.g., the channels
+    of other groups, take neither ROM entries nor cycles.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        in_channels: int,
+        out_channels: int,
+        signal_length: int,
+        total_bits: int,
+        frac_bits: int,
+        weights: list[list[list[int]]],
+        scale: int,
+        bias: list[int],
+        stride: int = 1,
+        padding: tuple[int, int] = (0, 0),
+        dilation: int = 1,
+        groups: int = 1,
+        word_size: int = 8,
+        work_library_name: str = "work",
+    ) -> None:
+        super().__init__(name=name)
+        self.in_channels = in_channels
+        self.out_channels = out_channels
+        self.signal_length = signal_length
+        self.total_bits = total_bits
+        self.frac_bits = frac_bits
+        self.weights = weights
+        self.scale = scale
+        self.bias = bias
+        self.stride = stride
+        self.padding = padding
+        self.dilation = dilation
+        self.groups = groups
+        self.word_size = word_size
+        self.work_library_name = work_library_name
+        self.kernel_size = len(weights[0][0])
+        padding_left, padding_right = padding
+        self.output_length = (
+            signal_length
+            + padding_left
+            + padding_right
+            - dilation * (self.kernel_size - 1)
+            - 1
+        ) // stride + 1
+        self.words = -(-self.kernel_size // word_size)
+        self.index_width = calculate_address_width(self.words)
+        self.channel_width = calculate_address_width(in_channels)
+
+    @property
+    def port(self) -> Port:
+        return create_port(
+            x_width=self.total_bits,
+            y_width=self.total_bits,
+            x_count=self.in_channels * self.signal_length,
+            y_count=self.out_channels * self.output_length,
+        )
+
+    def rom_entries(self) -> list[int]:
+        """Per output channel, the entries of all words with a non zero
+        weight, but at least one. Weight `k` of a word is stored in bits
+        `2k+1 downto 2k`, followed by the index of the word within the
+        kernel, the input channel and the flag for the last entry."""
+        index_shift = 2 * self.word_size
+        channel_shift = index_shift + self.index_width
+        last_flag = 1 << (channel_shift + self.channel_width)
+        group_in_channels = self.in_channels // self.groups
+        group_out_channels = self.out_channels // self.groups
+        entries = []
+        for out_channel, kernel in enumerate(self.weights):
+            first_channel = out_channel // group_out_channels * group_in_channels
+            words = []
+            for offset, taps in enumerate(kernel):
+                for index, start in enumerate(
+                    range(0, self.kernel_size, self.word_size)
+                ):
+                    chunk = taps[start : start + self.word_size]
+                    if any(chunk):
+                        codes = sum(_CODES[w] << (2 * k) for k, w in enumerate(chunk))
+                        words.append(
+                            codes
+                            | index << index_shift
+                            | (first_channel + offset) << channel_shift
+                        )
+            if not words:
+                words.append(0)
+            words[-1] |= last_flag
+            entries.extend(words)
+        return entries
+
+    def save_to(self, destination: Path) -> None:
+        rom_name = f"{self.name}_w_rom"
+        entries = self.rom_entries()
+        taps = self.in_channels // self.groups * self.kernel_size
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="conv1d.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                weights_rom_name=rom_name,
+                work_library_name=self.work_library_name,
+                data_width=str(self.total_bits),
+                frac_width=str(self.frac_bits),
+                x_addr_width=str(self.port["x_address"].width),
+                y_addr_width=str(self.port["y_address"].width),
+                w_addr_width=str(calculate_address_width(len(entries))),
+                in_channels=str(self.in_channels),
+                out_channels=str(self.out_channels),
+                signal_length=str(self.signal_length),
+                output_length=str(self.output_length),
+                stride=str(self.stride),
+                dilation=str(self.dilation),
+                padding_left=str(self.padding[0]),
+                word_size=str(self.word_size),
+                index_width=str(self.index_width),
+                channel_width=str(self.channel_width),
+                entries=str(len(entries)),
+                acc_width=str(self.total_bits + taps.bit_length()),
+                scale=str(self.scale),
+                bias=create_array_elements(self.bias),
+                adder_tree=_adder_tree([f"terms({k})" for k in range(self.word_size)]),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+        rom = Rom(
+            name=rom_name,
+            data_width=2 * self.word_size + self.index_width + self.channel_width + 1,
+            values_as_integers=entries,
+        )
+        rom.save_to(destination.create_subpath(rom_name))
+
+
+def _adder_tree(terms: list[str]) -> str:
+    if len(terms) == 1:
+        return terms[0]
+    middle = len(terms) // 2
+    return f"({_adder_tree(terms[:middle])} + {_adder_tree(terms[middle:])})"
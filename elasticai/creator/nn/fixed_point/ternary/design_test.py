@@ -0,0 +1,237 @@
+from typing import cast
+
+import pytest
+import torch
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.nn.sequential import Sequential
+
+from .design import TernaryConv1d as TernaryConv1dDesign
+from .design import TernaryLinear as TernaryLinearDesign
+from .layer import TernaryConv1d, TernaryLinear
+
+
+def create_design(weights: list[list[int]], word_size: int) -> TernaryLinearDesign:
+    return TernaryLinearDesign(
+        name="linear",
+        in_feature_num=len(weights[0]),
+        out_feature_num=len(weights),
+        total_bits=8,
+        frac_bits=4,
+        weights=weights,
+        scale=16,
+        bias=[0] * len(weights),
+        word_size=word_size,
+    )
+
+
+def save_design(design: TernaryLinearDesign) -> dict[str, list[str]]:
+    destination = InMemoryPath("build", parent=None)
+    design.save_to(destination)
+    files = cast(list[InMemoryFile], list(destination.children.values()))
+    return {file.name: file.text for file in files}
+
+
+def saturate(value: int, total_bits: int) -> int:
+    return max(-(2 ** (total_bits - 1)), min(value, 2 ** (total_bits - 1) - 1))
+
+
+def emulate(design: TernaryLinearDesign, x: list[int]) -> list[int]:
+    """Computes the outputs like the datapath does, from the ROM entries."""
+    codes = {0b01: 1, 0b11: -1, 0b00: 0}
+    index_shift = 2 * design.word_size
+    last_flag = 1 << (index_shift + design.index_width)
+    padded = x + [0] * (design.words * design.word_size - len(x))
+    outputs = []
+    total = 0
+    for entry in design.rom_entries():
+        start = ((entry & (last_flag - 1)) >> index_shift) * design.word_size
+        for k in range(design.word_size):
+            total += codes[entry >> (2 * k) & 0b11] * padded[start + k]
+        if entry & last_flag:
+            product = total * design.scale
+            shifted = abs(product) >> design.frac_bits
+            shifted = saturate(-shifted if product < 0 else shifted, design.total_bits)
+            bias = design.bias[len(outputs)]
+            outputs.append(saturate(shifted + bias, design.total_bits))
+            total = 0
+    return outputs
+
+
+def test_saves_layer_and_weight_rom() -> None:
+    design = create_design([[1, -1, 0]], word_size=2)
+    assert set(save_design(design)) == {"linear.vhd", "linear_w_rom.vhd"}
+
+
+def test_packs_two_bits_per_weight_and_skips_zero_words() -> None:
+    design = create_design([[1, -1, 0, 0, 0, 1], [0, 0, 0, 0, 0, 0]], word_size=2)
+    assert design.rom_entries() == [
+        0b0_00_1101,
+        0b1_10_0100,
+        0b1_10_0000,
+    ]
+
+
+def test_builds_balanced_adder_tree() -> None:
+    design = create_design([[1, 1, 1, 1]], word_size=4)
+    code = save_design(design)["linear.vhd"]
+    tree = "((terms(0) + terms(1)) + (terms(2) + terms(3)))"
+    assert any(f"sum := sum + {tree};" in line for line in code)
+
+
+@pytest.mark.parametrize("in_features, word_size", [(5, 4), (13, 8), (16, 8)])
+def test_datapath_matches_layer(in_features: int, word_size: int) -> None:
+    torch.manual_seed(0)
+    layer = TernaryLinear(
+        in_features=in_features, out_features=6, total_bits=8, frac_bits=4
+    )
+    with torch.no_grad():
+        layer.weight.mul_(4)
+        layer.bias.uniform_(-2, 2)
+    exported = layer.create_design("linear")
+    design = TernaryLinearDesign(
+        name="linear",
+        in_feature_num=in_features,
+        out_feature_num=6,
+        total_bits=8,
+        frac_bits=4,
+        weights=exported.weights,
+        scale=exported.scale,
+        bias=exported.bias,
+        word_size=word_size,
+    )
+    for _ in range(20):
+        x = layer._operations.quantize(torch.randn(in_features) * 4)
+        with torch.no_grad():
+            expected = (layer(x) * 16).int().tolist()
+        assert emulate(design, (x * 16).int().tolist()) == expected
+
+
+def emulate_conv1d(design: TernaryConv1dDesign, x: list[int]) -> list[int]:
+    """Computes the outputs like the datapath does, rereading the entries of
+    an output channel for every position."""
+    codes = {0b01: 1, 0b11: -1, 0b00: 0}
+    index_shift = 2 * design.word_size
+    channel_shift = index_shift + design.index_width
+    last_flag = 1 << (channel_shift + design.channel_width)
+    entries = design.rom_entries()
+    outputs = [0] * (design.out_channels * design.output_length)
+    first = 0
+    for channel in range(design.out_channels):
+        last = next(i for i in range(first, len(entries)) if entries[i] & last_flag)
+        for position in range(design.output_length):
+            total = 0
+            for entry in entries[first : last + 1]:
+                word = (entry >> index_shift) & ((1 << design.index_width) - 1)
+                in_channel = (entry & (last_flag - 1)) >> channel_shift
+                for k in range(design.word_size):
+                    t = (
+                        position * design.stride
+                        + (word * design.word_size + k) * design.dilation
+                        - design.padding[0]
+                    )
+                    if 0 <= t < design.signal_length:
+                        value = x[in_channel * design.signal_length + t]
+                        total += codes[entry >> (2 * k) & 0b11] * value
+            product = total * design.scale
+            shifted = abs(product) >> design.frac_bits
+            shifted = saturate(-shifted if product < 0 else shifted, design.total_bits)
+            outputs[channel * design.output_length + position] = saturate(
+                shifted + design.bias[channel], design.total_bits
+            )
+        first = last + 1
+    return outputs
+
+
+def create_conv1d_design(
+    weights: list[list[list[int]]], signal_length: int, groups: int = 1
+) -> TernaryConv1dDesign:
+    return TernaryConv1dDesign(
+        name="conv",
+        in_channels=len(weights[0]) * groups,
+        out_channels=len(weights),
+        signal_length=signal_length,
+        total_bits=8,
+        frac_bits=4,
+        weights=weights,
+        scale=16,
+        bias=[0] * len(weights),
+        groups=groups,
+        word_size=2,
+    )
+
+
+def test_conv1d_packs_kernels_per_input_channel() -> None:
+    design = create_conv1d_design(
+        [[[1, -1, 0], [0, 0, -1]], [[0, 0, 0], [0, 0, 0]]], signal_length=4
+    )
+    assert design.rom_entries() == [
+        0b0_0_0_1101,
+        0b1_1_1_0011,
+        0b1_0_0_0000,
+    ]
+
+
+def test_conv1d_rom_size_does_not_depend_on_signal_length() -> None:
+    weights = [[[1, -1, 1]], [[0, 1, 0]]]
+    short = create_conv1d_design(weights, signal_length=4)
+    long = create_conv1d_design(weights, signal_length=400)
+    assert short.rom_entries() == long.rom_entries()
+    assert 398 == long.output_length
+
+
+@pytest.mark.parametrize(
+    "stride, padding, dilation, groups",
+    [(1, 0, 1, 1), (2, 1, 1, 1), (1, "same", 2, 1), (1, 1, 1, 2)],
+)
+def test_conv1d_datapath_matches_layer(
+    stride: int, padding: int | str, dilation: int, groups: int
+) -> None:
+    torch.manual_seed(0)
+    layer = TernaryConv1d(
+        in_channels=4,
+        out_channels=2,
+        kernel_size=3,
+        total_bits=8,
+        frac_bits=4,
+        signal_length=7,
+        stride=stride,
+        padding=padding,
+        dilation=dilation,
+        groups=groups,
+    )
+    with torch.no_grad():
+        layer.weight.mul_(4)
+        layer.bias.uniform_(-2, 2)
+    design = layer.create_design("conv")
+    for _ in range(10):
+        x = layer._operations.quantize(torch.randn(1, 4, 7) * 4)
+        with torch.no_grad():
+            expected = (layer(x) * 16).int().flatten().tolist()
+        assert emulate_conv1d(design, (x * 16).int().flatten().tolist()) == expected
+
+
+def test_plugs_into_sequential() -> None:
+    model = Sequential(
+        TernaryLinear(in_features=6, out_features=4, total_bits=8, frac_bits=4),
+        TernaryLinear(in_features=4, out_features=2, total_bits=8, frac_bits=4),
+    )
+    destination = InMemoryPath("build", parent=None)
+    model.create_design("network").save_to(destination)
+    assert {"ternarylinear_0", "ternarylinear_1", "network"} <= set(
+        destination.children
+    )
+
+
+def test_conv1d_saves_layer_and_weight_rom() -> None:
+    layer = TernaryConv1d(
+        in_channels=2,
+        out_channels=3,
+        kernel_size=2,
+        total_bits=8,
+        frac_bits=4,
+        signal_length=5,
+    )
+    files = save_design(layer.create_design("conv"))
+    assert set(files) == {"conv.vhd", "conv_w_rom.vhd"}
+    assert "entity conv is" in files["conv.vhd"]
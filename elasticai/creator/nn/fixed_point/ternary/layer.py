@@ -0,0 +1,133 @@
+from typing import Any, cast
+
+import torch
+
+from elasticai.creator.base_modules.conv1d import Conv1d as Conv1dBase
+from elasticai.creator.base_modules.linear import Linear as LinearBase
+from elasticai.creator.vhdl.design_creator import DesignCreator
+
+from .._two_complement_fixed_point_config import FixedPointConfig
+from ..conv1d.design import padding_per_side
+from ._math_operations import TernaryMathOperations
+from .design import TernaryConv1d as TernaryConv1dDesign
+from .design import TernaryLinear as TernaryLinearDesign
+
+
+class TernaryLinear(DesignCreator, LinearBase):
+    """Fixed point linear layer with ternary weights, see
+    `TernaryMathOperations`. Biases stay on the fixed point grid."""
+
+    def __init__(
+        self,
+        in_features: int,
+        out_features: int,
+        total_bits: int,
+        frac_bits: int,
+        bias: bool = True,
+        device: Any = None,
+    ) -> None:
+        self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
+        super().__init__(
+            in_features=in_features,
+            out_features=out_features,
+            operations=TernaryMathOperations(self._config),
+            bias=bias,
+            device=device,
+        )
+
+    def _quantized(self, name: str, parameter: torch.Tensor) -> torch.Tensor:
+        if name == "bias":
+            return self._quantized_parameters.get(
+                name, parameter, self._operations.quantize
+            )
+        return super()._quantized(name, parameter)
+
+    def create_design(self, name: str) -> TernaryLinearDesign:
+        operations = cast(TernaryMathOperations, self._operations)
+        with torch.no_grad():
+            ternary, scale = operations.ternarize(self.weight)
+            bias = (
+                torch.zeros(self.out_features)
+                if self.bias is None
+                else self._quantized("bias", self.bias)
+            )
+        return TernaryLinearDesign(
+            name=name,
+            in_feature_num=self.in_features,
+            out_feature_num=self.out_features,
+            total_bits=self._config.total_bits,
+            frac_bits=self._config.frac_bits,
+            weights=ternary.tolist(),
+            scale=int(self._config.as_integer(scale).item()),
+            bias=cast(list[int], self._config.as_integer(bias).int().tolist()),
+        )
+
+
+class TernaryConv1d(DesignCreator, Conv1dBase):
+    """Fixed point 1d convolution with ternary weights, see
+    `TernaryMathOperations`. Biases stay on the fixed point grid.
+    `signal_length` is only needed for the design."""
+
+    def __init__(
+        self,
+        in_channels: int,
+        out_channels: int,
+        kernel_size: int | tuple[int],
+        total_bits: int,
+        frac_bits: int,
+        signal_length: int,
+        stride: int | tuple[int] = 1,
+        padding: int | tuple[int] | str = 0,
+        dilation: int | tuple[int] = 1,
+        groups: int = 1,
+        bias: bool = True,
+        device: Any = None,
+    ) -> None:
+        self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
+        self._signal_length = signal_length
+        super().__init__(
+            operations=TernaryMathOperations(self._config),
+            in_channels=in_channels,
+            out_channels=out_channels,
+            kernel_size=kernel_size,
+            stride=stride,
+            padding=padding,
+            dilation=dilation,
+            groups=groups,
+            bias=bias,
+            device=device,
+        )
+
+    def _quantized(self, name: str, parameter: torch.Tensor) -> torch.Tensor:
+        if name == "bias":
+            return self._quantized_parameters.get(
+                name, parameter, self._operations.quantize
+            )
+        return super()._quantized(name, parameter)
+
+    def create_design(self, name: str) -> TernaryConv1dDesign:
+        operations = cast(TernaryMathOperations, self._operations)
+        with torch.no_grad():
+            ternary, scale = operations.ternarize(self.weight)
+            bias = (
+                torch.zeros(self.out_channels)
+                if self.bias is None
+                else self._quantized("bias", self.bias)
+            )
+        return TernaryConv1dDesign(
+            name=name,
+            in_channels=self.in_channels,
+            out_channels=self.out_channels,
+            signal_length=self._signal_length,
+            total_bits=self._config.total_bits,
+            frac_bits=self._config.frac_bits,
+            weights=ternary.tolist(),
+            scale=int(self._config.as_integer(scale).item()),
+            bias=cast(list[int], self._config.as_integer(bias).int().tolist()),
+            stride=self.stride[0],
+            padding=padding_per_side(
+                self.padding, self.kernel_size[0], self.dilation[0]
+            ),
+            dilation=self.dilation[0],
+            groups=self.groups,
+        )
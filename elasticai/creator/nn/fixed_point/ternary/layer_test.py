@@ -0,0 +1,37 @@
+import torch
+
+from .layer import TernaryConv1d, TernaryLinear
+
+
+def test_linear_uses_ternary_weights_and_fixed_point_bias() -> None:
+    linear = TernaryLinear(in_features=3, out_features=1, total_bits=8, frac_bits=4)
+    with torch.no_grad():
+        linear.weight.copy_(torch.tensor([[1.0, -1.0, 0.1]]))
+        linear.bias.copy_(torch.tensor([0.3]))
+        actual = linear(torch.tensor([2.0, 0.5, 3.0]))
+    assert actual.tolist() == [1.5 + 0.25]
+
+
+def test_conv1d_uses_ternary_weights() -> None:
+    conv = TernaryConv1d(
+        in_channels=1,
+        out_channels=1,
+        kernel_size=2,
+        total_bits=8,
+        frac_bits=4,
+        signal_length=3,
+    )
+    with torch.no_grad():
+        conv.weight.copy_(torch.tensor([[[0.5, -0.5]]]))
+        conv.bias.copy_(torch.tensor([0.0]))
+        actual = conv(torch.tensor([[[1.0, 2.0, 4.0]]]))
+    assert actual.tolist() == [[[-0.5, -1.0]]]
+
+
+def test_design_holds_ternary_weights_and_integer_scale() -> None:
+    linear = TernaryLinear(in_features=3, out_features=1, total_bits=8, frac_bits=4)
+    with torch.no_grad():
+        linear.weight.copy_(torch.tensor([[1.0, -1.0, 0.1]]))
+        linear.bias.copy_(torch.tensor([0.3]))
+    design = linear.create_design("linear")
+    assert (design.weights, design.scale, design.bias) == ([[1, -1, 0]], 16, [4])
@@ -0,0 +1,174 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+library ${work_library_name};
+use ${work_library_name}.all;
+
+-- Linear layer with ternary weights scale * t, t in {-1, 0, 1}.
+-- The inputs are read into a buffer first. Each ROM entry holds WORD_SIZE
+-- weights as 2 bit codes ("01" for 1, "11" for -1, "00" for 0), the index
+-- of the WORD_SIZE inputs they belong to and a flag for the last entry of
+-- an output. Words without any non zero weight are not stored, so they
+-- take no cycles. Per cycle an adder tree adds or subtracts the inputs of
+-- one entry, zeros are masked. Each output multiplies its sum with SCALE
+-- once, then adds its bias.
+entity ${name} is
+    generic (
+        DATA_WIDTH : integer := ${data_width};
+        FRAC_WIDTH : integer := ${frac_width};
+        X_ADDR_WIDTH : integer := ${x_addr_width};
+        Y_ADDR_WIDTH : integer := ${y_addr_width};
+        IN_FEATURE_NUM : integer := ${in_feature_num};
+        OUT_FEATURE_NUM : integer := ${out_feature_num};
+        WORD_SIZE : integer := ${word_size};
+        WORDS : integer := ${words};
+        INDEX_WIDTH : integer := ${index_width};
+        ENTRIES : integer := ${entries};
+        ACC_WIDTH : integer := ${acc_width}
+    );
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+        x_address : out std_logic_vector(X_ADDR_WIDTH-1 downto 0);
+        y_address : in std_logic_vector(Y_ADDR_WIDTH-1 downto 0);
+
+        x   : in std_logic_vector(DATA_WIDTH-1 downto 0);
+        y  : out std_logic_vector(DATA_WIDTH-1 downto 0);
+
+        done   : out std_logic
+    );
+end ${name};
+
+architecture rtl of ${name} is
+    constant ENTRY_WIDTH : integer := 2*WORD_SIZE + INDEX_WIDTH + 1;
+    constant SCALE : signed(DATA_WIDTH-1 downto 0) := to_signed(${scale}, DATA_WIDTH);
+    constant MIN_VALUE : integer := -2**(DATA_WIDTH-1);
+    constant MAX_VALUE : integer := 2**(DATA_WIDTH-1)-1;
+
+    type t_bias is array (0 to OUT_FEATURE_NUM-1) of integer;
+    constant BIAS : t_bias := (
+        $bias
+    );
+
+    -- truncates towards zero and saturates like the software, then adds the
+    -- bias with saturation
+    function finish(sum : signed(ACC_WIDTH-1 downto 0); b : integer) return signed is
+        variable product : signed(ACC_WIDTH+DATA_WIDTH-1 downto 0);
+        variable shifted : signed(ACC_WIDTH+DATA_WIDTH-1 downto 0);
+        variable result : signed(ACC_WIDTH+DATA_WIDTH-1 downto 0);
+    begin
+        product := sum * SCALE;
+        shifted := shift_right(product, FRAC_WIDTH);
+        if product < 0 and shift_left(shifted, FRAC_WIDTH) /= product then
+            shifted := shifted + 1;
+        end if;
+        if shifted > MAX_VALUE then
+            shifted := to_signed(MAX_VALUE, shifted'length);
+        elsif shifted < MIN_VALUE then
+            shifted := to_signed(MIN_VALUE, shifted'length);
+        end if;
+        result := shifted + b;
+        if result > MAX_VALUE then
+            result := to_signed(MAX_VALUE, result'length);
+        elsif result < MIN_VALUE then
+            result := to_signed(MIN_VALUE, result'length);
+        end if;
+        return result(DATA_WIDTH-1 downto 0);
+    end function;
+
+    type t_state is (s_load, s_forward, s_idle);
+    signal state : t_state;
+
+    type t_inputs is array (0 to WORDS*WORD_SIZE-1) of signed(DATA_WIDTH-1 downto 0);
+    signal x_buffer : t_inputs := (others => (others => '0'));
+
+    type t_terms is array (0 to WORD_SIZE-1) of signed(ACC_WIDTH-1 downto 0);
+
+    signal n_clock : std_logic;
+    signal reset : std_logic;
+    signal w_in : std_logic_vector(ENTRY_WIDTH-1 downto 0);
+    signal addr_w : std_logic_vector(${w_addr_width}-1 downto 0) := (others => '0');
+
+    type t_y_array is array (0 to OUT_FEATURE_NUM-1) of std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal y_ram : t_y_array;
+begin
+    n_clock <= not clock;
+    reset <= not enable;
+
+    main : process (clock, reset)
+        variable input_idx : integer range 0 to IN_FEATURE_NUM-1 := 0;
+        variable neuron_idx : integer range 0 to OUT_FEATURE_NUM-1 := 0;
+        variable var_addr_w : integer range 0 to ENTRIES-1 := 0;
+        variable word_idx : integer range 0 to WORDS-1;
+        variable code : std_logic_vector(1 downto 0);
+        variable terms : t_terms;
+        variable sum : signed(ACC_WIDTH-1 downto 0) := (others => '0');
+    begin
+        if reset = '1' then
+            state <= s_load;
+            done <= '0';
+            input_idx := 0;
+            neuron_idx := 0;
+            var_addr_w := 0;
+            sum := (others => '0');
+        elsif rising_edge(clock) then
+            if state = s_load then
+                x_buffer(input_idx) <= signed(x);
+                if input_idx < IN_FEATURE_NUM-1 then
+                    input_idx := input_idx + 1;
+                else
+                    state <= s_forward;
+                end if;
+            elsif state = s_forward then
+                word_idx := to_integer(unsigned(w_in(2*WORD_SIZE+INDEX_WIDTH-1 downto 2*WORD_SIZE)));
+                for j in 0 to WORD_SIZE-1 loop
+                    code := w_in(2*j+1 downto 2*j);
+                    if code = "01" then
+                        terms(j) := resize(x_buffer(word_idx*WORD_SIZE+j), ACC_WIDTH);
+                    elsif code = "11" then
+                        terms(j) := -resize(x_buffer(word_idx*WORD_SIZE+j), ACC_WIDTH);
+                    else
+                        terms(j) := (others => '0');
+                    end if;
+                end loop;
+                sum := sum + ${adder_tree};
+
+                if w_in(ENTRY_WIDTH-1) = '1' then
+                    y_ram(neuron_idx) <= std_logic_vector(finish(sum, BIAS(neuron_idx)));
+                    sum := (others => '0');
+                    if neuron_idx < OUT_FEATURE_NUM-1 then
+                        neuron_idx := neuron_idx + 1;
+                    else
+                        state <= s_idle;
+                    end if;
+                end if;
+                if var_addr_w < ENTRIES-1 then
+                    var_addr_w := var_addr_w + 1;
+                end if;
+            else
+                done <= '1';
+            end if;
+        end if;
+
+        x_address <= std_logic_vector(to_unsigned(input_idx, x_address'length));
+        addr_w <= std_logic_vector(to_unsigned(var_addr_w, addr_w'length));
+    end process main;
+
+    y_reading : process (clock, state)
+    begin
+        if state = s_idle then
+            if falling_edge(clock) then
+                y <= y_ram(to_integer(unsigned(y_address)));
+            end if;
+        end if;
+    end process y_reading;
+
+    rom_w : entity ${work_library_name}.${weights_rom_name}(rtl)
+    port map (
+        clk  => n_clock,
+        en   => '1',
+        addr => addr_w,
+        data => w_in
+    );
+end architecture rtl;
@@ -1,25 +1,23 @@
-from typing import cast
-
 import torch
+from torch.nn.functional import conv1d
 
 from elasticai.creator.base_modules.conv1d import MathOperations as Conv1dOps
 from elasticai.creator.base_modules.linear import MathOperations as LinearOps
 from elasticai.creator.base_modules.lstm_cell import MathOperations as LSTMOps
+from elasticai.creator.base_modules.straight_through import straight_through
 
-from ._round_to_float import RoundToFloat
+from ._round_to_float import float_format, round_to_float
 
 
 class MathOperations(LinearOps, Conv1dOps, LSTMOps):
     def __init__(self, mantissa_bits: int, exponent_bits: int) -> None:
         self.mantissa_bits = mantissa_bits
         self.exponent_bits = exponent_bits
+        self._largest_value = float_format(mantissa_bits, exponent_bits).largest_value
 
     @property
     def largest_positive_value(self) -> float:
-        exponent_bias = 2 ** (self.exponent_bits - 1)
-        return (2 - 1 / 2**self.mantissa_bits) * 2 ** (
-            2**self.exponent_bits - exponent_bias - 1
-        )
+        return self._largest_value
 
     @property
     def smallest_negative_value(self) -> float:
@@ -29,15 +27,13 @@ class MathOperations(LinearOps, Conv1dOps, LSTMOps):
         return self._round(self._clamp(a))
 
     def _clamp(self, a: torch.Tensor) -> torch.Tensor:
-        return torch.clamp(
-            a, min=self.smallest_negative_value, max=self.largest_positive_value
-        )
+        return torch.clamp(a, min=-self._largest_value, max=self._largest_value)
 
     def _round(self, a: torch.Tensor) -> torch.Tensor:
-        return cast(
-            torch.Tensor,
-            RoundToFloat.apply(a, self.mantissa_bits, self.exponent_bits),
-        )
+        rounded = round_to_float(a.detach(), self.mantissa_bits, self.exponent_bits)
+        if torch.is_grad_enabled() and a.requires_grad:
+            return straight_through(rounded, a)
+        return rounded
 
     def add(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
         return self.quantize(a + b)
@@ -47,3 +43,25 @@ class MathOperations(LinearOps, Conv1dOps, LSTMOps):
 
     def mul(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
         return self.quantize(a * b)
+
+    def conv1d(
+        self,
+        x: torch.Tensor,
+        weight: torch.Tensor,
+        bias: torch.Tensor | None,
+        stride: tuple[int, ...],
+        padding: tuple[int, ...] | str,
+        dilation: tuple[int, ...],
+        groups: int,
+    ) -> torch.Tensor:
+        return self.quantize(
+            conv1d(
+                input=x,
+                weight=weight,
+                bias=bias,
+                stride=stride,
+                padding=padding,
+                dilation=dilation,
+                groups=groups,
+            )
+        )
@@ -9,7 +9,7 @@ def test_quantize() -> None:
     arithmetics = MathOperations(mantissa_bits=3, exponent_bits=1)
     a = torch.tensor([-3.0, -2.0, -1.69, -0.2, 0.2, 1.69, 2.0, 3.0])
     assertTensorEqual(
-        expected=[-1.875, -1.875, -1.75, -0.203125, 0.203125, 1.75, 1.875, 1.875],
+        expected=[-1.875, -1.875, -1.75, -0.25, 0.25, 1.75, 1.875, 1.875],
         actual=arithmetics.quantize(a),
     )
 
@@ -19,7 +19,7 @@ def test_add() -> None:
     a = torch.tensor([-0.6875, 0.1250, 0.6875])
     b = torch.tensor([-0.3125, 0.2031, 0.3125])
     assertTensorEqual(
-        expected=[-1.0, 0.3125, 1.0],
+        expected=[-1.0, 0.375, 1.0],
         actual=arithmetics.add(a, b),
     )
 
@@ -29,7 +29,7 @@ def test_mul() -> None:
     a = torch.tensor([-0.6875, 0.1250, 0.6875])
     b = torch.tensor([-0.3125, 0.2031, 0.3125])
     assertTensorEqual(
-        expected=[0.21875, 0.125, 0.21875],
+        expected=[0.25, 0.0, 0.25],
         actual=arithmetics.mul(a, b),
     )
 
@@ -42,3 +42,17 @@ def test_matmul() -> None:
         expected=[[-0.75], [0.125], [0.875]],
         actual=arithmetics.matmul(a, b),
     )
+
+
+def test_quantize_passes_gradient_of_values_in_range() -> None:
+    arithmetics = MathOperations(mantissa_bits=3, exponent_bits=1)
+    a = torch.tensor([-3.0, 0.2, 1.69], requires_grad=True)
+    arithmetics.quantize(a).sum().backward()
+    assertTensorEqual(expected=[0.0, 1.0, 1.0], actual=a.grad)
+
+
+def test_quantize_does_not_modify_input() -> None:
+    arithmetics = MathOperations(mantissa_bits=3, exponent_bits=1)
+    a = torch.tensor([0.0, 1.75])
+    _ = arithmetics.quantize(a)
+    assertTensorEqual(expected=[0.0, 1.75], actual=a)
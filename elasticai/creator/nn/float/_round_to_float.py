@@ -1,7 +1,67 @@
-from typing import Any
+from functools import cache
+from typing import Any, NamedTuple
 
 import torch
 
+_FLOAT32_BIAS = 127
+_FLOAT32_MANTISSA_BITS = 23
+
+
+class FloatFormat(NamedTuple):
+    """Constants of a float format with an exponent bias of
+    `2**(exponent_bits - 1)`."""
+
+    mantissa_bits: int
+    min_exponent: int
+    largest_value: float
+
+
+@cache
+def float_format(mantissa_bits: int, exponent_bits: int) -> FloatFormat:
+    exponent_bias = 2 ** (exponent_bits - 1)
+    return FloatFormat(
+        mantissa_bits=mantissa_bits,
+        min_exponent=1 - exponent_bias,
+        largest_value=(2 - 1 / 2**mantissa_bits)
+        * 2 ** (2**exponent_bits - exponent_bias - 1),
+    )
+
+
+def round_to_float(
+    x: torch.Tensor, mantissa_bits: int, exponent_bits: int
+) -> torch.Tensor:
+    """Round to the nearest float with the given number of bits.
+
+    Values below the smallest normal magnitude are rounded to subnormal
+    numbers, i.e., to multiples of `2**(min_exponent - mantissa_bits)`, which
+    includes zero. `x` is left untouched.
+    """
+    fmt = float_format(mantissa_bits, exponent_bits)
+    fits_float32 = fmt.min_exponent - mantissa_bits > -_FLOAT32_BIAS
+    if x.dtype == torch.float32 and fits_float32:
+        return _round_float32(x, fmt)
+    _, exponent = torch.frexp(x)
+    # frexp returns mantissas in [0.5, 1), so floor(log2(|x|)) == exponent - 1
+    shift = torch.clamp(exponent - 1, min=fmt.min_exponent) - fmt.mantissa_bits
+    return torch.ldexp(torch.round(torch.ldexp(x, -shift)), shift)
+
+
+def _round_float32(x: torch.Tensor, fmt: FloatFormat) -> torch.Tensor:
+    """Works on the exponent field of the IEEE 754 representation, shifted
+    by 23 bits. Both scale factors are powers of two, so they are built by
+    writing their exponent field directly, without any `log2` or `pow`."""
+    one = 1 << _FLOAT32_MANTISSA_BITS
+    exponent_field = torch.bitwise_and(x.view(torch.int32), 0x7F800000)
+    exponent_field = torch.clamp(
+        exponent_field, min=(fmt.min_exponent + _FLOAT32_BIAS) * one
+    )
+    mantissa_offset = fmt.mantissa_bits * one
+    down = (2 * _FLOAT32_BIAS * one + mantissa_offset - exponent_field).view(
+        torch.float32
+    )
+    up = (exponent_field - mantissa_offset).view(torch.float32)
+    return torch.round(x * down).mul_(up)
+
 
 class RoundToFloat(torch.autograd.Function):
     @staticmethod
@@ -15,20 +75,12 @@ class RoundToFloat(torch.autograd.Function):
         mantissa_bits: int = args[1]
         exponent_bits: int = args[2]
 
-        exponent_bias = 2 ** (exponent_bits - 1)
-        largest_value = (2 - 1 / 2**mantissa_bits) * 2 ** (
-            2**exponent_bits - exponent_bias - 1
-        )
-
+        largest_value = float_format(mantissa_bits, exponent_bits).largest_value
         out_of_bounds = (x < -largest_value) | (x > largest_value)
         if torch.any(out_of_bounds):
             raise ValueError("Cannot quantize tensor. Values out of bounds.")
 
-        smallest_value = 2 ** (1 - exponent_bias - mantissa_bits)
-        x[(x > -smallest_value) & (x < smallest_value)] = smallest_value
-
-        scale = 2 ** (x.abs().log2().floor() - mantissa_bits)
-        return scale * torch.round(x / scale)
+        return round_to_float(x, mantissa_bits, exponent_bits)
 
     @staticmethod
     def backward(ctx: Any, *grad_outputs: Any) -> Any:
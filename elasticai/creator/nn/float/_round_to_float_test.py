@@ -19,10 +19,13 @@ def roundToFloat(
 @pytest.mark.parametrize(
     "decimal,target_float,mantissa_bits,exponent_bits",
     [
-        (0.0, 0.001953125, 6, 3),
+        (0.0, 0.0, 6, 3),
+        (0.0009765625, 0.0, 6, 3),
+        (0.0029296875, 0.00390625, 6, 3),
         (9.5694284, 9.625, 6, 3),
         (-9.5694284, -9.625, 6, 3),
-        (0.0, 0.125, 3, 1),
+        (0.0, 0.0, 3, 1),
+        (0.2, 0.25, 3, 1),
         (1.525, 1.5, 3, 1),
     ],
 )
@@ -35,7 +38,7 @@ def test_round_single_number_to_correct_float(
 
 def test_uses_different_scale_for_each_value_in_tensor() -> None:
     values = [-14.9, -5.4, 0.05, 8.123456789]
-    target_floats = [-14.875, -5.375, 0.0498046875, 8.125]
+    target_floats = [-14.875, -5.375, 0.05078125, 8.125]
     actual_floats = roundToFloat(values, 6, 3)
     assertTensorEqual(target_floats, actual_floats)
 
@@ -44,3 +47,27 @@ def test_uses_different_scale_for_each_value_in_tensor() -> None:
 def test_raises_error_if_value_out_of_bounds(decimal: float) -> None:
     with pytest.raises(ValueError):
         _ = roundToFloat(decimal, 6, 3)
+
+
+def test_does_not_modify_input() -> None:
+    values = torch.tensor([0.0, 0.0001, -3.3])
+    expected = values.clone()
+    roundToFloat(values, 6, 3)
+    assertTensorEqual(expected, values)
+
+
+def test_matches_log2_based_rounding_for_normal_numbers() -> None:
+    values = torch.linspace(-15, 15, 10001)
+    values = values[values.abs() >= 2**-3]
+    scale = 2 ** (values.abs().log2().floor() - 6)
+    assertTensorEqual(scale * torch.round(values / scale), roundToFloat(values, 6, 3))
+
+
+@pytest.mark.parametrize("mantissa_bits, exponent_bits", [(3, 4), (6, 3), (2, 5)])
+def test_float32_bit_manipulation_matches_frexp(
+    mantissa_bits: int, exponent_bits: int
+) -> None:
+    values = torch.linspace(-1, 1, 10001) ** 3 * 7
+    float32 = roundToFloat(values, mantissa_bits, exponent_bits)
+    float64 = roundToFloat(values.double(), mantissa_bits, exponent_bits)
+    assertTensorEqual(float64.float(), float32)
@@ -1,8 +1,10 @@
 from typing import cast
 
 import pytest
+import torch
 
 from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.nn.fixed_point import HardTanh, Linear, Sigmoid
 from elasticai.creator.nn.identity.layer import BufferedIdentity
 
 from .layer import Sequential
@@ -121,3 +123,31 @@ def translate_model(model: Sequential) -> InMemoryPath:
 def sequential_layer_code_for_model(model: Sequential) -> list[str]:
     destination = translate_model(model)
     return get_code(destination["sequential"])
+
+
+class TestCompilation:
+    @pytest.fixture
+    def model(self) -> Sequential:
+        torch.manual_seed(0)
+        return Sequential(
+            Linear(3, 4, total_bits=8, frac_bits=4),
+            HardTanh(total_bits=8, frac_bits=4),
+            Sigmoid(
+                total_bits=8, frac_bits=4, num_steps=16, sampling_intervall=(-2.0, 2.0)
+            ),
+            Linear(4, 2, total_bits=8, frac_bits=4),
+        )
+
+    def test_traced_model_matches_eager_model(self, model: Sequential) -> None:
+        x = torch.randn(5, 3)
+        with torch.no_grad():
+            traced = torch.jit.trace(model, x)
+            assert torch.equal(model(x), traced(x))
+
+    @pytest.mark.skipif(not hasattr(torch, "compile"), reason="requires torch.compile")
+    def test_model_compiles_into_a_single_graph(self, model: Sequential) -> None:
+        x = torch.randn(5, 3)
+        compiled = torch.compile(model, fullgraph=True, backend="eager")
+        assert torch.equal(model(x), compiled(x))
+        compiled(x).sum().backward()
+        assert model[0].weight.grad is not None
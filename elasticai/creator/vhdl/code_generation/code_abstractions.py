@@ -67,6 +67,13 @@ def signal_definition(
         return logic_signal(name)
 
 
+def create_array_elements(values: Sequence[object]) -> list[str]:
+    """Elements of an array aggregate, one per line. Uses named association,
+    so that arrays with a single element work, too."""
+    elements = [f"{index} => {value}" for index, value in enumerate(values)]
+    return [f"{element}," for element in elements[:-1]] + elements[-1:]
+
+
 def hex_representation(hex_value: str) -> str:
     return f'x"{hex_value}"'
 
@@ -92,6 +99,7 @@ def to_vhdl_binary_string(number: int, number_of_bits: int) -> str:
             value = discard_leading_bits(invert(abs(value)) + 1)
 
         return value
+
     two_complement = _to_unsigned(number, number_of_bits)
 
     return f'"{two_complement:0{number_of_bits}b}"'
@@ -1,6 +1,6 @@
 import pytest
 
-from .code_abstractions import to_vhdl_binary_string
+from .code_abstractions import create_array_elements, to_vhdl_binary_string
 
 
 def test_to_vhdl_binary_string_raises_error_if_value_not_representable() -> None:
@@ -21,3 +21,11 @@ def test_to_vhdl_binary_string_raises_error_if_value_not_representable() -> None
 )
 def test_to_vhdl_binary_string(number: int, number_of_bits: int, expected: str) -> None:
     assert to_vhdl_binary_string(number, number_of_bits) == expected
+
+
+def test_array_elements_use_named_association() -> None:
+    assert ["0 => 3,", "1 => -1"] == create_array_elements([3, -1])
+
+
+def test_single_array_element_has_no_trailing_comma() -> None:
+    assert ["0 => 7"] == create_array_elements([7])
@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from typing import Literal
 
 from elasticai.creator.file_generation.savable import Path
 from elasticai.creator.file_generation.template import (
@@ -6,42 +7,121 @@ from elasticai.creator.file_generation.template import (
     module_to_package,
 )
 from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.code_generation.code_abstractions import (
+    to_vhdl_binary_string,
+)
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.design.ports import Port
 
+Strategy = Literal["auto", "chain", "rom", "tree"]
+
+_MAX_CHAIN_LENGTH = 16
+_MAX_ROM_ADDRESS_WIDTH = 12
+
 
 class PrecomputedScalarFunction(Design):
+    """Lookup table for a scalar function.
+
+    `function` is called once with a list of inputs and has to return the
+    output for each of them in the same order. Three implementations are
+    available:
+
+    - `"chain"`: one `if/elsif` branch per entry of `inputs`.
+    - `"rom"`: a constant array holding the output for every possible input,
+      addressed by the input itself. No comparisons at all, but `2**width`
+      entries.
+    - `"tree"`: a binary search over the sorted `inputs` that returns the
+      output of the smallest entry not smaller than `x`, with a logarithmic
+      number of comparators in a row.
+
+    All of them are combinational, like the rest of the port expects. `"auto"`
+    uses the chain for up to 16 entries. Larger tables get the ROM if it has
+    at most `2**12` entries, and the tree otherwise.
+    """
+
     _template_package = module_to_package(__name__)
 
     def __init__(
         self,
         name: str,
         width: int,
-        function: Callable[[int], int],
+        function: Callable[[list[int]], list[int]],
         inputs: list[int],
+        strategy: Strategy = "auto",
     ) -> None:
         super().__init__(name)
         self._width = width
         self._function = function
         self._inputs = inputs
+        self.strategy = self._choose_strategy(strategy)
         self._template = InProjectTemplate(
-            file_name="precomputed_scalar_function.tpl.vhd",
+            file_name=self._template_file_name(),
             package=self._template_package,
             parameters=dict(name=self.name, data_width=str(width)),
         )
 
+    def _choose_strategy(self, strategy: Strategy) -> Strategy:
+        if strategy not in ("auto", "chain", "rom", "tree"):
+            raise ValueError(f"Unknown strategy '{strategy}'.")
+        if strategy != "auto":
+            return strategy
+        if (
+            len(set(self._inputs)) > _MAX_CHAIN_LENGTH
+            and self._width <= _MAX_ROM_ADDRESS_WIDTH
+        ):
+            return "rom"
+        if len(set(self._inputs)) > _MAX_CHAIN_LENGTH:
+            return "tree"
+        return "chain"
+
+    def _template_file_name(self) -> str:
+        if self.strategy == "chain":
+            return "precomputed_scalar_function.tpl.vhd"
+        return f"precomputed_scalar_function_{self.strategy}.tpl.vhd"
+
     def _compute_io_pairs(self) -> dict[int, int]:
         inputs_in_descending_order = sorted(self._inputs, reverse=True)
-        pairs = dict()
-        for number in inputs_in_descending_order:
-            pairs[number] = self._function(number)
-        return pairs
+        outputs = self._function(inputs_in_descending_order)
+        return dict(zip(inputs_in_descending_order, outputs))
 
     @property
     def port(self) -> Port:
         return create_port(x_width=self._width, y_width=self._width)
 
     def save_to(self, destination: Path) -> None:
+        if self.strategy == "rom":
+            self._template.parameters.update(rom_content=self._rom_content())
+        elif self.strategy == "tree":
+            self._template.parameters.update(self._search_tree_tables())
+        else:
+            self._template.parameters.update(process_content=self._if_chain())
+        destination.create_subpath(self.name).as_file(".vhd").write(self._template)
+
+    def _rom_content(self) -> list[str]:
+        minimum, maximum = -(1 << (self._width - 1)), 1 << (self._width - 1)
+        return self._vhdl_array(self._function(list(range(minimum, maximum))))
+
+    def _search_stages(self) -> int:
+        return len(set(self._inputs)).bit_length()
+
+    def _search_tree_tables(self) -> dict[str, str | list[str]]:
+        """Thresholds are padded with the maximum value, which is never smaller
+        than `x`, outputs with the output of the largest threshold."""
+        thresholds = sorted(set(self._inputs))
+        outputs = self._function(thresholds)
+        padding = (1 << self._search_stages()) - len(thresholds)
+        maximum = (1 << (self._width - 1)) - 1
+        return dict(
+            stages=str(self._search_stages()),
+            thresholds=self._vhdl_array(thresholds + [maximum] * padding),
+            outputs=self._vhdl_array(outputs + outputs[-1:] * padding),
+        )
+
+    def _vhdl_array(self, values: list[int]) -> list[str]:
+        elements = [to_vhdl_binary_string(value, self._width) for value in values]
+        return [f"{element}," for element in elements[:-1]] + elements[-1:]
+
+    def _if_chain(self) -> list[str]:
         process_content = []
 
         pairs = list(self._compute_io_pairs().items())
@@ -58,6 +138,4 @@ class PrecomputedScalarFunction(Design):
         _, output = pairs[-1]
         process_content.append(f"else signed_y <= to_signed({output}, {self._width});")
         process_content.append("end if;")
-
-        self._template.parameters.update(process_content=process_content)
-        destination.create_subpath(self.name).as_file(".vhd").write(self._template)
+        return process_content
@@ -0,0 +1,90 @@
+import pytest
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryPath
+
+from .design import PrecomputedScalarFunction
+
+
+def square_clamped(inputs: list[int]) -> list[int]:
+    return [min(x * x, 31) for x in inputs]
+
+
+def create_design(
+    width: int, inputs: list[int], strategy: str = "auto"
+) -> PrecomputedScalarFunction:
+    return PrecomputedScalarFunction(
+        name="f",
+        width=width,
+        function=square_clamped,
+        inputs=inputs,
+        strategy=strategy,  # type: ignore
+    )
+
+
+def generate_code(design: PrecomputedScalarFunction) -> list[str]:
+    build_root = InMemoryPath("build", parent=None)
+    design.save_to(build_root)
+    return [line.strip() for line in build_root.children["f"].text]
+
+
+def parse_array(code: list[str], declaration: str) -> list[int]:
+    start = code.index(declaration) + 1
+    end = code.index(");", start)
+    values = []
+    for element in code[start:end]:
+        bits = element.strip(",").strip('"')
+        value = int(bits, 2)
+        values.append(value - (1 << len(bits)) if bits[0] == "1" else value)
+    return values
+
+
+@pytest.mark.parametrize(
+    "width, inputs, expected",
+    [
+        (8, list(range(-8, 8)), "chain"),
+        (8, list(range(-50, 50)), "rom"),
+        (16, list(range(-50, 50)), "tree"),
+        (16, list(range(-8, 8)), "chain"),
+    ],
+)
+def test_chooses_strategy_from_size(width: int, inputs: list[int], expected: str):
+    assert expected == create_design(width, inputs).strategy
+
+
+def test_rom_holds_output_for_every_input() -> None:
+    code = generate_code(create_design(6, list(range(-20, 20)), strategy="rom"))
+    assert square_clamped(list(range(-32, 32))) == parse_array(
+        code, "constant ROM : rom_t := ("
+    )
+
+
+def test_tree_finds_output_of_smallest_threshold_not_smaller_than_x() -> None:
+    inputs = list(range(-30, 30, 3))
+    design = create_design(8, inputs, strategy="tree")
+    code = generate_code(design)
+    thresholds = parse_array(code, "constant THRESHOLDS : table_t := (")
+    outputs = parse_array(code, "constant OUTPUTS : table_t := (")
+    stages = len(thresholds).bit_length() - 1
+
+    def search(x: int) -> int:
+        index = 0
+        for k in range(stages):
+            candidate = index | (1 << (stages - 1 - k))
+            if thresholds[candidate - 1] < x:
+                index = candidate
+        return outputs[index]
+
+    for x in range(-128, 128):
+        step = min([t for t in inputs if t >= x], default=inputs[-1])
+        assert square_clamped([step]) == [search(x)]
+
+
+def test_rejects_unknown_strategy() -> None:
+    with pytest.raises(ValueError):
+        create_design(8, [1, 2], strategy="bogus")
+
+
+def test_tree_is_combinational() -> None:
+    code = generate_code(create_design(16, list(range(-50, 50))))
+    assert "search : process (x)" in code
+    assert not any("rising_edge" in line for line in code)
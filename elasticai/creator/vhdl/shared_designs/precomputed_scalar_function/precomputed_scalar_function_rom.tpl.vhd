@@ -0,0 +1,25 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;               -- for type conversions
+
+entity $name is
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+        x      : in std_logic_vector($data_width-1 downto 0);
+        y      : out std_logic_vector($data_width-1 downto 0)
+    );
+end $name;
+
+architecture rtl of $name is
+    type rom_t is array (0 to 2**$data_width-1) of signed($data_width-1 downto 0);
+    -- one entry per input value, starting with the most negative one
+    constant ROM : rom_t := (
+        $rom_content
+    );
+    signal address : unsigned($data_width-1 downto 0);
+begin
+    -- flipping the sign bit maps -2**(N-1)..2**(N-1)-1 to 0..2**N-1
+    address <= unsigned(x) xor to_unsigned(2**($data_width-1), $data_width);
+    y <= std_logic_vector(ROM(to_integer(address)));
+end rtl;
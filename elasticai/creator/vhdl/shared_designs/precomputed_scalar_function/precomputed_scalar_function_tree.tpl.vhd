@@ -0,0 +1,44 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;               -- for type conversions
+
+entity $name is
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+        x      : in std_logic_vector($data_width-1 downto 0);
+        y      : out std_logic_vector($data_width-1 downto 0)
+    );
+end $name;
+
+-- Binary search for the number of thresholds smaller than x. Step k
+-- decides bit STAGES-1-k of that number, so y depends on x through STAGES
+-- comparators in a row instead of one per threshold.
+architecture rtl of $name is
+    constant STAGES : integer := $stages;
+    type table_t is array (0 to 2**STAGES-1) of signed($data_width-1 downto 0);
+    constant THRESHOLDS : table_t := (
+        $thresholds
+    );
+    constant OUTPUTS : table_t := (
+        $outputs
+    );
+    signal signed_y : signed($data_width-1 downto 0) := (others => '0');
+begin
+    y <= std_logic_vector(signed_y);
+
+    search : process (x)
+        variable index : unsigned(STAGES-1 downto 0);
+        variable candidate : unsigned(STAGES-1 downto 0);
+    begin
+        index := (others => '0');
+        for k in 0 to STAGES-1 loop
+            candidate := index;
+            candidate(STAGES-1-k) := '1';
+            if THRESHOLDS(to_integer(candidate) - 1) < signed(x) then
+                index := candidate;
+            end if;
+        end loop;
+        signed_y <= OUTPUTS(to_integer(index));
+    end process;
+end rtl;